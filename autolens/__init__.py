@@ -25,7 +25,6 @@ from autoarray import VectorField2DIrregular
 from autoarray.structures.kernel import Kernel2D
 from autoarray.structures.visibilities import Visibilities, VisibilitiesNoiseMap
 from autogalaxy import util
-from autogalaxy.dataset.imaging import SettingsMaskedImaging
 from autogalaxy.dataset.interferometer import SettingsMaskedInterferometer
 from autogalaxy.galaxy.fit_galaxy import FitGalaxy
 from autogalaxy.galaxy.galaxy import Galaxy, HyperGalaxy, Redshift
@@ -44,11 +43,12 @@ from autogalaxy.profiles import (
 )
 from autogalaxy import convert
 
+from .dataset.imaging import MaskedImaging, SettingsMaskedImaging, SimulatorImaging
 from . import aggregator as agg
 from . import plot
-from .dataset.imaging import MaskedImaging, SimulatorImaging
 from .dataset.interferometer import MaskedInterferometer, SimulatorInterferometer
 from .fit.fit import FitImaging, FitInterferometer
+from .fit.preloads import Preloads
 from .fit.fit_point_source import (
     FitPositionsSourceMaxSeparation,
     FitPositionsImage,
@@ -56,7 +56,12 @@ from .fit.fit_point_source import (
 )
 from .lens.settings import SettingsLens
 from .lens.ray_tracing import Tracer
-from .lens.positions_solver import PositionsSolver
+from .lens.positions_solver import (
+    GradientSolver,
+    PositionsSolver,
+    TriangleSolver,
+    WarmStartSolver,
+)
 from .pipeline.setup import (
     SetupPipeline,
     SetupHyper,
@@ -86,4 +91,4 @@ from autoconf import conf
 
 conf.instance.register(__file__)
 
-__version__ = '1.12.1'
+__version__ = '1.12.1'
@@ -1,15 +1,110 @@
 import copy
 
+from autoconf import conf
 from autoarray.dataset import imaging
 from autoarray.structures import grids
 from autoarray.structures import kernel
 from autogalaxy.dataset import imaging as im
+from autolens import exc
 from autolens.lens import ray_tracing
 
 
+class SettingsMaskedImaging(im.SettingsMaskedImaging):
+    def __init__(
+        self,
+        grid_class=grids.Grid2D,
+        grid_inversion_class=grids.Grid2D,
+        sub_size=2,
+        sub_size_inversion=2,
+        fractional_accuracy=0.9999,
+        sub_steps=None,
+        pixel_scales_interp=None,
+        bin_up_factor=None,
+        signal_to_noise_limit=None,
+        psf_shape_2d=None,
+        renormalize_psf=True,
+        precision="float64",
+    ):
+        """
+        The settings of a `MaskedImaging` object, which extend the autogalaxy settings with the floating point
+        precision of its grids (see `autogalaxy.dataset.imaging.SettingsMaskedImaging` for a description of every
+        other setting).
+
+        Parameters
+        ----------
+        precision : str
+            The floating point precision, "float64" or "float32", in which the grid and blurring grid of the masked
+            imaging and the traced grids and images of the `Tracer` that fits it are stored. The profiles still
+            compute in double precision (see `Tracer`). The image, noise-map and grid used by an `Inversion` are
+            always double precision.
+        """
+
+        super().__init__(
+            grid_class=grid_class,
+            grid_inversion_class=grid_inversion_class,
+            sub_size=sub_size,
+            sub_size_inversion=sub_size_inversion,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps,
+            pixel_scales_interp=pixel_scales_interp,
+            bin_up_factor=bin_up_factor,
+            signal_to_noise_limit=signal_to_noise_limit,
+            psf_shape_2d=psf_shape_2d,
+            renormalize_psf=renormalize_psf,
+        )
+
+        if precision not in ray_tracing.precisions:
+            raise exc.SettingsException(
+                f"The precision of SettingsMaskedImaging must be one of {ray_tracing.precisions}, not {precision}"
+            )
+
+        self.precision = precision
+
+    @property
+    def tag_no_inversion(self):
+        return (
+            f"{conf.instance['notation']['settings_tags']['imaging']['imaging']}"
+            f"[{self.grid_tag_no_inversion}"
+            f"{self.signal_to_noise_limit_tag}"
+            f"{self.bin_up_factor_tag}"
+            f"{self.psf_shape_tag}"
+            f"{self.precision_tag}]"
+        )
+
+    @property
+    def tag_with_inversion(self):
+        return (
+            f"{conf.instance['notation']['settings_tags']['imaging']['imaging']}"
+            f"[{self.grid_tag_with_inversion}"
+            f"{self.signal_to_noise_limit_tag}"
+            f"{self.bin_up_factor_tag}"
+            f"{self.psf_shape_tag}"
+            f"{self.precision_tag}]"
+        )
+
+    @property
+    def precision_tag(self):
+        """Generate a precision tag, to customize phase names based on the floating point precision of the grids, \
+        such that double and single precision fits of the same model output to different paths.
+
+        This changes the phase settings folder as follows:
+
+        precision = float64 -> settings
+        precision = float32 -> settings__prec_float32
+        """
+        if self.precision == "float64":
+            return ""
+        return (
+            "__"
+            + conf.instance["notation"]["settings_tags"]["imaging"]["precision"]
+            + "_"
+            + self.precision
+        )
+
+
 class MaskedImaging(imaging.MaskedImaging):
 
-    def __init__(self, imaging, mask, settings=im.SettingsMaskedImaging()):
+    def __init__(self, imaging, mask, settings=SettingsMaskedImaging()):
         """
         The lens dataset is the collection of data (image, noise-map, PSF), a mask, grid, convolver \
         and other utilities that are used for modeling and fitting an image of a strong lens.
@@ -44,6 +139,15 @@ class MaskedImaging(imaging.MaskedImaging):
             imaging=imaging, mask=mask, settings=settings
         )
 
+        self.precision = getattr(settings, "precision", "float64")
+
+        if self.precision != "float64":
+
+            self.grid = self.grid.astype(self.precision)
+
+            if self.psf is not None:
+                self.blurring_grid = self.blurring_grid.astype(self.precision)
+
 
 class SimulatorImaging(imaging.SimulatorImaging):
     def __init__(
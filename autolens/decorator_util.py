@@ -11,6 +11,13 @@ If on laptop:
 If on super computer:
 
 @numba.jit(nopython=True, cache=False, parallel=True)
+
+The number of threads used to compute the stochastic resamples of a fit concurrently (see
+`dataset.analysis.Analysis.stochastic_map`) is also set in the numba section of the general config. Threads only run
+concurrently while the GIL is released, which the linear algebra of an inversion and kernels compiled by this module
+with `nogil = True` set in the numba section of the general config do. The deflection angles of mass profiles are not
+computed on threads, because autogalaxy's profiles are compiled by autoarray's decorator, which does not release the
+GIL.
 """
 
 try:
@@ -22,9 +29,21 @@ except Exception:
     cache = True
     parallel = False
 
+try:
+    nogil = conf.instance["general"]["numba"]["nogil"]
+except Exception:
+    nogil = False
+
+try:
+    threads = conf.instance["general"]["numba"]["threads"]
+except Exception:
+    threads = 1
+
 
-def jit(nopython=nopython, cache=cache, parallel=parallel):
+def jit(nopython=nopython, cache=cache, parallel=parallel, nogil=nogil):
     def wrapper(func):
-        return numba.jit(func, nopython=nopython, cache=cache, parallel=parallel)
+        return numba.jit(
+            func, nopython=nopython, cache=cache, parallel=parallel, nogil=nogil
+        )
 
     return wrapper
@@ -3,7 +3,10 @@ import numpy as np
 from autoconf import conf
 from autoarray.fit import fit as aa_fit
 from autoarray.inversion import pixelizations as pix, inversions as inv
+from autoarray.util import fit_util
 from autogalaxy.galaxy import galaxy as g
+from autolens import decorator_util
+from autolens.fit import preloads as pload
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -16,6 +19,7 @@ class FitImaging(aa_fit.FitImaging):
         use_hyper_scaling=True,
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
+        preloads=None,
     ):
         """ An  lens fitter, which contains the tracer's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
@@ -26,41 +30,37 @@ class FitImaging(aa_fit.FitImaging):
             The tracer, which describes the ray-tracing and strong lens configuration.
         scaled_array_2d_from_array_1d : func
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
+        preloads : Preloads
+            The products of the fit which are fixed for every model-fit of a phase and therefore not recomputed.
         """
 
         self.tracer = tracer
 
-        if use_hyper_scaling:
-
-            image = hyper_image_from_image_and_hyper_image_sky(
-                image=masked_imaging.image, hyper_image_sky=hyper_image_sky
-            )
-
-            noise_map = hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
-                noise_map=masked_imaging.noise_map,
-                tracer=tracer,
-                hyper_background_noise=hyper_background_noise,
-            )
+        if preloads is None:
+            preloads = pload.Preloads()
 
-            if (
-                tracer.has_hyper_galaxy
-                or hyper_image_sky is not None
-                or hyper_background_noise is not None
-            ):
+        preloads.preload_tracer(tracer=tracer)
 
-                masked_imaging = masked_imaging.modify_image_and_noise_map(
-                    image=image, noise_map=noise_map
-                )
+        image, noise_map = image_and_noise_map_from(
+            masked_imaging=masked_imaging,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+            use_hyper_scaling=use_hyper_scaling,
+        )
 
-        else:
+        if use_hyper_scaling and (
+            tracer.has_hyper_galaxy
+            or hyper_image_sky is not None
+            or hyper_background_noise is not None
+        ):
 
-            image = masked_imaging.image
-            noise_map = masked_imaging.noise_map
+            masked_imaging = masked_imaging.modify_image_and_noise_map(
+                image=image, noise_map=noise_map
+            )
 
-        self.blurred_image = tracer.blurred_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
+        self.blurred_image = blurred_image_from(
+            masked_imaging=masked_imaging, tracer=tracer, preloads=preloads
         )
 
         self.profile_subtracted_image = image - self.blurred_image
@@ -79,6 +79,7 @@ class FitImaging(aa_fit.FitImaging):
                 convolver=masked_imaging.convolver,
                 settings_pixelization=settings_pixelization,
                 settings_inversion=settings_inversion,
+                preloads=preloads,
             )
 
             model_image = self.blurred_image + inversion.mapped_reconstructed_image
@@ -189,6 +190,7 @@ class FitInterferometer(aa_fit.FitInterferometer):
         use_hyper_scaling=True,
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
+        preloads=None,
     ):
         """ An  lens fitter, which contains the tracer's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
@@ -199,6 +201,8 @@ class FitInterferometer(aa_fit.FitInterferometer):
             The tracer, which describes the ray-tracing and strong lens configuration.
         scaled_array_2d_from_array_1d : func
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
+        preloads : Preloads
+            The products of the fit which are fixed for every model-fit of a phase and therefore not recomputed.
         """
 
         if use_hyper_scaling:
@@ -222,10 +226,21 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         self.tracer = tracer
 
-        self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
-            grid=masked_interferometer.grid,
-            transformer=masked_interferometer.transformer,
-        )
+        if preloads is None:
+            preloads = pload.Preloads()
+
+        preloads.preload_tracer(tracer=tracer)
+
+        if preloads.profile_visibilities is None:
+
+            self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
+                grid=masked_interferometer.grid,
+                transformer=masked_interferometer.transformer,
+            )
+
+        else:
+
+            self.profile_visibilities = preloads.profile_visibilities
 
         self.profile_subtracted_visibilities = (
             masked_interferometer.visibilities - self.profile_visibilities
@@ -245,6 +260,7 @@ class FitInterferometer(aa_fit.FitInterferometer):
                 transformer=masked_interferometer.transformer,
                 settings_pixelization=settings_pixelization,
                 settings_inversion=settings_inversion,
+                preloads=preloads,
             )
 
             model_visibilities = (
@@ -333,6 +349,170 @@ class FitInterferometer(aa_fit.FitInterferometer):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
+def figure_of_merit_from(
+    masked_imaging,
+    tracer,
+    hyper_image_sky=None,
+    hyper_background_noise=None,
+    use_hyper_scaling=True,
+    settings_pixelization=pix.SettingsPixelization(),
+    settings_inversion=inv.SettingsInversion(),
+    preloads=None,
+):
+    """
+    Returns the figure of merit of a tracer's fit to a masked imaging dataset, which is the same value as the
+    `figure_of_merit` of the `FitImaging` of the same inputs.
+
+    A `FitImaging` computes its residual-map, chi-squared-map and other maps as structured arrays, which a
+    non-linear search does not use. This function instead computes the model image and fits it to the data in one
+    pass over the slim arrays (see `log_likelihood_terms_from`), such that no per-pixel maps are allocated. It
+    should therefore be used to compute the likelihood in a search, with `FitImaging` used for visualization and
+    results.
+
+    Parameters
+    -----------
+    masked_imaging : MaskedImaging
+        The masked imaging dataset which is fitted.
+    tracer : ray_tracing.Tracer
+        The tracer, which describes the ray-tracing and strong lens configuration.
+    preloads : Preloads
+        The products of the fit which are fixed for every model-fit of a phase and therefore not recomputed.
+    """
+
+    if preloads is None:
+        preloads = pload.Preloads()
+
+    preloads.preload_tracer(tracer=tracer)
+
+    image, noise_map = image_and_noise_map_from(
+        masked_imaging=masked_imaging,
+        tracer=tracer,
+        hyper_image_sky=hyper_image_sky,
+        hyper_background_noise=hyper_background_noise,
+        use_hyper_scaling=use_hyper_scaling,
+    )
+
+    blurred_image = blurred_image_from(
+        masked_imaging=masked_imaging, tracer=tracer, preloads=preloads
+    )
+
+    if not tracer.has_pixelization:
+
+        chi_squared, noise_normalization = log_likelihood_terms_from(
+            data=np.asarray(image),
+            model_data=np.asarray(blurred_image),
+            noise_map=np.asarray(noise_map),
+        )
+
+        return fit_util.log_likelihood_from(
+            chi_squared=chi_squared, noise_normalization=noise_normalization
+        )
+
+    inversion = tracer.inversion_imaging_from_grid_and_data(
+        grid=masked_imaging.grid_inversion,
+        image=image - blurred_image,
+        noise_map=noise_map,
+        convolver=masked_imaging.convolver,
+        settings_pixelization=settings_pixelization,
+        settings_inversion=settings_inversion,
+        preloads=preloads,
+    )
+
+    chi_squared, noise_normalization = log_likelihood_terms_from(
+        data=np.asarray(image),
+        model_data=np.asarray(blurred_image)
+        + np.asarray(inversion.mapped_reconstructed_image),
+        noise_map=np.asarray(noise_map),
+    )
+
+    return fit_util.log_evidence_from(
+        chi_squared=chi_squared,
+        regularization_term=inversion.regularization_term,
+        log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+        log_regularization_term=inversion.log_det_regularization_matrix_term,
+        noise_normalization=noise_normalization,
+    )
+
+
+@decorator_util.jit()
+def log_likelihood_terms_from(data, model_data, noise_map):
+    """
+    Returns the chi-squared and noise normalization of a model's fit to slim data, computing the residual,
+    chi-squared and noise term of every data point in one loop without allocating the maps of these quantities.
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The slim data which is fitted.
+    model_data : np.ndarray
+        The slim model data which fits the data.
+    noise_map : np.ndarray
+        The slim noise-map of the data.
+    """
+
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for index in range(data.shape[0]):
+
+        residual = data[index] - model_data[index]
+
+        chi_squared += (residual / noise_map[index]) ** 2.0
+        noise_normalization += np.log(2.0 * np.pi * noise_map[index] ** 2.0)
+
+    return chi_squared, noise_normalization
+
+
+def image_and_noise_map_from(
+    masked_imaging,
+    tracer,
+    hyper_image_sky=None,
+    hyper_background_noise=None,
+    use_hyper_scaling=True,
+):
+    """
+    Returns the image and noise-map a tracer's fit to a masked imaging dataset uses, which are scaled by the hyper
+    image sky, hyper background noise and hyper galaxies of the fit if `use_hyper_scaling` is `True`. This is shared
+    by a `FitImaging` and `figure_of_merit_from`.
+
+    Parameters
+    -----------
+    masked_imaging : MaskedImaging
+        The masked imaging dataset which is fitted.
+    tracer : ray_tracing.Tracer
+        The tracer, whose hyper galaxies scale the noise-map.
+    """
+    if not use_hyper_scaling:
+        return masked_imaging.image, masked_imaging.noise_map
+
+    image = hyper_image_from_image_and_hyper_image_sky(
+        image=masked_imaging.image, hyper_image_sky=hyper_image_sky
+    )
+
+    noise_map = hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
+        noise_map=masked_imaging.noise_map,
+        tracer=tracer,
+        hyper_background_noise=hyper_background_noise,
+    )
+
+    return image, noise_map
+
+
+def blurred_image_from(masked_imaging, tracer, preloads=None):
+    """
+    Returns the blurred image of a tracer's light profiles on a masked imaging dataset, or the preloaded blurred image
+    if it is fixed for every fit of a phase (see `Preloads`).
+    """
+    if preloads is None or preloads.blurred_image is None:
+        return tracer.blurred_image_from_grid_and_convolver(
+            grid=masked_imaging.grid,
+            convolver=masked_imaging.convolver,
+            blurring_grid=masked_imaging.blurring_grid,
+        )
+
+    return preloads.blurred_image
+
+
 def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
 
     if hyper_image_sky is not None:
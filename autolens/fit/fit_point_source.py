@@ -1,7 +1,10 @@
 from autoarray.structures import arrays, grids
 from autoarray.util import fit_util
 from autoarray.fit.fit import FitData
+from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy.profiles import point_sources as ps
+from autolens import decorator_util
+from autolens.lens import positions_solver as pos
 import numpy as np
 
 
@@ -88,6 +91,10 @@ class FitPositionsImage(FitData):
         """A lens position fitter, which takes a set of positions (e.g. from a plane in the tracer) and computes \
         their maximum separation, such that points which tracer closer to one another have a higher log_likelihood.
 
+        The model positions found by the positions solver are stored as a `PositionsSolverResult` paired to the
+        positions, which includes the magnifications the solver computed such that a `FitFluxes` can use them
+        without computing them again.
+
         Parameters
         -----------
         positions : grids.Grid2DIrregular
@@ -102,18 +109,14 @@ class FitPositionsImage(FitData):
             cls=ps.PointSource, name="centre"
         )[0]
 
-        model_positions = positions_solver.solve(
+        self.positions_solver_result = positions_solver.result_from(
             lensing_obj=tracer, source_plane_coordinate=source_plane_coordinate
-        )
-
-        model_positions = model_positions.grid_of_closest_from_grid_pair(
-            grid_pair=positions
-        )
+        ).paired_to(grid_pair=positions)
 
         super().__init__(
             data=positions,
             noise_map=noise_map,
-            model_data=model_positions,
+            model_data=self.positions_solver_result.positions,
             mask=None,
             inversion=None,
         )
@@ -135,12 +138,35 @@ class FitPositionsImage(FitData):
 
 
 class FitFluxes(FitData):
-    def __init__(self, fluxes, noise_map, positions, tracer):
+    def __init__(
+        self, fluxes, noise_map, positions, tracer, positions_solver_result=None
+    ):
+        """
+        Fit the fluxes of a point source, whose model fluxes are the flux of the point source multiplied by the
+        magnification of every position.
+
+        The magnifications are computed at the input positions, unless the `PositionsSolverResult` of a
+        `FitPositionsImage` is input, in which case the magnifications of its model positions (which are paired to the
+        positions) computed by the positions solver are used.
 
+        Parameters
+        -----------
+        fluxes : arrays.ValuesIrregular
+            The fluxes of the point source's images which are fitted.
+        positions : grids.Grid2DIrregular
+            The (y,x) arc-second coordinates of the images whose fluxes are fitted.
+        positions_solver_result : PositionsSolverResult or None
+            The model positions paired to the positions, whose magnifications are used instead of computing the
+            magnifications of the positions.
+        """
         self.positions = positions
-        self.magnifications = abs(
-            tracer.magnification_via_hessian_from_grid(grid=positions)
-        )
+
+        if positions_solver_result is None:
+            self.magnifications = abs(
+                tracer.magnification_via_hessian_from_grid(grid=positions)
+            )
+        else:
+            self.magnifications = positions_solver_result.magnifications
 
         flux = tracer.extract_attribute(cls=ps.PointSourceFlux, name="flux")[0]
 
@@ -163,3 +189,507 @@ class FitFluxes(FitData):
     @property
     def model_fluxes(self):
         return self.model_data
+
+
+"""
+The mass profiles whose deflection angles are computed by `deflections_via_mass_profiles_jit`, which are identified
+by an integer in the compiled code.
+"""
+mass_profile_type_dict = {mp.SphericalIsothermal: 0, mp.EllipticalIsothermal: 1}
+
+
+def mass_profile_parameters_from(mass_profile):
+    """
+    Returns the parameters of a mass profile used by `deflections_via_mass_profiles_jit`, as a list of 5 floats
+    whose first two entries are the (y,x) centre of the profile.
+    """
+    centre = mass_profile.centre
+
+    if type(mass_profile) is mp.SphericalIsothermal:
+        return [
+            centre[0],
+            centre[1],
+            2.0 * mass_profile.einstein_radius_rescaled,
+            0.0,
+            0.0,
+        ]
+
+    return [
+        centre[0],
+        centre[1],
+        mass_profile.axis_ratio,
+        np.radians(mass_profile.phi),
+        mass_profile.einstein_radius_rescaled,
+    ]
+
+
+def mass_profile_arrays_from(tracer):
+    """
+    Returns the types and parameters of the mass profiles of a tracer as NumPy arrays that are input into
+    `deflections_via_mass_profiles_jit`, or `None` if the tracer's deflection angles cannot be computed by it.
+
+    This requires that every mass profile is one of the profiles in `mass_profile_type_dict` (subclasses are not
+    supported, as they may compute their deflection angles differently), that the tracer computes its deflection
+    angles in float64 and that all mass profiles are in one plane which is not the final plane. The deflection angles
+    of the tracer are then the sum of the deflection angles of the mass profiles.
+
+    Parameters
+    ----------
+    tracer : ray_tracing.Tracer
+        The tracer whose mass profiles are converted to arrays.
+    """
+    if getattr(tracer, "precision", "float64") != "float64":
+        return None
+
+    plane_indexes_with_mass_profile = [
+        plane_index
+        for (plane_index, plane) in enumerate(tracer.planes)
+        if plane.has_mass_profile
+    ]
+
+    if len(plane_indexes_with_mass_profile) != 1:
+        return None
+
+    if plane_indexes_with_mass_profile[0] == len(tracer.planes) - 1:
+        return None
+
+    mass_profiles = tracer.planes[plane_indexes_with_mass_profile[0]].mass_profiles
+
+    if any(
+        type(mass_profile) not in mass_profile_type_dict
+        for mass_profile in mass_profiles
+    ):
+        return None
+
+    mass_profile_types = np.array(
+        [mass_profile_type_dict[type(mass_profile)] for mass_profile in mass_profiles],
+        dtype="int",
+    )
+
+    mass_profile_parameters = np.array(
+        [mass_profile_parameters_from(mass_profile) for mass_profile in mass_profiles],
+        dtype="float64",
+    ).reshape(-1, 5)
+
+    return mass_profile_types, mass_profile_parameters
+
+
+def log_likelihood_via_jit_from(
+    positions,
+    noise_map,
+    tracer,
+    positions_solver,
+    fluxes=None,
+    fluxes_noise_map=None,
+):
+    """
+    Returns the log likelihood of a point-source fit, which is the log likelihood of a `FitPositionsImage` plus that of
+    a `FitFluxes` if fluxes are input, computed end-to-end in compiled code.
+
+    The `FitPositionsImage` and `FitFluxes` objects call the `GradientSolver` and the tracer's deflection angles many
+    times per fit, each call converting between NumPy arrays and autoarray structures. For tracers whose mass profiles
+    have compiled deflection angles (see `mass_profile_arrays_from`) the solve (peak finding, Newton-Raphson
+    refinement, removal of duplicates and demagnified images), the pairing of the model positions to the positions,
+    their magnifications and the chi-squareds are instead computed by `point_source_log_likelihood_jit` in one call.
+
+    `None` is returned if the compiled path does not support the tracer or solver, or if the compiled solve finds no
+    model positions, in which case the fit must be performed using `FitPositionsImage` and `FitFluxes`, which handle
+    every other case.
+
+    Parameters
+    ----------
+    positions : grids.Grid2DIrregular
+        The (y,x) arc-second coordinates of the observed positions.
+    noise_map : arrays.ValuesIrregular
+        The noise-map of the positions.
+    tracer : ray_tracing.Tracer
+        The tracer whose point source's model positions are fitted to the positions.
+    positions_solver : pos.GradientSolver
+        The solver which finds the model positions, which must be a `GradientSolver` without a critical curve grid or
+        distance cuts.
+    fluxes : arrays.ValuesIrregular or None
+        The observed fluxes of the positions, which are fitted if input.
+    fluxes_noise_map : arrays.ValuesIrregular or None
+        The noise-map of the fluxes.
+    """
+    if type(positions_solver) is not pos.GradientSolver:
+        return None
+
+    if (
+        positions_solver.critical_curve_upscale_factor is not None
+        or positions_solver.distance_from_source_centre is not None
+        or positions_solver.distance_from_mass_profile_centre is not None
+    ):
+        return None
+
+    mass_profile_arrays = mass_profile_arrays_from(tracer=tracer)
+
+    if mass_profile_arrays is None:
+        return None
+
+    mass_profile_types, mass_profile_parameters = mass_profile_arrays
+
+    source_plane_coordinate = tracer.extract_attribute(
+        cls=ps.PointSource, name="centre"
+    )[0]
+
+    if fluxes is None:
+        fluxes = np.zeros(shape=0)
+        fluxes_noise_map = np.zeros(shape=0)
+        flux = 0.0
+    else:
+        flux = tracer.extract_attribute(cls=ps.PointSourceFlux, name="flux")[0]
+
+    neighbors, has_neighbors = pos.grid_square_neighbors_1d_cached_from(
+        shape_slim=positions_solver.grid.shape[0]
+    )
+
+    log_likelihood, is_solved = point_source_log_likelihood_jit(
+        grid=np.asarray(positions_solver.grid, dtype="float64"),
+        pixel_scale=float(positions_solver.grid.pixel_scale),
+        neighbors=neighbors,
+        has_neighbors=has_neighbors,
+        source_plane_coordinate=np.asarray(source_plane_coordinate, dtype="float64"),
+        mass_profile_types=mass_profile_types,
+        mass_profile_parameters=mass_profile_parameters,
+        source_plane_tolerance=float(positions_solver.source_plane_tolerance),
+        max_iterations=int(positions_solver.max_iterations),
+        buffer=float(positions_solver.buffer),
+        magnification_threshold=float(positions_solver.magnification_threshold),
+        positions=np.asarray(positions, dtype="float64").reshape(-1, 2),
+        noise_map=np.asarray(noise_map, dtype="float64").reshape(-1),
+        fluxes=np.asarray(fluxes, dtype="float64").reshape(-1),
+        fluxes_noise_map=np.asarray(fluxes_noise_map, dtype="float64").reshape(-1),
+        flux=float(flux),
+    )
+
+    if not is_solved:
+        return None
+
+    return log_likelihood
+
+
+@decorator_util.jit()
+def deflections_via_mass_profiles_jit(
+    grid, mass_profile_types, mass_profile_parameters
+):
+    """
+    Returns the summed deflection angles of mass profiles on a grid of (y,x) coordinates, where every mass profile
+    is defined by its type and parameters (see `mass_profile_arrays_from`):
+
+     - 0 `SphericalIsothermal`: parameters are (centre_y, centre_x, 2 * einstein_radius_rescaled).
+     - 1 `EllipticalIsothermal`: parameters are (centre_y, centre_x, axis_ratio, phi in radians,
+       einstein_radius_rescaled).
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates of shape [total_coordinates, 2] the deflection angles are computed on.
+    mass_profile_types : np.ndarray
+        The integer type of every mass profile.
+    mass_profile_parameters : np.ndarray
+        The parameters of every mass profile, of shape [total_mass_profiles, 5].
+    """
+    deflections = np.zeros(shape=grid.shape)
+
+    for profile_index in range(mass_profile_types.shape[0]):
+
+        profile_type = mass_profile_types[profile_index]
+        parameters = mass_profile_parameters[profile_index]
+
+        for grid_index in range(grid.shape[0]):
+
+            y = grid[grid_index, 0] - parameters[0]
+            x = grid[grid_index, 1] - parameters[1]
+
+            if profile_type == 0:
+
+                radius = np.sqrt(y ** 2 + x ** 2)
+
+                deflections[grid_index, 0] += parameters[2] * y / radius
+                deflections[grid_index, 1] += parameters[2] * x / radius
+
+            else:
+
+                axis_ratio = parameters[2]
+                cos_phi = np.cos(parameters[3])
+                sin_phi = np.sin(parameters[3])
+
+                y_profile = y * cos_phi - x * sin_phi
+                x_profile = x * cos_phi + y * sin_phi
+
+                factor = (
+                    2.0 * parameters[4] * axis_ratio / np.sqrt(1.0 - axis_ratio ** 2)
+                )
+
+                psi = np.sqrt(axis_ratio ** 2 * x_profile ** 2 + y_profile ** 2)
+
+                deflection_y = factor * np.arctanh(
+                    np.sqrt(1.0 - axis_ratio ** 2) * y_profile / psi
+                )
+                deflection_x = factor * np.arctan(
+                    np.sqrt(1.0 - axis_ratio ** 2) * x_profile / psi
+                )
+
+                deflections[grid_index, 0] += (
+                    deflection_x * sin_phi + deflection_y * cos_phi
+                )
+                deflections[grid_index, 1] += (
+                    deflection_x * cos_phi - deflection_y * sin_phi
+                )
+
+    return deflections
+
+
+@decorator_util.jit()
+def magnifications_via_mass_profiles_jit(
+    grid, mass_profile_types, mass_profile_parameters, buffer
+):
+    """
+    Returns the magnifications of mass profiles on a grid of (y,x) coordinates, computed from the hessian of their
+    deflection angles via finite differences of spacing `buffer` (as `LensingObject.magnification_via_hessian_from_grid`).
+    """
+    shifted_grid = grid.copy()
+
+    shifted_grid[:, 0] = grid[:, 0] + buffer
+    deflections_up = deflections_via_mass_profiles_jit(
+        shifted_grid, mass_profile_types, mass_profile_parameters
+    )
+    shifted_grid[:, 0] = grid[:, 0] - buffer
+    deflections_down = deflections_via_mass_profiles_jit(
+        shifted_grid, mass_profile_types, mass_profile_parameters
+    )
+
+    shifted_grid[:, 0] = grid[:, 0]
+
+    shifted_grid[:, 1] = grid[:, 1] + buffer
+    deflections_right = deflections_via_mass_profiles_jit(
+        shifted_grid, mass_profile_types, mass_profile_parameters
+    )
+    shifted_grid[:, 1] = grid[:, 1] - buffer
+    deflections_left = deflections_via_mass_profiles_jit(
+        shifted_grid, mass_profile_types, mass_profile_parameters
+    )
+
+    hessian_yy = 0.5 * (deflections_up[:, 0] - deflections_down[:, 0]) / buffer
+    hessian_xy = 0.5 * (deflections_up[:, 1] - deflections_down[:, 1]) / buffer
+    hessian_xx = 0.5 * (deflections_right[:, 1] - deflections_left[:, 1]) / buffer
+    hessian_yx = 0.5 * (deflections_right[:, 0] - deflections_left[:, 0]) / buffer
+
+    return 1.0 / ((1.0 - hessian_xx) * (1.0 - hessian_yy) - hessian_xy * hessian_yx)
+
+
+@decorator_util.jit()
+def newton_raphson_of_coordinate_jit(
+    coordinate,
+    source_plane_coordinate,
+    mass_profile_types,
+    mass_profile_parameters,
+    source_plane_tolerance,
+    max_iterations,
+    buffer,
+    max_step,
+):
+    """
+    Solve the lens equation using the Newton-Raphson method starting from one (y,x) coordinate, returning the final
+    coordinate and whether it converged. Every iteration is identical to that of `GradientSolver.newton_raphson_from`
+    and `newton_steps_from`, which solve for many coordinates at once.
+    """
+    solution = coordinate.copy().reshape(1, 2)
+
+    for iteration in range(max_iterations + 1):
+
+        deflections = deflections_via_mass_profiles_jit(
+            solution, mass_profile_types, mass_profile_parameters
+        )
+
+        residual_y = source_plane_coordinate[0] - solution[0, 0] + deflections[0, 0]
+        residual_x = source_plane_coordinate[1] - solution[0, 1] + deflections[0, 1]
+
+        if np.sqrt(residual_y ** 2 + residual_x ** 2) < source_plane_tolerance:
+            return solution[0], True
+
+        if iteration == max_iterations:
+            break
+
+        shifted = solution.copy()
+
+        shifted[0, 0] = solution[0, 0] + buffer
+        deflections_up = deflections_via_mass_profiles_jit(
+            shifted, mass_profile_types, mass_profile_parameters
+        )
+        shifted[0, 0] = solution[0, 0] - buffer
+        deflections_down = deflections_via_mass_profiles_jit(
+            shifted, mass_profile_types, mass_profile_parameters
+        )
+        shifted[0, 0] = solution[0, 0]
+        shifted[0, 1] = solution[0, 1] + buffer
+        deflections_right = deflections_via_mass_profiles_jit(
+            shifted, mass_profile_types, mass_profile_parameters
+        )
+        shifted[0, 1] = solution[0, 1] - buffer
+        deflections_left = deflections_via_mass_profiles_jit(
+            shifted, mass_profile_types, mass_profile_parameters
+        )
+
+        jacobian_yy = 1.0 - 0.5 * (deflections_up[0, 0] - deflections_down[0, 0]) / buffer
+        jacobian_xy = -0.5 * (deflections_up[0, 1] - deflections_down[0, 1]) / buffer
+        jacobian_xx = 1.0 - 0.5 * (deflections_right[0, 1] - deflections_left[0, 1]) / buffer
+        jacobian_yx = -0.5 * (deflections_right[0, 0] - deflections_left[0, 0]) / buffer
+
+        determinant = jacobian_yy * jacobian_xx - jacobian_yx * jacobian_xy
+
+        step_y = (jacobian_xx * residual_y - jacobian_yx * residual_x) / determinant
+        step_x = (jacobian_yy * residual_x - jacobian_xy * residual_y) / determinant
+
+        step_size = np.sqrt(step_y ** 2 + step_x ** 2)
+
+        if step_size > max_step:
+            step_y *= max_step / step_size
+            step_x *= max_step / step_size
+
+        if not np.isfinite(step_y):
+            step_y = 0.0
+
+        if not np.isfinite(step_x):
+            step_x = 0.0
+
+        solution[0, 0] += step_y
+        solution[0, 1] += step_x
+
+    return solution[0], False
+
+
+@decorator_util.jit()
+def point_source_log_likelihood_jit(
+    grid,
+    pixel_scale,
+    neighbors,
+    has_neighbors,
+    source_plane_coordinate,
+    mass_profile_types,
+    mass_profile_parameters,
+    source_plane_tolerance,
+    max_iterations,
+    buffer,
+    magnification_threshold,
+    positions,
+    noise_map,
+    fluxes,
+    fluxes_noise_map,
+    flux,
+):
+    """
+    Returns the log likelihood of a point-source fit computed in compiled code (see `log_likelihood_via_jit_from`)
+    and whether any model positions were found, performing the same calculation as `GradientSolver.result_from`,
+    `FitPositionsImage` and `FitFluxes`:
+
+     1) Trace the initial grid and find its peak pixels.
+     2) Remove peaks whose magnification (computed with a finite-difference spacing of the grid's pixel scale) is not
+        above the magnification threshold.
+     3) Refine every peak with the Newton-Raphson method and keep those which converge.
+     4) Remove duplicate solutions and solutions whose magnification (computed with a finite-difference spacing of
+        `buffer`) is not above the magnification threshold.
+     5) Pair every observed position to its closest model position, and compute the chi-squared and noise
+        normalization of the positions and, if there are fluxes, of the fluxes whose model values are the flux
+        of the point source multiplied by the absolute magnifications of the paired model positions.
+    """
+    deflections = deflections_via_mass_profiles_jit(
+        grid, mass_profile_types, mass_profile_parameters
+    )
+
+    distances = np.sqrt(
+        (grid[:, 0] - deflections[:, 0] - source_plane_coordinate[0]) ** 2
+        + (grid[:, 1] - deflections[:, 1] - source_plane_coordinate[1]) ** 2
+    )
+
+    peaks_list = pos.grid_peaks_from(
+        distance_1d=distances,
+        grid_slim=grid,
+        neighbors=neighbors,
+        has_neighbors=has_neighbors,
+    )
+
+    peaks = np.zeros(shape=(len(peaks_list), 2))
+
+    for peak_index in range(len(peaks_list)):
+        peaks[peak_index, 0] = peaks_list[peak_index][0]
+        peaks[peak_index, 1] = peaks_list[peak_index][1]
+
+    peaks_magnifications = np.abs(
+        magnifications_via_mass_profiles_jit(
+            peaks, mass_profile_types, mass_profile_parameters, pixel_scale
+        )
+    )
+
+    solutions = np.zeros(shape=peaks.shape)
+    total_solutions = 0
+
+    for peak_index in range(peaks.shape[0]):
+
+        if peaks_magnifications[peak_index] > magnification_threshold:
+
+            solution, is_converged = newton_raphson_of_coordinate_jit(
+                peaks[peak_index],
+                source_plane_coordinate,
+                mass_profile_types,
+                mass_profile_parameters,
+                source_plane_tolerance,
+                max_iterations,
+                buffer,
+                pixel_scale,
+            )
+
+            if is_converged:
+                solutions[total_solutions, :] = solution
+                total_solutions += 1
+
+    solutions_list = pos.grid_remove_duplicates(grid=solutions[:total_solutions])
+
+    solutions = np.zeros(shape=(len(solutions_list), 2))
+
+    for solution_index in range(len(solutions_list)):
+        solutions[solution_index, 0] = solutions_list[solution_index][0]
+        solutions[solution_index, 1] = solutions_list[solution_index][1]
+
+    magnifications = np.abs(
+        magnifications_via_mass_profiles_jit(
+            solutions, mass_profile_types, mass_profile_parameters, buffer
+        )
+    )
+
+    is_magnified = magnifications > magnification_threshold
+
+    solutions = solutions[is_magnified]
+    magnifications = magnifications[is_magnified]
+
+    if solutions.shape[0] == 0:
+        return 0.0, False
+
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for position_index in range(positions.shape[0]):
+
+        distances_squared = (solutions[:, 0] - positions[position_index, 0]) ** 2 + (
+            solutions[:, 1] - positions[position_index, 1]
+        ) ** 2
+
+        solution_index = np.argmin(distances_squared)
+
+        chi_squared += (
+            np.sqrt(distances_squared[solution_index]) / noise_map[position_index]
+        ) ** 2
+        noise_normalization += np.log(2.0 * np.pi * noise_map[position_index] ** 2)
+
+        if fluxes.shape[0] > 0:
+
+            chi_squared += (
+                (fluxes[position_index] - flux * magnifications[solution_index])
+                / fluxes_noise_map[position_index]
+            ) ** 2
+            noise_normalization += np.log(
+                2.0 * np.pi * fluxes_noise_map[position_index] ** 2
+            )
+
+    return -0.5 * (chi_squared + noise_normalization), True
@@ -0,0 +1,296 @@
+import copy
+
+from autoarray.inversion import pixelizations as pix, regularization as reg
+from autoarray.util import inversion_util
+from autogalaxy.galaxy import galaxy as g
+from autogalaxy.hyper import hyper_data as hd
+from autogalaxy.profiles import light_profiles as lp, mass_profiles as mp
+
+# The classes of the components of a model which change the traced grids of a tracer if they have free parameters (a
+# free redshift is a parameter of a `GalaxyModel` or of a `Redshift` model).
+mass_classes = (mp.MassProfile, g.Galaxy, g.Redshift)
+
+
+class Preloads:
+    def __init__(
+        self,
+        blurred_image=None,
+        profile_visibilities=None,
+        traced_grids_of_planes_of_grids=None,
+        mapper=None,
+        blurred_mapping_matrix=None,
+        curvature_matrix=None,
+        data_vector=None,
+        regularization_matrix=None,
+    ):
+        """
+        The products of a fit which are the same for every model-fit of a phase, because the galaxies they depend on
+        are fixed (e.g. the lens light of a phase which passes it as an instance and not a model). These are computed
+        once, the first time the phase's analysis fits the dataset, and used by every fit, instead of being computed
+        in every likelihood evaluation.
+
+        This extends the preloading of the sparse image-plane grids of a pixelization (see
+        `SettingsPixelization.preload_sparse_grids_of_planes`) to every fixed product of a fit.
+
+        The products of an inversion are preloaded in tiers, where each tier requires the tier before it to be fixed:
+
+        1) The `mapper` and `blurred_mapping_matrix`, which are fixed if the mass profiles, pixelization and hyper
+           images are fixed.
+        2) The curvature matrix F, which is also fixed if the noise-map is (e.g. there are no free hyper noise
+           components).
+        3) The data vector D, which is also fixed if the image the inversion fits (the image minus the blurred image
+           of the light profiles) is.
+
+        The `regularization_matrix` is preloaded if the mapper and regularization are fixed. If only the
+        regularization varies (e.g. an inversion hyper phase), every fit therefore only computes the regularization
+        matrix and solves for the reconstruction.
+
+        Parameters
+        ----------
+        blurred_image : aa.Array2D
+            The blurred image of a `FitImaging`, which is fixed if every galaxy with a light profile and the mass
+            profiles which deflect their light are fixed.
+        profile_visibilities : aa.Visibilities
+            The profile visibilities of a `FitInterferometer`, which are fixed under the same conditions as the
+            blurred image.
+        traced_grids_of_planes_of_grids : [(aa.Grid2D, [aa.Grid2D])]
+            The grids of the masked dataset paired with their traced grids of every plane, which are fixed if every
+            galaxy with a mass profile is fixed. These are loaded into the traced grids cache of every tracer that is
+            fitted (see `preload_tracer`), such that the dataset's grids are not ray-traced in every fit.
+        mapper : aa.Mapper
+            The mapper of the inversion between the traced grid and the pixelization.
+        blurred_mapping_matrix : np.ndarray
+            The mapping matrix of the mapper blurred with the PSF.
+        curvature_matrix : np.ndarray
+            The curvature matrix F of the inversion.
+        data_vector : np.ndarray
+            The data vector D of the inversion.
+        regularization_matrix : np.ndarray
+            The regularization matrix H of the inversion.
+        """
+        self.blurred_image = blurred_image
+        self.profile_visibilities = profile_visibilities
+        self.traced_grids_of_planes_of_grids = traced_grids_of_planes_of_grids
+        self.mapper = mapper
+        self.blurred_mapping_matrix = blurred_mapping_matrix
+        self.curvature_matrix = curvature_matrix
+        self.data_vector = data_vector
+        self.regularization_matrix = regularization_matrix
+
+    @classmethod
+    def from_imaging_fit(cls, fit, free_classes):
+        """
+        Returns the preloads of a phase fitting a masked imaging dataset, from a fit of an instance of the phase's
+        model.
+
+        Which products of the fit are fixed is determined by the structure of the model, via the classes of its
+        components with free parameters (e.g. the products depending on the mass profiles are only preloaded if no
+        mass profile of the model has a free parameter), as opposed to the values of the fit.
+
+        Parameters
+        ----------
+        fit : FitImaging
+            The fit of an instance of the phase's model to the masked imaging.
+        free_classes : (type,)
+            The classes of the components of the phase's model which have free parameters.
+        """
+        if not classes_are_fixed(classes=mass_classes, free_classes=free_classes):
+            return cls()
+
+        masked_imaging = fit.masked_imaging
+
+        preloads = cls(
+            traced_grids_of_planes_of_grids=traced_grids_of_planes_of_grids_from(
+                tracer=fit.tracer,
+                grids=[
+                    masked_imaging.grid,
+                    masked_imaging.blurring_grid,
+                    masked_imaging.grid_inversion,
+                ],
+            )
+        )
+
+        if classes_are_fixed(classes=lp.LightProfile, free_classes=free_classes):
+            preloads.blurred_image = fit.blurred_image
+
+        if not preloads.set_mapper_from_inversion(
+            inversion=fit.inversion, free_classes=free_classes
+        ):
+            return preloads
+
+        inversion = fit.inversion
+
+        preloads.blurred_mapping_matrix = inversion.blurred_mapping_matrix
+
+        if not classes_are_fixed(
+            classes=(g.HyperGalaxy, hd.HyperBackgroundNoise), free_classes=free_classes
+        ):
+            return preloads
+
+        preloads.curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=inversion.blurred_mapping_matrix, noise_map=fit.noise_map
+        )
+
+        if preloads.blurred_image is not None and classes_are_fixed(
+            classes=hd.HyperImageSky, free_classes=free_classes
+        ):
+
+            preloads.data_vector = inversion_util.data_vector_via_blurred_mapping_matrix_from(
+                blurred_mapping_matrix=inversion.blurred_mapping_matrix,
+                image=fit.profile_subtracted_image,
+                noise_map=fit.noise_map,
+            )
+
+        return preloads
+
+    @classmethod
+    def from_interferometer_fit(cls, fit, free_classes):
+        """
+        Returns the preloads of a phase fitting a masked interferometer dataset, from a fit of an instance of the
+        phase's model (see `from_imaging_fit`).
+
+        The inversion products of an interferometer fit depend on how its inversion is performed (e.g. via linear
+        operators), thus only its mapper and regularization matrix are preloaded.
+
+        Parameters
+        ----------
+        fit : FitInterferometer
+            The fit of an instance of the phase's model to the masked interferometer.
+        free_classes : (type,)
+            The classes of the components of the phase's model which have free parameters.
+        """
+        if not classes_are_fixed(classes=mass_classes, free_classes=free_classes):
+            return cls()
+
+        masked_interferometer = fit.masked_interferometer
+
+        preloads = cls(
+            traced_grids_of_planes_of_grids=traced_grids_of_planes_of_grids_from(
+                tracer=fit.tracer,
+                grids=[masked_interferometer.grid, masked_interferometer.grid_inversion],
+            )
+        )
+
+        if classes_are_fixed(classes=lp.LightProfile, free_classes=free_classes):
+            preloads.profile_visibilities = fit.profile_visibilities
+
+        preloads.set_mapper_from_inversion(
+            inversion=fit.inversion, free_classes=free_classes
+        )
+
+        return preloads
+
+    def set_mapper_from_inversion(self, inversion, free_classes):
+        """
+        Preload the mapper and regularization matrix of the inversion of a fit, if they are fixed. Returns `True` if
+        the mapper is preloaded, in which case the products which depend on the mapper can be preloaded.
+
+        The mapper is fixed if the traced grids are preloaded and no pixelization of the model has a free parameter
+        (the hyper images of the pixelizations are the same for every fit of a phase). The regularization matrix is
+        also fixed if no regularization has a free parameter.
+
+        Parameters
+        ----------
+        inversion : Inversion
+            The inversion of a fit of an instance of the phase's model.
+        free_classes : (type,)
+            The classes of the components of the phase's model which have free parameters.
+        """
+        if (
+            self.traced_grids_of_planes_of_grids is None
+            or inversion is None
+            or not classes_are_fixed(
+                classes=pix.Pixelization, free_classes=free_classes
+            )
+        ):
+            return False
+
+        self.mapper = inversion.mapper
+
+        if classes_are_fixed(classes=reg.Regularization, free_classes=free_classes):
+            self.regularization_matrix = inversion.regularization_matrix
+
+        return True
+
+    @property
+    def without_inversion(self):
+        """
+        These preloads without the products of an inversion, which are used by fits whose pixelization differs
+        from the pixelization the preloads were computed with (e.g. the stochastic resamples of a KMeans
+        pixelization).
+        """
+        preloads = copy.copy(self)
+
+        preloads.mapper = None
+        preloads.blurred_mapping_matrix = None
+        preloads.curvature_matrix = None
+        preloads.data_vector = None
+        preloads.regularization_matrix = None
+
+        return preloads
+
+    def preload_tracer(self, tracer):
+        """
+        Load the preloaded traced grids of the dataset's grids into the traced grids cache of a tracer, such that
+        these grids are not ray-traced by the tracer. A tracer with a different number of planes to the preloaded
+        traced grids is not changed.
+
+        Parameters
+        ----------
+        tracer : ray_tracing.Tracer
+            The tracer which is fitted to the dataset.
+        """
+        if self.traced_grids_of_planes_of_grids is None:
+            return
+
+        for (grid, traced_grids_of_planes) in self.traced_grids_of_planes_of_grids:
+
+            if len(traced_grids_of_planes) != tracer.total_planes:
+                return
+
+            tracer.preload_traced_grids_of_planes(
+                grid=grid, traced_grids_of_planes=traced_grids_of_planes
+            )
+
+
+def traced_grids_of_planes_of_grids_from(tracer, grids):
+    """
+    Returns every grid paired with its traced grids of every plane of a tracer.
+
+    Parameters
+    ----------
+    tracer : ray_tracing.Tracer
+        The tracer which traces the grids.
+    grids : [aa.Grid2D]
+        The grids which are traced, where a grid which is input more than once is only traced once.
+    """
+    traced_grids_of_planes_of_grids = []
+
+    for grid in grids:
+
+        if any(
+            grid is preloaded_grid
+            for (preloaded_grid, _) in traced_grids_of_planes_of_grids
+        ):
+            continue
+
+        traced_grids_of_planes_of_grids.append(
+            (grid, tracer.traced_grids_of_planes_from_grid(grid=grid))
+        )
+
+    return traced_grids_of_planes_of_grids
+
+
+def classes_are_fixed(classes, free_classes):
+    """
+    Returns `True` if no component of a model with free parameters is an instance of the input classes, such that
+    every component of these classes is the same for every fit of the model.
+
+    Parameters
+    ----------
+    classes : type or (type,)
+        The classes which are checked.
+    free_classes : (type,)
+        The classes of the components of the model which have free parameters.
+    """
+    return not any(issubclass(free_class, classes) for free_class in free_classes)
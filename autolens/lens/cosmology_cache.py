@@ -0,0 +1,190 @@
+from autoconf import conf
+from autogalaxy.util import cosmology_util
+import functools
+
+"""
+The angular diameter distances between the planes of a lens system depend only on the cosmology and the redshifts of
+the planes, which almost never change during a non-linear search. However, a new `Tracer` is created for every
+likelihood evaluation, meaning that without caching these distances are recomputed via astropy every time.
+
+This module wraps the functions in `autogalaxy.util.cosmology_util` that compute distances, critical surface densities
+and unit conversions in a process-wide least-recently-used cache, keyed by the cosmology's parameters and the
+redshift(s) of the calculation. Every `Tracer` (and any other calculation which calls the functions below) therefore
+shares the same cache.
+
+The cache is per process, thus every worker of a parallel non-linear search (e.g. dynesty) has its own cache. The
+function `cache_info` returns the hits and misses of every cache, so that its use can be confirmed in each worker.
+"""
+
+try:
+    maxsize = conf.instance["general"]["cosmology"]["cache_maxsize"]
+except Exception:
+    maxsize = 4096
+
+class CosmologyKey:
+    def __init__(self, cosmology):
+        """
+        The key used to identify a cosmology in the cache, which compares and hashes by the representation of the
+        cosmology and therefore by its class and all of its parameters (e.g. H0, Om0, Tcmb0, etc.).
+
+        Astropy cosmology objects cannot be hashed, so the cosmology is stored in its key, such that the cached
+        functions can retrieve it. A cosmology is therefore only kept in memory while one of the caches stores an
+        entry of it, and is removed with the least-recently-used entries of the caches.
+
+        Parameters
+        ----------
+        cosmology : astropy.cosmology
+            The cosmology which the key identifies.
+        """
+        self.cosmology = cosmology
+        self.key = repr(cosmology)
+
+    def __eq__(self, other):
+        return isinstance(other, CosmologyKey) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+
+def cosmology_key_from(cosmology):
+    """
+    Returns the key used to identify a cosmology in the cache (see `CosmologyKey`).
+
+    Parameters
+    ----------
+    cosmology : astropy.cosmology
+        The cosmology whose key is returned.
+    """
+    return CosmologyKey(cosmology=cosmology)
+
+
+@functools.lru_cache(maxsize=maxsize)
+def _arcsec_per_kpc(cosmology_key, redshift):
+    return cosmology_util.arcsec_per_kpc_from(
+        redshift=redshift, cosmology=cosmology_key.cosmology
+    )
+
+
+@functools.lru_cache(maxsize=maxsize)
+def _angular_diameter_distance_to_earth_in_kpc(cosmology_key, redshift):
+    return cosmology_util.angular_diameter_distance_to_earth_in_kpc_from(
+        redshift=redshift, cosmology=cosmology_key.cosmology
+    )
+
+
+@functools.lru_cache(maxsize=maxsize)
+def _angular_diameter_distance_between_redshifts_in_kpc(
+    cosmology_key, redshift_0, redshift_1
+):
+    return cosmology_util.angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0,
+        redshift_1=redshift_1,
+        cosmology=cosmology_key.cosmology,
+    )
+
+
+@functools.lru_cache(maxsize=maxsize)
+def _critical_surface_density_between_redshifts_solar_mass_per_kpc2(
+    cosmology_key, redshift_0, redshift_1
+):
+    return cosmology_util.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+        redshift_0=redshift_0,
+        redshift_1=redshift_1,
+        cosmology=cosmology_key.cosmology,
+    )
+
+
+def arcsec_per_kpc_from(*, redshift, cosmology):
+    return _arcsec_per_kpc(cosmology_key_from(cosmology=cosmology), redshift)
+
+
+def kpc_per_arcsec_from(*, redshift, cosmology):
+    return 1.0 / arcsec_per_kpc_from(redshift=redshift, cosmology=cosmology)
+
+
+def angular_diameter_distance_to_earth_in_kpc_from(*, redshift, cosmology):
+    return _angular_diameter_distance_to_earth_in_kpc(
+        cosmology_key_from(cosmology=cosmology), redshift
+    )
+
+
+def angular_diameter_distance_between_redshifts_in_kpc_from(
+    *, redshift_0, redshift_1, cosmology
+):
+    return _angular_diameter_distance_between_redshifts_in_kpc(
+        cosmology_key_from(cosmology=cosmology), redshift_0, redshift_1
+    )
+
+
+def critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+    *, redshift_0, redshift_1, cosmology
+):
+    return _critical_surface_density_between_redshifts_solar_mass_per_kpc2(
+        cosmology_key_from(cosmology=cosmology), redshift_0, redshift_1
+    )
+
+
+def critical_surface_density_between_redshifts_from(
+    *, redshift_0, redshift_1, cosmology
+):
+
+    critical_surface_density_kpc = critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+        redshift_0=redshift_0, redshift_1=redshift_1, cosmology=cosmology
+    )
+
+    kpc_per_arcsec = kpc_per_arcsec_from(redshift=redshift_0, cosmology=cosmology)
+
+    return critical_surface_density_kpc * kpc_per_arcsec ** 2.0
+
+
+def scaling_factor_between_redshifts_from(
+    *, redshift_0, redshift_1, redshift_final, cosmology
+):
+
+    angular_diameter_distance_between_redshifts_0_and_1 = angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_1, cosmology=cosmology
+    )
+
+    angular_diameter_distance_to_redshift_final = angular_diameter_distance_to_earth_in_kpc_from(
+        redshift=redshift_final, cosmology=cosmology
+    )
+
+    angular_diameter_distance_of_redshift_1_to_earth = angular_diameter_distance_to_earth_in_kpc_from(
+        redshift=redshift_1, cosmology=cosmology
+    )
+
+    angular_diameter_distance_between_redshift_0_and_final = angular_diameter_distance_between_redshifts_in_kpc_from(
+        redshift_0=redshift_0, redshift_1=redshift_final, cosmology=cosmology
+    )
+
+    return (
+        angular_diameter_distance_between_redshifts_0_and_1
+        * angular_diameter_distance_to_redshift_final
+    ) / (
+        angular_diameter_distance_of_redshift_1_to_earth
+        * angular_diameter_distance_between_redshift_0_and_final
+    )
+
+
+_caches = {
+    "arcsec_per_kpc": _arcsec_per_kpc,
+    "angular_diameter_distance_to_earth": _angular_diameter_distance_to_earth_in_kpc,
+    "angular_diameter_distance_between_redshifts": _angular_diameter_distance_between_redshifts_in_kpc,
+    "critical_surface_density": _critical_surface_density_between_redshifts_solar_mass_per_kpc2,
+}
+
+
+def cache_info():
+    """
+    Returns a dictionary of the hits, misses, maximum size and current size of every cache in this module, in the
+    `CacheInfo` format of `functools.lru_cache`.
+    """
+    return {name: cache.cache_info() for name, cache in _caches.items()}
+
+
+def cache_clear():
+    """
+    Clear every cache in this module and reset their hit and miss counters.
+    """
+    for cache in _caches.values():
+        cache.cache_clear()
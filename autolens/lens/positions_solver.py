@@ -1,9 +1,111 @@
 from autoarray import decorator_util
+import functools
 import numpy as np
-from autoarray.structures import grids
+import weakref
+from autoarray.structures import arrays, grids
 from autogalaxy.profiles import mass_profiles as mp
 
 
+class PositionsSolverResult:
+    def __init__(
+        self,
+        positions,
+        lensing_obj,
+        buffer=None,
+        source_plane_positions=None,
+        magnifications=None,
+    ):
+        """
+        The multiple images found by a positions solver, alongside their traced source-plane (y,x) coordinates and
+        magnifications.
+
+        The solvers compute the deflection angles and magnifications of the images they find as part of their
+        search (e.g. the `GradientSolver` traces every image to the source-plane to check it has converged, and
+        computes the magnification of every image to remove those below the magnification threshold). These are
+        stored by the result, such that the fits that use the images (e.g. `FitFluxes`) do not compute them again. The
+        source-plane coordinates and magnifications that a solver does not compute are computed from the lensing
+        object when they are first used.
+
+        Parameters
+        ----------
+        positions : grids.Grid2DIrregular
+            The image-plane (y,x) coordinates of the multiple images.
+        lensing_obj : autogalaxy.LensingObject
+            The lensing object the images were found for, which computes the source-plane coordinates and
+            magnifications that were not input.
+        buffer : float or None
+            The spacing of the finite differences used to compute the magnifications, where `None` uses the lensing
+            object's default.
+        source_plane_positions : np.ndarray or None
+            The traced source-plane (y,x) coordinate of every image.
+        magnifications : np.ndarray or None
+            The absolute magnification of every image.
+        """
+        self.positions = positions
+        self.lensing_obj = lensing_obj
+        self.buffer = buffer
+
+        self._source_plane_positions = source_plane_positions
+        self._magnifications = magnifications
+
+    @property
+    def source_plane_positions(self) -> grids.Grid2DIrregular:
+
+        if self._source_plane_positions is None:
+            self._source_plane_positions = np.asarray(self.positions) - np.asarray(
+                self.lensing_obj.deflections_from_grid(grid=self.positions)
+            )
+
+        return grids.Grid2DIrregular(grid=self._source_plane_positions)
+
+    @property
+    def magnifications(self) -> arrays.ValuesIrregular:
+
+        if self._magnifications is None:
+
+            if self.buffer is None:
+                magnifications = self.lensing_obj.magnification_via_hessian_from_grid(
+                    grid=self.positions
+                )
+            else:
+                magnifications = self.lensing_obj.magnification_via_hessian_from_grid(
+                    grid=self.positions, buffer=self.buffer
+                )
+
+            self._magnifications = np.abs(np.asarray(magnifications))
+
+        return arrays.ValuesIrregular(values=self._magnifications)
+
+    def paired_to(self, grid_pair):
+        """
+        Returns the result of the images closest to every (y,x) coordinate of an input grid (e.g. the observed
+        positions of a lensed point source), in the order of the input grid, with their source-plane coordinates and
+        magnifications if they have been computed.
+
+        Parameters
+        ----------
+        grid_pair : grids.Grid2DIrregular
+            The (y,x) coordinates the images are paired to.
+        """
+        positions = self.positions.grid_of_closest_from_grid_pair(grid_pair=grid_pair)
+
+        indexes = indexes_of_coordinates_from(
+            coordinates=positions, grid=self.positions
+        )
+
+        return PositionsSolverResult(
+            positions=positions,
+            lensing_obj=self.lensing_obj,
+            buffer=self.buffer,
+            source_plane_positions=None
+            if self._source_plane_positions is None
+            else self._source_plane_positions[indexes],
+            magnifications=None
+            if self._magnifications is None
+            else self._magnifications[indexes],
+        )
+
+
 class AbstractPositionsSolver:
     def __init__(
         self,
@@ -12,6 +114,8 @@ class AbstractPositionsSolver:
         magnification_threshold=0.1,
         distance_from_source_centre=None,
         distance_from_mass_profile_centre=None,
+        critical_curve_upscale_factor=None,
+        critical_curve_buffer=1,
     ):
 
         self.use_upscaling = use_upscaling
@@ -19,9 +123,49 @@ class AbstractPositionsSolver:
         self.magnification_threshold = magnification_threshold
         self.distance_from_source_centre = distance_from_source_centre
         self.distance_from_mass_profile_centre = distance_from_mass_profile_centre
+        self.critical_curve_upscale_factor = critical_curve_upscale_factor
+        self.critical_curve_buffer = critical_curve_buffer
+
+        self._critical_curve_grid_cache = None
+
+    def __getstate__(self):
+        """
+        The critical curve grid cache holds a weak reference to a lensing object, which cannot be pickled, therefore
+        it is removed when the solver is pickled (e.g. when it is passed to a parallel process).
+        """
+        state = self.__dict__.copy()
+        state.pop("_critical_curve_grid_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("critical_curve_upscale_factor", None)
+        state.setdefault("critical_curve_buffer", 1)
+        self.__dict__.update(state)
+        self._critical_curve_grid_cache = None
 
     def grid_with_points_below_magnification_threshold_removed(self, lensing_obj, grid):
 
+        return self.grid_and_magnifications_above_magnification_threshold_from(
+            lensing_obj=lensing_obj, grid=grid
+        )[0]
+
+    def grid_and_magnifications_above_magnification_threshold_from(
+        self, lensing_obj, grid
+    ):
+        """
+        Remove all coordinates from a grid whose absolute magnification is not above the solver's
+        `magnification_threshold`, and return the grid alongside the absolute magnifications of the coordinates that
+        are kept, such that these can be stored in a `PositionsSolverResult`.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        grid : autoarray.Grid2DIrregularUniform
+            The grid of (y,x) coordinates whose magnifications are computed using finite differences with a spacing of
+            its pixel scale.
+        """
         magnifications = np.abs(
             lensing_obj.magnification_via_hessian_from_grid(
                 grid=grid, buffer=grid.pixel_scale
@@ -29,13 +173,16 @@ class AbstractPositionsSolver:
         )
 
         grid_mag = []
+        magnifications_mag = []
 
         for index, magnification in enumerate(magnifications):
             if magnification > self.magnification_threshold:
                 grid_mag.append(grid[index, :])
+                magnifications_mag.append(magnification)
 
-        return grids.Grid2DIrregularUniform(
-            grid=grid_mag, pixel_scales=grid.pixel_scales
+        return (
+            grids.Grid2DIrregularUniform(grid=grid_mag, pixel_scales=grid.pixel_scales),
+            np.asarray(magnifications_mag, dtype="float64"),
         )
 
     def grid_with_coordinates_from_mass_profile_centre_removed(self, lensing_obj, grid):
@@ -135,7 +282,272 @@ class AbstractPositionsSolver:
             ),
         )
 
-    def grid_peaks_from(self, lensing_obj, grid, source_plane_coordinate):
+    def source_plane_grid_from(self, lensing_obj):
+        """
+        Trace the initial grid of the solver to the source-plane using the lensing object.
+
+        The traced grid does not depend on the source-plane coordinate whose multiple images are found, thus it is
+        computed once and shared by every source when the images of many sources are found (see `solve_many`).
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        """
+        deflections = lensing_obj.deflections_from_grid(grid=self.grid)
+        return self.grid.grid_from_deflection_grid(deflection_grid=deflections)
+
+    def result_from(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
+        """
+        Returns the multiple images of a source-plane (y,x) coordinate as a `PositionsSolverResult`, which stores the
+        source-plane coordinates and magnifications of the images computed by the solver so they are not computed
+        again by the fits that use them.
+
+        Solvers which do not compute these quantities return a result which computes them from the lensing object
+        when they are first used.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are found.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The initial grid traced to the source-plane, which is computed using the lensing object if it is not input.
+        """
+        return PositionsSolverResult(
+            positions=self.solve(
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+                source_plane_grid=source_plane_grid,
+            ),
+            lensing_obj=lensing_obj,
+        )
+
+    def solve_many(self, lensing_obj, source_plane_coordinates):
+        """
+        Returns the image-plane (y,x) coordinates of the multiple images of every input source-plane (y,x) coordinate,
+        as a list of `Grid2DIrregular` objects in the same order as the source-plane coordinates.
+
+        The initial grid is traced to the source-plane once and shared by every source, such that only the peak
+        finding and refinement of the `solve` method are repeated for each source.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) source-plane coordinates whose multiple images are found.
+        """
+        source_plane_grid = self.source_plane_grid_from(lensing_obj=lensing_obj)
+
+        return [
+            self.solve(
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+                source_plane_grid=source_plane_grid,
+            )
+            for source_plane_coordinate in source_plane_coordinates
+        ]
+
+    def critical_curve_grid_from(self, lensing_obj):
+        """
+        Returns the critical curve grid of the solver's adaptive initial grid, which is a higher resolution grid
+        covering only the bands of the initial grid around the lensing object's critical curves, alongside its
+        traced source-plane grid and a bool array which is `True` for the pixels of the initial grid inside the bands.
+
+        Images far from the critical curves are found on the initial grid, however a pair of images that are merging
+        on a critical curve (because the source is close to a caustic) are separated by less than a pixel of the
+        initial grid and are only found as one peak, or not at all. The critical curve grid resolves these pairs,
+        while using far fewer coordinates than increasing the resolution of the whole initial grid.
+
+        This is performed as follows:
+
+         1) Compute the determinant of the Jacobian of the lens mapping (the inverse magnification) of every pixel
+            of the initial grid from the lensing object's hessian.
+         2) Find the critical pixels, whose determinant changes sign relative to one of their 8 neighbors, such that a
+            critical curve passes between them. Sign changes between pixels whose determinant is non-finite or above
+            1.0 in absolute value (a magnification below 1), such as those next to the centre of a singular mass
+            profile, are not critical curves and are ignored (see `grid_critical_pixels_from`).
+         3) Create the buffed and upscaled grid around every critical pixel (see `grids_buffed_around_coordinates_from`)
+            using the `critical_curve_buffer` and `critical_curve_upscale_factor`, and trace it to the source-plane.
+
+        None of these steps depend on the source-plane coordinate whose images are found, thus the result is cached
+        for the lensing object and computed once per lensing object (e.g. once per `Tracer` of a non-linear search)
+        irrespective of how many times `solve` is called.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        """
+        if self._critical_curve_grid_cache is not None:
+
+            (
+                lensing_obj_ref,
+                is_critical,
+                critical_curve_grid,
+                source_plane_critical_curve_grid,
+            ) = self._critical_curve_grid_cache
+
+            if lensing_obj_ref() is lensing_obj:
+                return is_critical, critical_curve_grid, source_plane_critical_curve_grid
+
+        hessian_yy, hessian_xy, hessian_yx, hessian_xx = [
+            np.asarray(component)
+            for component in lensing_obj.hessian_from_grid(
+                grid=self.grid, buffer=self.grid.pixel_scale
+            )
+        ]
+
+        determinants = (1.0 - hessian_yy) * (1.0 - hessian_xx) - hessian_xy * hessian_yx
+
+        neighbors, has_neighbors = grid_square_neighbors_1d_cached_from(
+            shape_slim=self.grid.shape[0]
+        )
+
+        is_critical = grid_critical_pixels_from(
+            determinants=determinants,
+            neighbors=neighbors,
+            has_neighbors=has_neighbors,
+            max_determinant=1.0,
+        )
+
+        upscale_factor = self.critical_curve_upscale_factor
+        pixel_scale = self.grid.pixel_scale / upscale_factor
+
+        critical_curve_grid = grids.Grid2DIrregularUniform(
+            grid=grids_buffed_around_coordinates_from(
+                coordinates=np.asarray(self.grid)[is_critical],
+                pixel_scales=self.grid.pixel_scales,
+                buffer=self.critical_curve_buffer,
+                upscale_factor=upscale_factor,
+            ),
+            pixel_scales=(pixel_scale, pixel_scale),
+        )
+
+        deflections = lensing_obj.deflections_from_grid(grid=critical_curve_grid)
+        source_plane_critical_curve_grid = critical_curve_grid.grid_from_deflection_grid(
+            deflection_grid=deflections
+        )
+
+        try:
+            self._critical_curve_grid_cache = (
+                weakref.ref(lensing_obj),
+                is_critical,
+                critical_curve_grid,
+                source_plane_critical_curve_grid,
+            )
+        except TypeError:
+            pass
+
+        return is_critical, critical_curve_grid, source_plane_critical_curve_grid
+
+    def grid_peaks_of_initial_grid_from(
+        self, lensing_obj, source_plane_coordinate, source_plane_grid=None
+    ):
+        """
+        Returns the peaks of the solver's initial grid (see `grid_peaks_from`) as a list of grids, where every grid
+        has the pixel scale of the grid its peaks were found on.
+
+        If the solver has no `critical_curve_upscale_factor` the initial grid is the uniform grid input into the
+        solver and the list contains its peaks. Otherwise the initial grid is adaptive, and the list also contains
+        the peaks of the critical curve grid (see `critical_curve_grid_from`) if it has any. The pixels of the uniform grid that are
+        covered by the critical curve grid cannot be peaks of the uniform grid, such that an image is not found on
+        both grids.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (y,x)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The initial grid traced to the source-plane, which is computed using the lensing object if it is not input.
+        """
+        if self.critical_curve_upscale_factor is None:
+            return [
+                self.grid_peaks_from(
+                    lensing_obj=lensing_obj,
+                    grid=self.grid,
+                    source_plane_coordinate=source_plane_coordinate,
+                    source_plane_grid=source_plane_grid,
+                )
+            ]
+
+        if source_plane_grid is None:
+            source_plane_grid = self.source_plane_grid_from(lensing_obj=lensing_obj)
+
+        (
+            is_critical,
+            critical_curve_grid,
+            source_plane_critical_curve_grid,
+        ) = self.critical_curve_grid_from(lensing_obj=lensing_obj)
+
+        neighbors, has_neighbors = grid_square_neighbors_1d_cached_from(
+            shape_slim=self.grid.shape[0]
+        )
+
+        grid_peaks = grid_peaks_from(
+            distance_1d=source_plane_grid.distances_from_coordinate(
+                coordinate=source_plane_coordinate
+            ),
+            grid_slim=self.grid,
+            neighbors=neighbors,
+            has_neighbors=has_neighbors & ~is_critical,
+        )
+
+        grid_peaks_list = [
+            grids.Grid2DIrregularUniform(
+                grid=grid_peaks, pixel_scales=self.grid.pixel_scales
+            )
+        ]
+
+        if critical_curve_grid.shape[0] == 0:
+            return grid_peaks_list
+
+        total_coordinates_per_block = (
+            self.critical_curve_upscale_factor * (2 * self.critical_curve_buffer + 1)
+        ) ** 2
+
+        neighbors, has_neighbors = grid_square_neighbors_1d_cached_from(
+            shape_slim=total_coordinates_per_block
+        )
+
+        critical_curve_peaks = grid_peaks_of_blocks_from(
+            distance_1d=np.asarray(
+                source_plane_critical_curve_grid.distances_from_coordinate(
+                    coordinate=source_plane_coordinate
+                )
+            ),
+            grid_slim=np.asarray(critical_curve_grid),
+            neighbors=neighbors,
+            has_neighbors=has_neighbors,
+            total_coordinates_per_block=total_coordinates_per_block,
+        )
+
+        if len(critical_curve_peaks) > 0:
+
+            grid_peaks_list.append(
+                grids.Grid2DIrregularUniform(
+                    grid=grid_remove_duplicates(
+                        grid=np.asarray(critical_curve_peaks).reshape(-1, 2)
+                    ),
+                    pixel_scales=critical_curve_grid.pixel_scales,
+                )
+            )
+
+        return grid_peaks_list
+
+    def grid_peaks_from(
+        self, lensing_obj, grid, source_plane_coordinate, source_plane_grid=None
+    ):
         """Find the 'peaks' of a grid of coordinates, where a peak corresponds to a (y,x) coordinate on the grid which
         traces closer to the input (y,x) source-plane coordinate than any of its 8 adjacent neighbors. This is
         performed by:
@@ -160,21 +572,27 @@ class AbstractPositionsSolver:
         source_plane_coordinate : (y,x)
             The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
             for.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The grid traced to the source-plane, which is computed using the lensing object if it is not input.
         """
-        deflections = lensing_obj.deflections_from_grid(grid=grid)
-        source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
+        if source_plane_grid is None:
+            deflections = lensing_obj.deflections_from_grid(grid=grid)
+            source_plane_grid = grid.grid_from_deflection_grid(
+                deflection_grid=deflections
+            )
+
         source_plane_distances = source_plane_grid.distances_from_coordinate(
             coordinate=source_plane_coordinate
         )
 
-        neighbors, has_neighbors = grid_square_neighbors_1d_from(
+        neighbors, has_neighbors = grid_square_neighbors_1d_cached_from(
             shape_slim=grid.shape[0]
         )
 
         grid_peaks = grid_peaks_from(
             distance_1d=source_plane_distances,
             grid_slim=grid,
-            neighbors=neighbors.astype("int"),
+            neighbors=neighbors,
             has_neighbors=has_neighbors,
         )
 
@@ -183,7 +601,12 @@ class AbstractPositionsSolver:
         )
 
     def grid_within_distance_of_source_plane_centre(
-        self, lensing_obj, source_plane_coordinate, grid, distance
+        self,
+        lensing_obj,
+        source_plane_coordinate,
+        grid,
+        distance,
+        source_plane_grid=None,
     ):
         """
         For an input grid of (y,x) coordinates, remove all coordinates that do not trace within a threshold distance
@@ -211,14 +634,25 @@ class AbstractPositionsSolver:
                 for.
             distance : float
                 The distance within which a grid coordinate must trace to the source-plane centre to be retained.
+            source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+                The grid traced to the source-plane, which is computed using the lensing object if it is not input.
         """
         if distance is None:
             return grid
 
-        deflections = lensing_obj.deflections_from_grid(grid=grid)
-        source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
-        source_plane_distances = source_plane_grid.distances_from_coordinate(
-            coordinate=source_plane_coordinate
+        if source_plane_grid is None:
+            deflections = lensing_obj.deflections_from_grid(grid=grid)
+            source_plane_grid = grid.grid_from_deflection_grid(
+                deflection_grid=deflections
+            )
+
+        source_plane_distances = np.sqrt(
+            np.sum(
+                np.square(
+                    np.asarray(source_plane_grid) - np.asarray(source_plane_coordinate)
+                ),
+                axis=1,
+            )
         )
 
         grid_within_distance_of_centre = grid_within_distance(
@@ -242,6 +676,8 @@ class PositionsSolver(AbstractPositionsSolver):
         magnification_threshold=0.0,
         distance_from_source_centre=None,
         distance_from_mass_profile_centre=None,
+        critical_curve_upscale_factor=None,
+        critical_curve_buffer=1,
     ):
         """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class uses their
         deflections_from_grid method to determine the (y,x) coordinates the multiple-images appear given a (y,x)
@@ -265,6 +701,11 @@ class PositionsSolver(AbstractPositionsSolver):
           - Image pixels which do not correspond to genuine multiple images may be detected as they meet the peak
             criteria. This can occurance in certain circumstances where a non-multiple image still traces closer than its
             8 neighbors. Depending on how the `PositionFinder` is being used these can be removed.
+
+        If a `critical_curve_upscale_factor` is input the initial grid is adaptive, where the bands of the input grid
+        around the lensing object's critical curves are replaced with a grid at `critical_curve_upscale_factor` times
+        its resolution (see `critical_curve_grid_from`). Peaks found on this grid are refined starting from its pixel
+        scale, such that pairs of images merging on a critical curve are found.
         """
 
         super(PositionsSolver, self).__init__(
@@ -273,6 +714,8 @@ class PositionsSolver(AbstractPositionsSolver):
             magnification_threshold=magnification_threshold,
             distance_from_source_centre=distance_from_source_centre,
             distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+            critical_curve_upscale_factor=critical_curve_upscale_factor,
+            critical_curve_buffer=critical_curve_buffer,
         )
 
         self.grid = grid.slim_binned
@@ -320,105 +763,1368 @@ class PositionsSolver(AbstractPositionsSolver):
         else:
             return [tuple(coordinate) for coordinate in grid]
 
-    def solve(self, lensing_obj, source_plane_coordinate):
+    def refined_coordinates_from_coordinates(
+        self, coordinates, pixel_scale, lensing_obj, source_plane_coordinate
+    ):
+        """For an input grid of (y,x) coordinates, determine the refined coordinates of every coordinate, which are
+        computed by locating peak pixels on a higher resolution grid around that coordinate.
+
+        The result is identical to calling `refined_coordinates_from_coordinate` for every coordinate, however the
+        higher resolution grids of all coordinates are stacked into one grid, whose deflection angles are computed in
+        a single call to the lensing object and whose peaks are found for every coordinate in a single function (see
+        `refined_and_traced_coordinates_from_coordinates`).
 
-        coordinates_list = self.grid_peaks_from(
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            The (y,x) coordinates around which the upscaled grids used to find the refined coordinates are computed.
+        pixel_scale : float
+            The pixel-scale resolution of the buffed and upscaled grids that are formed around the input coordinates.
+            If upscale > 1, the pixel_scales are reduced to pixel_scale / upscale_factor.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+        refined_coordinates, _ = self.refined_and_traced_coordinates_from_coordinates(
+            coordinates=coordinates,
+            pixel_scale=pixel_scale,
             lensing_obj=lensing_obj,
-            grid=self.grid,
             source_plane_coordinate=source_plane_coordinate,
         )
 
-        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
-            lensing_obj=lensing_obj, grid=coordinates_list
-        )
+        return [tuple(coordinate) for coordinate in refined_coordinates.tolist()]
 
-        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
-            lensing_obj=lensing_obj, grid=coordinates_list
-        )
+    def refined_and_traced_coordinates_from_coordinates(
+        self, coordinates, pixel_scale, lensing_obj, source_plane_coordinate
+    ):
+        """For an input grid of (y,x) coordinates, determine the refined coordinates of every coordinate (see
+        `refined_coordinates_from_coordinates`) and their traced source-plane coordinates, which are taken from the
+        higher resolution grid traced to find the peaks as opposed to being traced again.
 
-        if not self.use_upscaling:
+        The refined coordinates and traced coordinates are returned as two ndarrays of shape [total_coordinates, 2].
 
-            return grids.Grid2DIrregular(grid=coordinates_list)
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            The (y,x) coordinates around which the upscaled grids used to find the refined coordinates are computed.
+        pixel_scale : float
+            The pixel-scale resolution of the buffed and upscaled grids that are formed around the input coordinates.
+            If upscale > 1, the pixel_scales are reduced to pixel_scale / upscale_factor.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+        coordinates = np.asarray(coordinates).reshape(-1, 2)
 
-        pixel_scale = self.grid.pixel_scale
+        if coordinates.shape[0] == 0:
+            return np.zeros(shape=(0, 2)), np.zeros(shape=(0, 2))
 
-        while pixel_scale > self.pixel_scale_precision:
+        if self.use_upscaling:
+            upscale_factor = self.upscale_factor
+        else:
+            upscale_factor = 1
 
-            refined_coordinates_list = []
+        grid = grids.Grid2DIrregularUniform(
+            grid=grids_buffed_around_coordinates_from(
+                coordinates=coordinates,
+                pixel_scales=(pixel_scale, pixel_scale),
+                buffer=4,
+                upscale_factor=upscale_factor,
+            ),
+            pixel_scales=(pixel_scale / upscale_factor, pixel_scale / upscale_factor),
+        )
 
-            for coordinate in coordinates_list:
+        deflections = lensing_obj.deflections_from_grid(grid=grid)
+        source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
+        source_plane_distances = source_plane_grid.distances_from_coordinate(
+            coordinate=source_plane_coordinate
+        )
 
-                refined_coordinates = self.refined_coordinates_from_coordinate(
-                    coordinate=coordinate,
-                    pixel_scale=pixel_scale,
-                    lensing_obj=lensing_obj,
-                    source_plane_coordinate=source_plane_coordinate,
-                )
+        total_coordinates_per_block = grid.shape[0] // coordinates.shape[0]
 
-                if refined_coordinates is not None:
-                    refined_coordinates_list += refined_coordinates
+        neighbors, has_neighbors = grid_square_neighbors_1d_cached_from(
+            shape_slim=total_coordinates_per_block
+        )
 
-            refined_coordinates_list = grid_remove_duplicates(
-                grid=np.asarray(refined_coordinates_list)
+        refined_coordinates = np.asarray(
+            grid_peaks_of_blocks_from(
+                distance_1d=np.asarray(source_plane_distances),
+                grid_slim=np.asarray(grid),
+                neighbors=neighbors,
+                has_neighbors=has_neighbors,
+                total_coordinates_per_block=total_coordinates_per_block,
             )
+        ).reshape(-1, 2)
 
-            pixel_scale = pixel_scale / self.upscale_factor
-
-            coordinates_list = refined_coordinates_list
-
-        coordinates_list = self.grid_within_distance_of_source_plane_centre(
-            lensing_obj=lensing_obj,
-            grid=grids.Grid2DIrregularUniform(
-                grid=coordinates_list, pixel_scales=(pixel_scale, pixel_scale)
-            ),
-            source_plane_coordinate=source_plane_coordinate,
-            distance=self.distance_from_source_centre,
-        )
-
-        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
-            lensing_obj=lensing_obj, grid=coordinates_list
+        indexes = indexes_of_coordinates_from(
+            coordinates=refined_coordinates, grid=grid
         )
 
-        return grids.Grid2DIrregular(grid=coordinates_list)
+        return refined_coordinates, np.asarray(source_plane_grid)[indexes]
 
+    def refined_coordinates_to_precision_from(
+        self, coordinates, pixel_scale, lensing_obj, source_plane_coordinate
+    ):
+        """Iteratively refine a grid of (y,x) coordinates found on a grid of the input pixel scale, by locating their
+        peak pixels on higher and higher resolution grids (see `refined_coordinates_from_coordinates`) until the
+        pixel scale is below the solver's `pixel_scale_precision`.
 
-@decorator_util.jit()
-def grid_remove_duplicates(grid):
-
-    tolerance = 1e-8
+        Returns the refined coordinates, their traced source-plane coordinates computed by the final refinement (or
+        `None` if the coordinates are not refined) and the pixel scale of the grid they were found on.
 
-    grid_no_duplicates = []
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            The (y,x) coordinates which are refined.
+        pixel_scale : float
+            The pixel-scale resolution of the grid the coordinates were found on.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+        traced_coordinates = None
 
-    separations = np.zeros((grid.shape[0], grid.shape[0]))
+        while pixel_scale > self.pixel_scale_precision:
 
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[0]):
-            separations[i, j] = np.sqrt(
-                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
+            (
+                refined_coordinates,
+                traced_refined_coordinates,
+            ) = self.refined_and_traced_coordinates_from_coordinates(
+                coordinates=coordinates,
+                pixel_scale=pixel_scale,
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
             )
-            separations[i, i] = tolerance * 2
 
-    for i in range(grid.shape[0]):
+            coordinates = np.asarray(
+                grid_remove_duplicates(grid=refined_coordinates)
+            ).reshape(-1, 2)
 
-        is_duplicate = False
+            traced_coordinates = traced_refined_coordinates[
+                indexes_of_coordinates_from(
+                    coordinates=coordinates, grid=refined_coordinates
+                )
+            ]
 
-        for j in range(grid.shape[0]):
+            pixel_scale = pixel_scale / self.upscale_factor
 
-            if separations[i, j] < tolerance:
+        return coordinates, traced_coordinates, pixel_scale
 
-                is_duplicate = True
-                separations[i, j] = tolerance * 2
-                separations[j, i] = tolerance * 2
+    def solve(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
 
-        if not is_duplicate:
-            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+        return self.result_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+        ).positions
 
-    return grid_no_duplicates
+    def result_from(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
+        """
+        Returns the multiple images of a source-plane (y,x) coordinate as a `PositionsSolverResult`.
 
+        If the images are refined (see `use_upscaling`), their traced source-plane coordinates are those computed by
+        the final refinement, which are also used to remove images further than `distance_from_source_centre` from
+        the source-plane coordinate, and the magnifications are those computed to remove images below the
+        magnification threshold. The deflection angles of the final images are therefore not computed again.
 
-@decorator_util.jit()
-def grid_buffed_around_coordinate_from(
-    coordinate, pixel_scales, buffer, upscale_factor=1
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are found.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The initial grid traced to the source-plane, which is computed using the lensing object if it is not input.
+        """
+        grid_peaks_list = self.grid_peaks_of_initial_grid_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+        )
+
+        refined_coordinates_list = []
+        traced_coordinates_list = []
+
+        for grid_peaks in grid_peaks_list:
+
+            coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
+                lensing_obj=lensing_obj, grid=grid_peaks
+            )
+
+            coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+                lensing_obj=lensing_obj, grid=coordinates_list
+            )
+
+            if self.use_upscaling:
+
+                (
+                    coordinates_list,
+                    traced_coordinates,
+                    pixel_scale,
+                ) = self.refined_coordinates_to_precision_from(
+                    coordinates=coordinates_list,
+                    pixel_scale=grid_peaks.pixel_scale,
+                    lensing_obj=lensing_obj,
+                    source_plane_coordinate=source_plane_coordinate,
+                )
+
+                traced_coordinates_list.append(traced_coordinates)
+
+            refined_coordinates_list.append(coordinates_list)
+
+        coordinates_list = refined_coordinates_list[0]
+
+        if len(refined_coordinates_list) > 1:
+            coordinates_list = grid_remove_duplicates(
+                grid=np.concatenate(
+                    [
+                        np.asarray(coordinates).reshape(-1, 2)
+                        for coordinates in refined_coordinates_list
+                    ]
+                )
+            )
+
+        if not self.use_upscaling:
+
+            return PositionsSolverResult(
+                positions=grids.Grid2DIrregular(grid=coordinates_list),
+                lensing_obj=lensing_obj,
+                buffer=self.grid.pixel_scale,
+            )
+
+        coordinates = np.asarray(coordinates_list).reshape(-1, 2)
+
+        if any(
+            traced_coordinates is None for traced_coordinates in traced_coordinates_list
+        ):
+
+            traced_coordinates = coordinates - np.asarray(
+                lensing_obj.deflections_from_grid(
+                    grid=grids.Grid2DIrregular(grid=coordinates)
+                )
+            )
+
+        else:
+
+            indexes = indexes_of_coordinates_from(
+                coordinates=coordinates,
+                grid=np.concatenate(
+                    [
+                        np.asarray(refined_coordinates).reshape(-1, 2)
+                        for refined_coordinates in refined_coordinates_list
+                    ]
+                ),
+            )
+
+            traced_coordinates = np.concatenate(traced_coordinates_list)[indexes]
+
+        coordinates_within_distance = self.grid_within_distance_of_source_plane_centre(
+            lensing_obj=lensing_obj,
+            grid=grids.Grid2DIrregularUniform(
+                grid=coordinates, pixel_scales=(pixel_scale, pixel_scale)
+            ),
+            source_plane_coordinate=source_plane_coordinate,
+            distance=self.distance_from_source_centre,
+            source_plane_grid=traced_coordinates,
+        )
+
+        traced_coordinates = traced_coordinates[
+            indexes_of_coordinates_from(
+                coordinates=coordinates_within_distance, grid=coordinates
+            )
+        ]
+
+        coordinates_list, magnifications = self.grid_and_magnifications_above_magnification_threshold_from(
+            lensing_obj=lensing_obj, grid=coordinates_within_distance
+        )
+
+        indexes = indexes_of_coordinates_from(
+            coordinates=coordinates_list, grid=coordinates_within_distance
+        )
+
+        return PositionsSolverResult(
+            positions=grids.Grid2DIrregular(grid=coordinates_list),
+            lensing_obj=lensing_obj,
+            buffer=pixel_scale,
+            source_plane_positions=traced_coordinates[indexes],
+            magnifications=magnifications,
+        )
+
+
+class GradientSolver(AbstractPositionsSolver):
+    def __init__(
+        self,
+        grid,
+        source_plane_tolerance=1e-10,
+        max_iterations=20,
+        buffer=1e-5,
+        magnification_threshold=0.0,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+        critical_curve_upscale_factor=None,
+        critical_curve_buffer=1,
+    ):
+        """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class uses their
+        deflections_from_grid method to determine the (y,x) coordinates the multiple-images appear given a (y,x)
+        source-centre coordinate in the source-plane, and can be used in place of a `PositionsSolver`.
+
+        This is performed as follows:
+
+         1) For an initial input grid, find the 'peak' pixels which trace closer to the centre of the source in the
+            source-plane than their 8 direct neighboring adjacent pixels (this is identical to the `PositionsSolver`).
+         2) Use every peak pixel as the starting point of the Newton-Raphson method, which solves the lens equation
+            using the Jacobian of the lens mapping at each iteration. The Jacobian is computed from the hessian of the
+            lensing object's deflection angles via finite differences.
+         3) Keep the solutions which trace to within `source_plane_tolerance` of the source-plane centre, removing
+            duplicates found from different peak pixels.
+
+        The Newton-Raphson method converges quadratically, thus a solution precise to close to machine precision is
+        typically found in a handful of iterations. The deflection angles of every peak pixel are computed together,
+        such that every iteration requires five calls to the lensing object's deflections_from_grid method (one for
+        the lens equation and four for the hessian), irrespective of the number of peak pixels.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The initial grid whose peak pixels are the starting points of the Newton-Raphson method.
+        source_plane_tolerance : float
+            A solution is converged when its traced (y,x) coordinate is within this distance of the source-plane centre.
+        max_iterations : int
+            The maximum number of Newton-Raphson iterations, after which starting points which have not converged are
+            discarded.
+        buffer : float
+            The spacing of the finite differences used to compute the hessian of the deflection angles.
+        critical_curve_upscale_factor : int or None
+            If input, the peaks of step 1 are also found on a grid of this many times the resolution of the initial
+            grid covering only the bands around the critical curves (see `critical_curve_grid_from`), such that pairs
+            of images merging on a critical curve each have a starting point.
+        critical_curve_buffer : int
+            The number of pixels of the initial grid around every critical pixel covered by the higher resolution grid.
+        """
+
+        super(GradientSolver, self).__init__(
+            use_upscaling=False,
+            magnification_threshold=magnification_threshold,
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+            critical_curve_upscale_factor=critical_curve_upscale_factor,
+            critical_curve_buffer=critical_curve_buffer,
+        )
+
+        self.grid = grid.slim_binned
+        self.source_plane_tolerance = source_plane_tolerance
+        self.max_iterations = max_iterations
+        self.buffer = buffer
+
+    def solutions_from_coordinates(
+        self, coordinates, lensing_obj, source_plane_coordinate
+    ):
+        """Solve the lens equation using the Newton-Raphson method, starting from every input (y,x) coordinate, and
+        return the solutions which converge to the source-plane centre alongside their traced source-plane (y,x)
+        coordinates.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            The (y,x) coordinates that are the starting points of the Newton-Raphson method.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane the solutions trace to.
+        """
+        coordinates, traced_coordinates, is_converged = self.newton_raphson_from(
+            coordinates=coordinates,
+            lensing_obj=lensing_obj,
+            source_plane_coordinates=source_plane_coordinate,
+        )
+
+        return coordinates[is_converged], traced_coordinates[is_converged]
+
+    def newton_raphson_from(self, coordinates, lensing_obj, source_plane_coordinates):
+        """Solve the lens equation using the Newton-Raphson method starting from every input (y,x) coordinate, and
+        return the final coordinates, their traced source-plane (y,x) coordinates and a bool array which is `True` for
+        the coordinates which converged.
+
+        The traced coordinates are those computed by the final iteration of every coordinate, whose deflection angles
+        are therefore never computed again by the solver.
+
+        Every coordinate can have a different source-plane coordinate it is solved for, such that the solutions of
+        many sources are computed with the same calls to the lensing object's deflections_from_grid method.
+
+        The step of every iteration is limited to the pixel scale of the initial grid, which prevents a starting
+        point near a critical curve (where the Jacobian is close to singular) from stepping far from the image it
+        started next to.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            The (y,x) coordinates that are the starting points of the Newton-Raphson method.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinates : (float, float) or np.ndarray
+            The (y,x) coordinate in the source-plane every coordinate is solved for, which is either one coordinate
+            shared by all coordinates or an array with the same shape as the coordinates.
+        """
+        coordinates = np.array(coordinates, dtype="float64").reshape(-1, 2)
+        source_plane_coordinates = np.broadcast_to(
+            np.asarray(source_plane_coordinates, dtype="float64"), coordinates.shape
+        )
+
+        traced_coordinates = np.zeros(shape=coordinates.shape)
+
+        is_converged = np.full(shape=coordinates.shape[0], fill_value=False)
+        is_active = np.full(shape=coordinates.shape[0], fill_value=True)
+
+        for iteration in range(self.max_iterations + 1):
+
+            active_coordinates = coordinates[is_active]
+
+            if active_coordinates.shape[0] == 0:
+                break
+
+            deflections = np.asarray(
+                lensing_obj.deflections_from_grid(grid=active_coordinates)
+            )
+
+            active_indexes = np.where(is_active)[0]
+
+            traced_coordinates[active_indexes] = active_coordinates - deflections
+
+            residuals = (
+                source_plane_coordinates[is_active] - active_coordinates + deflections
+            )
+
+            is_converged_active = (
+                np.sqrt(np.sum(np.square(residuals), axis=1))
+                < self.source_plane_tolerance
+            )
+
+            is_converged[active_indexes[is_converged_active]] = True
+            is_active[active_indexes[is_converged_active]] = False
+
+            if iteration == self.max_iterations or np.all(is_converged_active):
+                break
+
+            active_coordinates = active_coordinates[~is_converged_active]
+            residuals = residuals[~is_converged_active]
+            active_indexes = active_indexes[~is_converged_active]
+
+            coordinates[active_indexes] += newton_steps_from(
+                residuals=residuals,
+                hessian=lensing_obj.hessian_from_grid(
+                    grid=active_coordinates, buffer=self.buffer
+                ),
+                max_step=self.grid.pixel_scale,
+            )
+
+        return coordinates, traced_coordinates, is_converged
+
+    def solve(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
+
+        return self.result_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+        ).positions
+
+    def result_from(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
+        """
+        Returns the multiple images of a source-plane (y,x) coordinate as a `PositionsSolverResult`.
+
+        The traced source-plane coordinates of the images are those computed by the final Newton-Raphson iteration,
+        which are also used to remove images further than `distance_from_source_centre` from the source-plane
+        coordinate, and the magnifications are those computed to remove images below the magnification threshold.
+        The deflection angles of the final images are therefore computed once.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are found.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The initial grid traced to the source-plane, which is computed using the lensing object if it is not input.
+        """
+        grid_peaks_list = self.grid_peaks_of_initial_grid_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+        )
+
+        coordinates_list = grid_peaks_list[0]
+
+        if len(grid_peaks_list) > 1:
+            coordinates_list = grids.Grid2DIrregularUniform(
+                grid=np.concatenate(
+                    [
+                        np.asarray(grid_peaks).reshape(-1, 2)
+                        for grid_peaks in grid_peaks_list
+                    ]
+                ),
+                pixel_scales=self.grid.pixel_scales,
+            )
+
+        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates, traced_coordinates = self.solutions_from_coordinates(
+            coordinates=coordinates_list,
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        indexes = indexes_of_coordinates_from(
+            coordinates=grid_remove_duplicates(grid=coordinates), grid=coordinates
+        )
+
+        coordinates = coordinates[indexes]
+        traced_coordinates = traced_coordinates[indexes]
+
+        if self.distance_from_source_centre is not None:
+
+            is_within_distance = (
+                np.sqrt(
+                    np.sum(
+                        np.square(
+                            traced_coordinates - np.asarray(source_plane_coordinate)
+                        ),
+                        axis=1,
+                    )
+                )
+                < self.distance_from_source_centre
+            )
+
+            coordinates = coordinates[is_within_distance]
+            traced_coordinates = traced_coordinates[is_within_distance]
+
+        coordinates_list, magnifications = self.grid_and_magnifications_above_magnification_threshold_from(
+            lensing_obj=lensing_obj,
+            grid=grids.Grid2DIrregularUniform(
+                grid=coordinates, pixel_scales=(self.buffer, self.buffer)
+            ),
+        )
+
+        indexes = indexes_of_coordinates_from(
+            coordinates=coordinates_list, grid=coordinates
+        )
+
+        return PositionsSolverResult(
+            positions=grids.Grid2DIrregular(grid=coordinates_list),
+            lensing_obj=lensing_obj,
+            buffer=self.buffer,
+            source_plane_positions=traced_coordinates[indexes],
+            magnifications=magnifications,
+        )
+
+
+class WarmStartSolver(GradientSolver):
+    def __init__(
+        self,
+        grid,
+        source_plane_tolerance=1e-10,
+        max_iterations=20,
+        buffer=1e-5,
+        magnification_threshold=0.0,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+        minimum_images=None,
+        refresh_interval=None,
+        critical_curve_upscale_factor=None,
+        critical_curve_buffer=1,
+    ):
+        """A `GradientSolver` which remembers the multiple images it found in its previous call to `solve`, and uses
+        them as the starting points of the Newton-Raphson method the next time it is called.
+
+        During a non-linear search consecutive likelihood evaluations have nearly identical lens models, thus the
+        images of the previous evaluation are close to the images of the current one and converge in a few
+        iterations. This skips the tracing of the initial grid and its peak finding, which dominate the cost of a
+        `GradientSolver`.
+
+        The solver falls back to the full search of the `GradientSolver` (and remembers its solutions) when:
+
+         - It has no previous images, for example on its first call or after `reset` is called.
+         - The number of images found changes, which occurs when a starting point does not converge or two starting
+           points converge to the same image.
+         - Fewer than `minimum_images` images are found (e.g. the number of observed images).
+         - The previous full search was performed `refresh_interval` calls ago, such that images which appear when a
+           source crosses a caustic (and which cannot be found from the previous images) are eventually found.
+
+        The starting points can be set to the observed image positions before the first call using `seed_with`.
+
+        Every parallel process of a non-linear search has its own copy of the solver and therefore its own previous
+        images.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The initial grid used by the full search of the `GradientSolver`.
+        minimum_images : int or None
+            If the number of images found from the previous images is below this value the full search is performed.
+        refresh_interval : int or None
+            The full search is performed every `refresh_interval` calls, irrespective of the previous images.
+        """
+
+        super(WarmStartSolver, self).__init__(
+            grid=grid,
+            source_plane_tolerance=source_plane_tolerance,
+            max_iterations=max_iterations,
+            buffer=buffer,
+            magnification_threshold=magnification_threshold,
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+            critical_curve_upscale_factor=critical_curve_upscale_factor,
+            critical_curve_buffer=critical_curve_buffer,
+        )
+
+        self.minimum_images = minimum_images
+        self.refresh_interval = refresh_interval
+
+        self.coordinates_dict = {}
+        self.calls_since_full_solve_dict = {}
+
+        self.total_solves = 0
+        self.total_warm_solves = 0
+
+    def reset(self):
+        """
+        Forget the previous images of every source, such that the next call to `solve` performs the full search.
+        """
+        self.coordinates_dict = {}
+        self.calls_since_full_solve_dict = {}
+
+    def seed_with(self, coordinates, source_index=0):
+        """
+        Set the starting points of the next call to `solve` (e.g. to the observed image positions).
+
+        Parameters
+        ----------
+        coordinates : aa.Grid2DIrregular or np.ndarray
+            The (y,x) coordinates which are the starting points of the Newton-Raphson method.
+        source_index : int
+            The index of the source (in the source-plane coordinates input into `solve_many`) that is seeded.
+        """
+        self.coordinates_dict[source_index] = np.array(
+            coordinates, dtype="float64"
+        ).reshape(-1, 2)
+        self.calls_since_full_solve_dict[source_index] = 0
+
+    def warm_solve(self, lensing_obj, source_plane_coordinate, source_index=0):
+        """
+        Returns the multiple images found using the previous images of the source as the starting points of the
+        Newton-Raphson method as a `PositionsSolverResult`, or `None` if the full search must be performed instead.
+
+        The images are filtered by the `distance_from_source_centre` and `distance_from_mass_profile_centre` of the
+        solver, as in the full search. If either removes an image the full search is performed, such that the images
+        returned for a lensing object do not depend on the images of the previous call.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane the solutions trace to.
+        source_index : int
+            The index of the source whose previous images are used.
+        """
+        previous_coordinates = self.coordinates_dict.get(source_index)
+
+        if previous_coordinates is None or previous_coordinates.shape[0] == 0:
+            return None
+
+        if self.refresh_interval is not None:
+            if self.calls_since_full_solve_dict[source_index] >= self.refresh_interval:
+                return None
+
+        coordinates, traced_coordinates = self.solutions_from_coordinates(
+            coordinates=previous_coordinates,
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        if coordinates.shape[0] != previous_coordinates.shape[0]:
+            return None
+
+        indexes = indexes_of_coordinates_from(
+            coordinates=grid_remove_duplicates(grid=coordinates), grid=coordinates
+        )
+
+        if indexes.shape[0] != previous_coordinates.shape[0]:
+            return None
+
+        coordinates = coordinates[indexes]
+        traced_coordinates = traced_coordinates[indexes]
+
+        if self.distance_from_source_centre is not None:
+
+            distances_1d = np.sqrt(
+                np.sum(
+                    np.square(traced_coordinates - np.asarray(source_plane_coordinate)),
+                    axis=1,
+                )
+            )
+
+            if np.any(distances_1d >= self.distance_from_source_centre):
+                return None
+
+        if self.distance_from_mass_profile_centre is not None:
+
+            centres = lensing_obj.extract_attribute(cls=mp.MassProfile, name="centre")
+
+            for centre in centres.in_list:
+
+                distances_1d = np.sqrt(
+                    np.square(coordinates[:, 0] - centre[0])
+                    + np.square(coordinates[:, 1] - centre[1])
+                )
+
+                if np.any(distances_1d <= self.distance_from_mass_profile_centre):
+                    return None
+
+        if self.minimum_images is not None:
+            if coordinates.shape[0] < self.minimum_images:
+                return None
+
+        magnifications = np.abs(
+            lensing_obj.magnification_via_hessian_from_grid(
+                grid=grids.Grid2DIrregular(grid=coordinates), buffer=self.buffer
+            )
+        )
+
+        if np.any(magnifications <= self.magnification_threshold):
+            return None
+
+        return PositionsSolverResult(
+            positions=grids.Grid2DIrregular(grid=coordinates),
+            lensing_obj=lensing_obj,
+            buffer=self.buffer,
+            source_plane_positions=traced_coordinates,
+            magnifications=np.asarray(magnifications),
+        )
+
+    def solve(
+        self,
+        lensing_obj,
+        source_plane_coordinate,
+        source_plane_grid=None,
+        source_index=0,
+    ):
+
+        return self.result_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+            source_index=source_index,
+        ).positions
+
+    def result_from(
+        self,
+        lensing_obj,
+        source_plane_coordinate,
+        source_plane_grid=None,
+        source_index=0,
+    ):
+
+        return self.result_from_warm_result(
+            warm_result=self.warm_solve(
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+                source_index=source_index,
+            ),
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+            source_index=source_index,
+        )
+
+    def result_from_warm_result(
+        self,
+        warm_result,
+        lensing_obj,
+        source_plane_coordinate,
+        source_plane_grid=None,
+        source_index=0,
+    ):
+        """
+        Returns the multiple images found by `warm_solve` and remembers them, or performs the full search of the
+        `GradientSolver` if they are `None` and remembers its images instead.
+        """
+        self.total_solves += 1
+
+        if warm_result is not None:
+
+            self.total_warm_solves += 1
+            self.coordinates_dict[source_index] = np.array(
+                warm_result.positions, dtype="float64"
+            ).reshape(-1, 2)
+            self.calls_since_full_solve_dict[source_index] += 1
+
+            return warm_result
+
+        result = super(WarmStartSolver, self).result_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+        )
+
+        self.seed_with(coordinates=result.positions, source_index=source_index)
+
+        return result
+
+    def solve_many(self, lensing_obj, source_plane_coordinates):
+        """
+        Returns the multiple images of every input source-plane (y,x) coordinate, where the previous images of each
+        source are the starting points of its solution (see `solve`).
+
+        The initial grid is traced to the source-plane only if the full search is performed for at least one source,
+        and is then shared by every source whose full search is performed.
+        """
+        positions_list = []
+        source_plane_grid = None
+
+        for (source_index, source_plane_coordinate) in enumerate(
+            source_plane_coordinates
+        ):
+
+            warm_result = self.warm_solve(
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+                source_index=source_index,
+            )
+
+            if warm_result is None and source_plane_grid is None:
+                source_plane_grid = self.source_plane_grid_from(lensing_obj=lensing_obj)
+
+            positions_list.append(
+                self.result_from_warm_result(
+                    warm_result=warm_result,
+                    lensing_obj=lensing_obj,
+                    source_plane_coordinate=source_plane_coordinate,
+                    source_plane_grid=source_plane_grid,
+                    source_index=source_index,
+                ).positions
+            )
+
+        return positions_list
+
+
+class SourcePlaneTriangles:
+    def __init__(self, image_plane_vertices, source_plane_vertices, triangles):
+        """
+        A triangulation of an image-plane grid whose vertices have been traced to the source-plane, with a spatial
+        index over the source-plane triangles which is used to find the triangles that contain a source-plane (y,x)
+        coordinate.
+
+        The index is a uniform grid of bins laid over the source-plane triangles, where every bin stores the indexes
+        of the triangles whose bounding boxes overlap it. Finding the triangles containing a coordinate therefore
+        only tests the triangles in that coordinate's bin, instead of every triangle.
+
+        Every source-plane triangle containing a coordinate corresponds to an image of that coordinate, whose
+        image-plane position is estimated by mapping the coordinate's barycentric coordinates in the source-plane
+        triangle to its image-plane triangle.
+
+        Parameters
+        ----------
+        image_plane_vertices : np.ndarray
+            The (y,x) image-plane coordinates of the triangle vertices, of shape [total_vertices, 2].
+        source_plane_vertices : np.ndarray
+            The (y,x) source-plane coordinates of the triangle vertices, traced from the image-plane vertices.
+        triangles : np.ndarray
+            The indexes of the three vertices of every triangle, of shape [total_triangles, 3].
+        """
+        self.image_plane_vertices = image_plane_vertices
+        self.source_plane_vertices = source_plane_vertices
+
+        is_finite = np.all(np.isfinite(source_plane_vertices[triangles]), axis=(1, 2))
+
+        self.triangles = triangles[is_finite]
+
+        if self.triangles.shape[0] > 0:
+
+            vertices = source_plane_vertices[np.unique(self.triangles)]
+
+            self.origin = np.min(vertices, axis=0)
+
+            total_bins_1d = max(int(np.sqrt(self.triangles.shape[0])), 1)
+
+            self.shape_bins = (total_bins_1d, total_bins_1d)
+            self.bin_scales = np.maximum(
+                (np.max(vertices, axis=0) - self.origin) / total_bins_1d, 1.0e-12
+            )
+
+        else:
+
+            self.origin = np.zeros(2)
+            self.shape_bins = (1, 1)
+            self.bin_scales = np.ones(2)
+
+        self.bin_starts, self.bin_triangle_indexes = triangle_bins_from(
+            source_plane_vertices=source_plane_vertices,
+            triangles=self.triangles,
+            origin=self.origin,
+            bin_scales=self.bin_scales,
+            shape_bins=self.shape_bins,
+        )
+
+    @property
+    def total_triangles(self):
+        return self.triangles.shape[0]
+
+    def image_plane_coordinates_from(self, source_plane_coordinate):
+        """
+        Returns the estimated image-plane (y,x) coordinate of every source-plane triangle that contains the input
+        source-plane (y,x) coordinate, as an ndarray of shape [total_images, 2].
+
+        Parameters
+        ----------
+        source_plane_coordinate : (float, float)
+            The (y,x) source-plane coordinate whose images are found.
+        """
+        return np.asarray(
+            image_plane_coordinates_via_triangles_from(
+                coordinate=np.asarray(source_plane_coordinate, dtype="float64"),
+                image_plane_vertices=self.image_plane_vertices,
+                source_plane_vertices=self.source_plane_vertices,
+                triangles=self.triangles,
+                origin=self.origin,
+                bin_scales=self.bin_scales,
+                shape_bins=self.shape_bins,
+                bin_starts=self.bin_starts,
+                bin_triangle_indexes=self.bin_triangle_indexes,
+            )
+        ).reshape(-1, 2)
+
+
+class TriangleSolver(GradientSolver):
+    def __init__(
+        self,
+        grid,
+        source_plane_tolerance=1e-10,
+        max_iterations=20,
+        buffer=1e-5,
+        magnification_threshold=0.0,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+    ):
+        """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class determines the
+        (y,x) coordinates the multiple-images of one or many (y,x) source-plane coordinates appear, and can be used in
+        place of a `PositionsSolver`.
+
+        This is performed as follows:
+
+         1) Triangulate the initial grid, splitting the square between every four neighboring pixels into two
+            triangles, and trace the vertices of the triangles to the source-plane with one call to the lensing
+            object's deflections_from_grid method.
+         2) Index the source-plane triangles with a uniform grid of bins (see `SourcePlaneTriangles`).
+         3) For every source-plane coordinate, find the source-plane triangles that contain it, each of which
+            contains an image, and estimate the image-plane position of each image by interpolating the triangle.
+         4) Refine the estimated positions of the images of all source-plane coordinates together using the
+            Newton-Raphson method (see `GradientSolver`).
+
+        Steps 1 and 2 are performed once per lensing object, such that the images of many source-plane coordinates
+        (e.g. multiple point sources behind one lens or a catalogue of lensed quasars) are found for little more than
+        the cost of one.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The initial grid which is triangulated, which should extend beyond the images of every source.
+        source_plane_tolerance : float
+            An image is converged when its traced (y,x) coordinate is within this distance of the source-plane
+            coordinate.
+        max_iterations : int
+            The maximum number of Newton-Raphson iterations, after which images which have not converged are discarded.
+        buffer : float
+            The spacing of the finite differences used to compute the hessian of the deflection angles.
+        """
+
+        super(TriangleSolver, self).__init__(
+            grid=grid,
+            source_plane_tolerance=source_plane_tolerance,
+            max_iterations=max_iterations,
+            buffer=buffer,
+            magnification_threshold=magnification_threshold,
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+        )
+
+        self.triangles = triangles_from_mask(mask_2d=np.asarray(self.grid.mask))
+
+    def source_plane_triangles_from(self, lensing_obj, source_plane_grid=None):
+        """
+        Trace the vertices of the triangulated initial grid to the source-plane using the lensing object and return
+        the indexed `SourcePlaneTriangles`.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The initial grid traced to the source-plane, which are the source-plane vertices of the triangles and are
+            computed using the lensing object if it is not input.
+        """
+        image_plane_vertices = np.asarray(self.grid)
+
+        if source_plane_grid is None:
+            source_plane_grid = self.source_plane_grid_from(lensing_obj=lensing_obj)
+
+        return SourcePlaneTriangles(
+            image_plane_vertices=image_plane_vertices,
+            source_plane_vertices=np.asarray(source_plane_grid).reshape(-1, 2),
+            triangles=self.triangles,
+        )
+
+    def solve_many(self, lensing_obj, source_plane_coordinates):
+        """
+        Returns the image-plane (y,x) coordinates of the multiple images of every input source-plane (y,x) coordinate,
+        as a list of `Grid2DIrregular` objects in the same order as the source-plane coordinates.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) source-plane coordinates whose multiple images are found.
+        """
+        return [
+            result.positions
+            for result in self.results_many_from(
+                lensing_obj=lensing_obj,
+                source_plane_coordinates=source_plane_coordinates,
+            )
+        ]
+
+    def results_many_from(
+        self, lensing_obj, source_plane_coordinates, source_plane_grid=None
+    ):
+        """
+        Returns the multiple images of every input source-plane (y,x) coordinate as a list of
+        `PositionsSolverResult` objects in the same order as the source-plane coordinates.
+
+        The traced source-plane coordinates of the images are those computed by the final Newton-Raphson iteration,
+        which are also used to remove images further than `distance_from_source_centre` from their source-plane
+        coordinate, and the magnifications are those computed to remove images below the magnification threshold,
+        such that the fits that use the images do not compute them again.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) source-plane coordinates whose multiple images are found.
+        source_plane_grid : autoarray.Grid2DIrregularUniform or ndarray
+            The initial grid traced to the source-plane, which is computed using the lensing object if it is not input.
+        """
+        source_plane_triangles = self.source_plane_triangles_from(
+            lensing_obj=lensing_obj, source_plane_grid=source_plane_grid
+        )
+
+        coordinates_list = []
+        source_indexes = []
+
+        for (source_index, source_plane_coordinate) in enumerate(
+            source_plane_coordinates
+        ):
+
+            coordinates = source_plane_triangles.image_plane_coordinates_from(
+                source_plane_coordinate=source_plane_coordinate
+            )
+
+            coordinates_list.append(coordinates)
+            source_indexes += [source_index] * coordinates.shape[0]
+
+        coordinates = np.concatenate(coordinates_list + [np.zeros((0, 2))])
+        source_indexes = np.asarray(source_indexes, dtype="int")
+
+        if self.distance_from_mass_profile_centre is not None:
+
+            centres = lensing_obj.extract_attribute(cls=mp.MassProfile, name="centre")
+
+            for centre in centres.in_list:
+
+                distances_1d = np.sqrt(
+                    np.square(coordinates[:, 0] - centre[0])
+                    + np.square(coordinates[:, 1] - centre[1])
+                )
+
+                is_outside = distances_1d > self.distance_from_mass_profile_centre
+
+                coordinates = coordinates[is_outside]
+                source_indexes = source_indexes[is_outside]
+
+        source_plane_coordinates_of_images = np.asarray(
+            source_plane_coordinates, dtype="float64"
+        ).reshape(-1, 2)[source_indexes]
+
+        coordinates, traced_coordinates, is_converged = self.newton_raphson_from(
+            coordinates=coordinates,
+            lensing_obj=lensing_obj,
+            source_plane_coordinates=source_plane_coordinates_of_images,
+        )
+
+        coordinates = coordinates[is_converged]
+        traced_coordinates = traced_coordinates[is_converged]
+        source_indexes = source_indexes[is_converged]
+
+        if self.distance_from_source_centre is not None:
+
+            is_within_distance = (
+                np.sqrt(
+                    np.sum(
+                        np.square(
+                            traced_coordinates
+                            - source_plane_coordinates_of_images[is_converged]
+                        ),
+                        axis=1,
+                    )
+                )
+                < self.distance_from_source_centre
+            )
+
+            coordinates = coordinates[is_within_distance]
+            traced_coordinates = traced_coordinates[is_within_distance]
+            source_indexes = source_indexes[is_within_distance]
+
+        magnifications = np.zeros(shape=coordinates.shape[0])
+
+        if coordinates.shape[0] > 0:
+
+            magnifications = np.abs(
+                np.asarray(
+                    lensing_obj.magnification_via_hessian_from_grid(
+                        grid=grids.Grid2DIrregular(grid=coordinates),
+                        buffer=self.buffer,
+                    )
+                )
+            )
+
+            is_magnified = magnifications > self.magnification_threshold
+
+            coordinates = coordinates[is_magnified]
+            traced_coordinates = traced_coordinates[is_magnified]
+            magnifications = magnifications[is_magnified]
+            source_indexes = source_indexes[is_magnified]
+
+        results = []
+
+        for source_index in range(len(source_plane_coordinates)):
+
+            is_source = source_indexes == source_index
+
+            coordinates_of_source = coordinates[is_source]
+
+            indexes = indexes_of_coordinates_from(
+                coordinates=grid_remove_duplicates(grid=coordinates_of_source),
+                grid=coordinates_of_source,
+            )
+
+            results.append(
+                PositionsSolverResult(
+                    positions=grids.Grid2DIrregular(
+                        grid=coordinates_of_source[indexes]
+                    ),
+                    lensing_obj=lensing_obj,
+                    buffer=self.buffer,
+                    source_plane_positions=traced_coordinates[is_source][indexes],
+                    magnifications=magnifications[is_source][indexes],
+                )
+            )
+
+        return results
+
+    def solve(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
+        return self.result_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            source_plane_grid=source_plane_grid,
+        ).positions
+
+    def result_from(self, lensing_obj, source_plane_coordinate, source_plane_grid=None):
+        return self.results_many_from(
+            lensing_obj=lensing_obj,
+            source_plane_coordinates=[source_plane_coordinate],
+            source_plane_grid=source_plane_grid,
+        )[0]
+
+
+def newton_steps_from(residuals, hessian, max_step):
+    """
+    Returns the Newton-Raphson step of every (y,x) coordinate being solved for by the `GradientSolver`, which solves
+    the linear system J * step = residual where J is the Jacobian of the lens equation (i.e. the derivatives of the
+    traced source-plane coordinates with respect to the image-plane coordinates).
+
+    The Jacobian is computed from the hessian of the deflection angles, J = I - H. Steps larger than `max_step` are
+    rescaled to this length.
+
+    Parameters
+    ----------
+    residuals : np.ndarray
+        The (y,x) source-plane centre minus the traced (y,x) coordinate of every coordinate, of shape [total_coordinates,
+        2].
+    hessian : (np.ndarray, np.ndarray, np.ndarray, np.ndarray)
+        The yy, xy, yx and xx components of the hessian of every coordinate (see `LensingObject.hessian_from_grid`).
+    max_step : float
+        The maximum length of a step.
+    """
+    hessian_yy, hessian_xy, hessian_yx, hessian_xx = [
+        np.asarray(component) for component in hessian
+    ]
+
+    jacobian_yy = 1.0 - hessian_yy
+    jacobian_yx = -hessian_yx
+    jacobian_xy = -hessian_xy
+    jacobian_xx = 1.0 - hessian_xx
+
+    determinant = jacobian_yy * jacobian_xx - jacobian_yx * jacobian_xy
+
+    steps = np.zeros(shape=residuals.shape)
+
+    steps[:, 0] = (
+        jacobian_xx * residuals[:, 0] - jacobian_yx * residuals[:, 1]
+    ) / determinant
+    steps[:, 1] = (
+        jacobian_yy * residuals[:, 1] - jacobian_xy * residuals[:, 0]
+    ) / determinant
+
+    step_sizes = np.sqrt(np.sum(np.square(steps), axis=1))
+
+    too_large = step_sizes > max_step
+
+    steps[too_large] *= (max_step / step_sizes[too_large])[:, None]
+
+    return np.nan_to_num(steps)
+
+
+def indexes_of_coordinates_from(coordinates, grid):
+    """
+    Returns the index in a grid of every input (y,x) coordinate, where every coordinate must be exactly equal to a
+    coordinate of the grid (e.g. the coordinates kept by `grid_remove_duplicates`). If a coordinate appears in the grid
+    more than once the index of its last appearance is returned.
+
+    This is used to select the quantities a solver has computed for every coordinate of a grid (e.g. their traced
+    source-plane coordinates) for the coordinates that remain after some are removed.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray or [(float, float)]
+        The (y,x) coordinates whose indexes in the grid are returned.
+    grid : np.ndarray
+        The grid of (y,x) coordinates of shape [total_coordinates, 2] that contains every coordinate.
+    """
+    index_dict = {
+        (y, x): index
+        for (index, (y, x)) in enumerate(np.asarray(grid).reshape(-1, 2).tolist())
+    }
+
+    return np.asarray(
+        [
+            index_dict[(y, x)]
+            for (y, x) in np.asarray(coordinates).reshape(-1, 2).tolist()
+        ],
+        dtype="int",
+    )
+
+
+@decorator_util.jit()
+def grid_remove_duplicates(grid):
+    """
+    Remove the duplicate (y,x) coordinates from a grid, where two coordinates are duplicates if they are separated
+    by less than a tolerance of 1e-8. Of every set of duplicates the coordinate that is last in the grid is kept, and
+    the coordinates that are kept are returned in the order they appear in the grid.
+
+    Duplicates are found using a spatial hash, which buckets the coordinates into rows of height equal to the
+    tolerance and sorts the coordinates of every row by their x value. Two duplicates must be in the same or adjacent
+    rows and within the tolerance in x, thus every coordinate is only compared to the coordinates after it in its own
+    row and the coordinates of the next row found via a binary search. This scales as O(N log N) in the number of
+    coordinates, as opposed to computing the separation of every pair of coordinates.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The grid of (y,x) coordinates of shape [total_coordinates, 2] whose duplicates are removed.
+    """
+
+    tolerance = 1e-8
+
+    grid_no_duplicates = []
+
+    is_duplicate = np.full(shape=grid.shape[0], fill_value=False)
+
+    rows = np.floor(grid[:, 0] / tolerance)
+
+    sorted_indexes = np.argsort(grid[:, 1])
+    sorted_indexes = sorted_indexes[
+        np.argsort(rows[sorted_indexes], kind="mergesort")
+    ]
+
+    sorted_rows = rows[sorted_indexes]
+    sorted_x = grid[sorted_indexes, 1]
+
+    for sorted_index in range(grid.shape[0]):
+
+        i = sorted_indexes[sorted_index]
+
+        row_end = np.searchsorted(sorted_rows, sorted_rows[sorted_index], side="right")
+        next_row_start = row_end
+        next_row_end = np.searchsorted(
+            sorted_rows, sorted_rows[sorted_index] + 1.0, side="right"
+        )
+
+        next_row_start += np.searchsorted(
+            sorted_x[next_row_start:next_row_end], sorted_x[sorted_index] - tolerance
+        )
+
+        for (start, end) in ((sorted_index + 1, row_end), (next_row_start, next_row_end)):
+
+            for compare_index in range(start, end):
+
+                if sorted_x[compare_index] - sorted_x[sorted_index] >= tolerance:
+                    break
+
+                j = sorted_indexes[compare_index]
+
+                if (
+                    np.sqrt(
+                        np.square(grid[i, 0] - grid[j, 0])
+                        + np.square(grid[i, 1] - grid[j, 1])
+                    )
+                    < tolerance
+                ):
+
+                    is_duplicate[min(i, j)] = True
+
+    for i in range(grid.shape[0]):
+
+        if not is_duplicate[i]:
+            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+
+    return grid_no_duplicates
+
+
+@decorator_util.jit()
+def grid_buffed_around_coordinate_from(
+    coordinate, pixel_scales, buffer, upscale_factor=1
 ):
     """
     From an input 1D grid, return a 1D buffed grid where (y,x) coordinates are added next to all grid pixels whose
@@ -482,6 +2188,47 @@ def grid_buffed_around_coordinate_from(
     return grid_slim
 
 
+@decorator_util.jit()
+def grids_buffed_around_coordinates_from(
+    coordinates, pixel_scales, buffer, upscale_factor=1
+):
+    """
+    For an input grid of (y,x) coordinates, create the buffed and upscaled grid around every coordinate (see
+    `grid_buffed_around_coordinate_from`) and stack them into one grid, where the grid of the first coordinate is
+    followed by the grid of the second coordinate and so on.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray
+        The (y,x) coordinates around which the buffed and upscaled grids are created.
+    pixel_scales : (float, float)
+        The pixel scale of the grids before they are upscaled.
+    buffer : int
+        The number of pixels around every (y,x) coordinate that its grid is computed on.
+    upscale_factor : int
+        The factor by which the resolution of the grids is increased relative to the input pixel-scales.
+    """
+
+    total_coordinates_per_block = (upscale_factor * (2 * buffer + 1)) ** 2
+
+    grid_slim = np.zeros(shape=(coordinates.shape[0] * total_coordinates_per_block, 2))
+
+    for coordinate_index in range(coordinates.shape[0]):
+
+        block_start = coordinate_index * total_coordinates_per_block
+
+        grid_slim[
+            block_start : block_start + total_coordinates_per_block, :
+        ] = grid_buffed_around_coordinate_from(
+            coordinate=(coordinates[coordinate_index, 0], coordinates[coordinate_index, 1]),
+            pixel_scales=pixel_scales,
+            buffer=buffer,
+            upscale_factor=upscale_factor,
+        )
+
+    return grid_slim
+
+
 @decorator_util.jit()
 def pair_coordinate_to_closest_pixel_on_grid(coordinate, grid_slim):
 
@@ -533,7 +2280,7 @@ def grid_square_neighbors_1d_from(shape_slim):
     shape_of_edge = int(np.sqrt(shape_slim))
 
     has_neighbors = np.full(shape=shape_slim, fill_value=False)
-    neighbors_1d = np.full(shape=(shape_slim, 8), fill_value=-1.0)
+    neighbors_1d = np.full(shape=(shape_slim, 8), fill_value=-1)
 
     index = 0
 
@@ -558,6 +2305,30 @@ def grid_square_neighbors_1d_from(shape_slim):
     return neighbors_1d, has_neighbors
 
 
+@functools.lru_cache(maxsize=64)
+def grid_square_neighbors_1d_cached_from(shape_slim):
+    """
+    Returns the neighbors and has neighbors arrays of a square grid of (y,x) coordinates (see
+    `grid_square_neighbors_1d_from`), which are cached by the number of coordinates of the grid.
+
+    The `PositionsSolver` finds the peaks of grids of the same size many times, for example the buffed and upscaled
+    grid around every coordinate which always has (upscale_factor * (2 * buffer + 1))**2 coordinates, thus caching
+    these arrays means they are only created once. The cached arrays are shared by every call and are therefore
+    read-only.
+
+    Parameters
+    ----------
+    shape_slim : int
+        The number of (y,x) coordinates of the square grid.
+    """
+    neighbors_1d, has_neighbors = grid_square_neighbors_1d_from(shape_slim=shape_slim)
+
+    neighbors_1d.setflags(write=False)
+    has_neighbors.setflags(write=False)
+
+    return neighbors_1d, has_neighbors
+
+
 @decorator_util.jit()
 def grid_peaks_from(distance_1d, grid_slim, neighbors, has_neighbors):
     """Given an input grid of (y,x) coordinates and a 1d array of their distances to the centre of the source,
@@ -602,6 +2373,111 @@ def grid_peaks_from(distance_1d, grid_slim, neighbors, has_neighbors):
     return peaks_list
 
 
+@decorator_util.jit()
+def grid_peaks_of_blocks_from(
+    distance_1d, grid_slim, neighbors, has_neighbors, total_coordinates_per_block
+):
+    """Given an input grid of (y,x) coordinates which is made of blocks of square grids of the same size (e.g. the
+    buffed and upscaled grids of many coordinates, see `grids_buffed_around_coordinates_from`) and a 1d array of
+    their distances to the centre of the source, determine the coordinates of every block which are closer to the
+    source than their 8 neighboring pixels in that block.
+
+    The peaks are returned in the order of the blocks, and are identical to calling `grid_peaks_from` on every block.
+
+    Parameters
+    ----------
+    distance_1d : np.ndarray
+        The distance of every (y,x) grid coordinate to the centre of the source in the source-plane.
+    grid_slim : np.ndarray
+        The irregular 1D grid of (y,x) coordinates whose distances to the source are compared.
+    neighbors : np.ndarray
+        A 2D array of shape [total_coordinates_per_block, 8] giving the 1D index of every pixel of a block to its 8
+        neighboring pixels in that block.
+    has_neighbors : np.ndarray
+        An array of bools, where `True` means a pixel of a block has 8 neighbors and `False` means it has less than 8
+        and is not compared to the source distance.
+    total_coordinates_per_block : int
+        The number of (y,x) coordinates in every block.
+    """
+    peaks_list = []
+
+    for block_start in range(0, grid_slim.shape[0], total_coordinates_per_block):
+
+        for block_index in range(total_coordinates_per_block):
+
+            if has_neighbors[block_index]:
+
+                distance = distance_1d[block_start + block_index]
+
+                is_peak = True
+
+                for neighbor_index in range(8):
+
+                    if not (
+                        distance
+                        <= distance_1d[block_start + neighbors[block_index, neighbor_index]]
+                    ):
+                        is_peak = False
+                        break
+
+                if is_peak:
+                    peaks_list.append(
+                        (
+                            grid_slim[block_start + block_index, 0],
+                            grid_slim[block_start + block_index, 1],
+                        )
+                    )
+
+    return peaks_list
+
+
+@decorator_util.jit()
+def grid_critical_pixels_from(determinants, neighbors, has_neighbors, max_determinant):
+    """Given the determinant of the Jacobian of the lens mapping (the inverse magnification) of every (y,x) coordinate
+    of a square grid, determine the critical pixels, whose determinant has a different sign to that of at least one of
+    their 8 neighboring pixels (or is zero). A critical curve of the lensing object passes between these pixels.
+
+    A sign change is only counted between two pixels whose determinants are both finite and no larger than
+    `max_determinant` in absolute value. The determinant is zero on a critical curve, so it is small for the pixels
+    either side of it, whereas next to the centre of a singular mass profile (e.g. an isothermal sphere) the
+    determinant is large and changes sign only because the hessian, computed via finite differences, is inaccurate.
+
+    Parameters
+    ----------
+    determinants : np.ndarray
+        The determinant of the Jacobian of every (y,x) grid coordinate.
+    neighbors : np.ndarray
+        A 2D array of shape [pixels, 8] giving the 1D index of every grid pixel to its 8 neighboring pixels.
+    has_neighbors : np.ndarray
+        An array of bools, where `True` means a pixel has 8 neighbors and `False` means it has less than 8 and is not
+        compared to its neighbors.
+    max_determinant : float
+        The maximum absolute determinant of two pixels whose sign change is counted.
+    """
+    is_critical = np.full(shape=determinants.shape[0], fill_value=False)
+
+    for grid_index in range(determinants.shape[0]):
+
+        if has_neighbors[grid_index] and (
+            np.abs(determinants[grid_index]) <= max_determinant
+        ):
+
+            for neighbor_index in range(8):
+
+                neighbor_determinant = determinants[
+                    neighbors[grid_index, neighbor_index]
+                ]
+
+                if (
+                    np.abs(neighbor_determinant) <= max_determinant
+                    and determinants[grid_index] * neighbor_determinant <= 0.0
+                ):
+                    is_critical[grid_index] = True
+                    break
+
+    return is_critical
+
+
 @decorator_util.jit()
 def grid_within_distance(distances_1d, grid_slim, within_distance):
 
@@ -642,3 +2518,256 @@ def grid_outside_distance_mask_from(distances_1d, grid_slim, outside_distance):
             grid_outside_index += 1
 
     return grid_outside
+
+
+@decorator_util.jit()
+def triangles_from_mask(mask_2d):
+    """
+    Triangulate the grid of a 2D mask, by splitting the square between every four neighboring unmasked pixels into
+    two triangles, and return the slim indexes of the three vertices of every triangle.
+
+    For the square between the pixels with 2D indexes (y, x), (y, x+1), (y+1, x) and (y+1, x+1) the two triangles
+    are [(y, x), (y, x+1), (y+1, x)] and [(y, x+1), (y+1, x+1), (y+1, x)]. Squares which have a masked pixel at one of
+    their corners are not triangulated.
+
+    Parameters
+    ----------
+    mask_2d : np.ndarray
+        The 2D mask whose unmasked pixels are the vertices of the triangles.
+    """
+    slim_indexes = np.full(shape=mask_2d.shape, fill_value=-1)
+
+    slim_index = 0
+
+    for y in range(mask_2d.shape[0]):
+        for x in range(mask_2d.shape[1]):
+            if not mask_2d[y, x]:
+                slim_indexes[y, x] = slim_index
+                slim_index += 1
+
+    total_triangles = 0
+
+    for y in range(mask_2d.shape[0] - 1):
+        for x in range(mask_2d.shape[1] - 1):
+            if (
+                slim_indexes[y, x] >= 0
+                and slim_indexes[y, x + 1] >= 0
+                and slim_indexes[y + 1, x] >= 0
+                and slim_indexes[y + 1, x + 1] >= 0
+            ):
+                total_triangles += 2
+
+    triangles = np.zeros(shape=(total_triangles, 3), dtype=np.int64)
+
+    triangle_index = 0
+
+    for y in range(mask_2d.shape[0] - 1):
+        for x in range(mask_2d.shape[1] - 1):
+            if (
+                slim_indexes[y, x] >= 0
+                and slim_indexes[y, x + 1] >= 0
+                and slim_indexes[y + 1, x] >= 0
+                and slim_indexes[y + 1, x + 1] >= 0
+            ):
+
+                triangles[triangle_index, 0] = slim_indexes[y, x]
+                triangles[triangle_index, 1] = slim_indexes[y, x + 1]
+                triangles[triangle_index, 2] = slim_indexes[y + 1, x]
+
+                triangles[triangle_index + 1, 0] = slim_indexes[y, x + 1]
+                triangles[triangle_index + 1, 1] = slim_indexes[y + 1, x + 1]
+                triangles[triangle_index + 1, 2] = slim_indexes[y + 1, x]
+
+                triangle_index += 2
+
+    return triangles
+
+
+@decorator_util.jit()
+def bin_index_from(value, origin, bin_scale, total_bins):
+    """
+    Returns the index of the bin of a uniform grid of bins that a value is in, where values outside the grid of bins
+    are paired to the first or last bin.
+    """
+    bin_index = int(np.floor((value - origin) / bin_scale))
+
+    if bin_index < 0:
+        return 0
+    if bin_index > total_bins - 1:
+        return total_bins - 1
+
+    return bin_index
+
+
+@decorator_util.jit()
+def triangle_bins_from(
+    source_plane_vertices, triangles, origin, bin_scales, shape_bins
+):
+    """
+    Index a set of source-plane triangles with a uniform grid of bins, by pairing every triangle with every bin that
+    its bounding box overlaps.
+
+    The index is returned in a compressed format of two arrays, where the indexes of the triangles paired with the
+    bin with 1D index i are bin_triangle_indexes[bin_starts[i]:bin_starts[i + 1]].
+
+    Parameters
+    ----------
+    source_plane_vertices : np.ndarray
+        The (y,x) source-plane coordinates of the triangle vertices.
+    triangles : np.ndarray
+        The indexes of the three vertices of every triangle.
+    origin : np.ndarray
+        The (y,x) coordinate of the bottom-left corner of the grid of bins.
+    bin_scales : np.ndarray
+        The (y,x) size of every bin.
+    shape_bins : (int, int)
+        The number of bins in the y and x directions.
+    """
+    total_bins = shape_bins[0] * shape_bins[1]
+
+    bin_ranges = np.zeros(shape=(triangles.shape[0], 4), dtype=np.int64)
+
+    bin_counts = np.zeros(shape=total_bins, dtype=np.int64)
+
+    for triangle_index in range(triangles.shape[0]):
+
+        y_min = np.inf
+        y_max = -np.inf
+        x_min = np.inf
+        x_max = -np.inf
+
+        for vertex in range(3):
+
+            y = source_plane_vertices[triangles[triangle_index, vertex], 0]
+            x = source_plane_vertices[triangles[triangle_index, vertex], 1]
+
+            y_min = min(y_min, y)
+            y_max = max(y_max, y)
+            x_min = min(x_min, x)
+            x_max = max(x_max, x)
+
+        bin_ranges[triangle_index, 0] = bin_index_from(
+            y_min, origin[0], bin_scales[0], shape_bins[0]
+        )
+        bin_ranges[triangle_index, 1] = bin_index_from(
+            y_max, origin[0], bin_scales[0], shape_bins[0]
+        )
+        bin_ranges[triangle_index, 2] = bin_index_from(
+            x_min, origin[1], bin_scales[1], shape_bins[1]
+        )
+        bin_ranges[triangle_index, 3] = bin_index_from(
+            x_max, origin[1], bin_scales[1], shape_bins[1]
+        )
+
+        for bin_y in range(bin_ranges[triangle_index, 0], bin_ranges[triangle_index, 1] + 1):
+            for bin_x in range(
+                bin_ranges[triangle_index, 2], bin_ranges[triangle_index, 3] + 1
+            ):
+                bin_counts[bin_y * shape_bins[1] + bin_x] += 1
+
+    bin_starts = np.zeros(shape=total_bins + 1, dtype=np.int64)
+    bin_starts[1:] = np.cumsum(bin_counts)
+
+    bin_triangle_indexes = np.zeros(shape=bin_starts[-1], dtype=np.int64)
+
+    bin_fill = bin_starts[:-1].copy()
+
+    for triangle_index in range(triangles.shape[0]):
+        for bin_y in range(bin_ranges[triangle_index, 0], bin_ranges[triangle_index, 1] + 1):
+            for bin_x in range(
+                bin_ranges[triangle_index, 2], bin_ranges[triangle_index, 3] + 1
+            ):
+
+                bin_index = bin_y * shape_bins[1] + bin_x
+
+                bin_triangle_indexes[bin_fill[bin_index]] = triangle_index
+                bin_fill[bin_index] += 1
+
+    return bin_starts, bin_triangle_indexes
+
+
+@decorator_util.jit()
+def image_plane_coordinates_via_triangles_from(
+    coordinate,
+    image_plane_vertices,
+    source_plane_vertices,
+    triangles,
+    origin,
+    bin_scales,
+    shape_bins,
+    bin_starts,
+    bin_triangle_indexes,
+):
+    """
+    Find the source-plane triangles which contain a source-plane (y,x) coordinate, using the uniform grid of bins
+    computed by `triangle_bins_from`, and return the image-plane (y,x) coordinate of every containing triangle
+    computed by interpolating the image-plane triangle with the coordinate's barycentric coordinates.
+
+    Parameters
+    ----------
+    coordinate : np.ndarray
+        The (y,x) source-plane coordinate whose containing triangles are found.
+    image_plane_vertices : np.ndarray
+        The (y,x) image-plane coordinates of the triangle vertices.
+    source_plane_vertices : np.ndarray
+        The (y,x) source-plane coordinates of the triangle vertices.
+    triangles : np.ndarray
+        The indexes of the three vertices of every triangle.
+    """
+    coordinates_list = []
+
+    if (
+        coordinate[0] < origin[0]
+        or coordinate[1] < origin[1]
+        or coordinate[0] > origin[0] + shape_bins[0] * bin_scales[0]
+        or coordinate[1] > origin[1] + shape_bins[1] * bin_scales[1]
+    ):
+        return coordinates_list
+
+    bin_index = bin_index_from(
+        coordinate[0], origin[0], bin_scales[0], shape_bins[0]
+    ) * shape_bins[1] + bin_index_from(
+        coordinate[1], origin[1], bin_scales[1], shape_bins[1]
+    )
+
+    for index in range(bin_starts[bin_index], bin_starts[bin_index + 1]):
+
+        triangle_index = bin_triangle_indexes[index]
+
+        vertex_0 = triangles[triangle_index, 0]
+        vertex_1 = triangles[triangle_index, 1]
+        vertex_2 = triangles[triangle_index, 2]
+
+        y_0 = source_plane_vertices[vertex_0, 0]
+        x_0 = source_plane_vertices[vertex_0, 1]
+
+        v0_y = source_plane_vertices[vertex_1, 0] - y_0
+        v0_x = source_plane_vertices[vertex_1, 1] - x_0
+        v1_y = source_plane_vertices[vertex_2, 0] - y_0
+        v1_x = source_plane_vertices[vertex_2, 1] - x_0
+        v2_y = coordinate[0] - y_0
+        v2_x = coordinate[1] - x_0
+
+        determinant = v0_y * v1_x - v0_x * v1_y
+
+        if determinant == 0.0:
+            continue
+
+        weight_1 = (v2_y * v1_x - v2_x * v1_y) / determinant
+        weight_2 = (v0_y * v2_x - v0_x * v2_y) / determinant
+        weight_0 = 1.0 - weight_1 - weight_2
+
+        if weight_0 >= 0.0 and weight_1 >= 0.0 and weight_2 >= 0.0:
+
+            coordinates_list.append(
+                (
+                    weight_0 * image_plane_vertices[vertex_0, 0]
+                    + weight_1 * image_plane_vertices[vertex_1, 0]
+                    + weight_2 * image_plane_vertices[vertex_2, 0],
+                    weight_0 * image_plane_vertices[vertex_0, 1]
+                    + weight_1 * image_plane_vertices[vertex_1, 1]
+                    + weight_2 * image_plane_vertices[vertex_2, 1],
+                )
+            )
+
+    return coordinates_list
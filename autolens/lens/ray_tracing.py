@@ -1,20 +1,43 @@
 from abc import ABC
+from concurrent import futures
+from functools import wraps
+import os
 import pickle
 import numpy as np
+import weakref
 from os import path
 from astropy import cosmology as cosmo
+from autoconf import conf
 from autoarray.inversion import pixelizations as pix
 from autoarray.inversion import inversions as inv
+from autoarray.exc import InversionException
 from autoarray.structures import arrays, grids
+from autoarray.util import inversion_util
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
 from autogalaxy.plane import plane as pl
-from autogalaxy.util import cosmology_util
 from autogalaxy.util import plane_util
+from autolens import exc
+from autolens.fit import preloads as pload
+from autolens.lens import cosmology_cache
+
+precisions = ("float64", "float32")
+
+
+def grid_chunk_size_from_config():
+    """
+    Returns the number of (y,x) coordinates in every chunk of a grid which is traced in chunks (see
+    `Tracer.traced_grids_of_planes_from_grid_in_chunks`), which is the value in the ray_tracing section of the
+    general config.
+
+    The value is read when a grid is traced, as opposed to when this module is imported, such that the default
+    config of autolens is registered and the config of a workspace can change it.
+    """
+    return conf.instance["general"]["ray_tracing"]["chunk_size"]
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
-    def __init__(self, planes, cosmology):
+    def __init__(self, planes, cosmology, precision="float64"):
         """Ray-tracer for a lens system with any number of planes.
 
         The redshift of these planes are specified by the redshits of the galaxies; there is a unique plane redshift \
@@ -37,10 +60,178 @@ class AbstractTracer(lensing.LensingObject, ABC):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        precision : str
+            The floating point precision, "float64" or "float32", in which the traced grids, deflection angles and
+            images computed by the tracer are stored. In "float32" the input grid is cast to single precision before
+            it is traced, halving the memory and bandwidth of these arrays. The precision only applies to their
+            storage: the light and mass profiles of autogalaxy compute in double precision, with their outputs cast
+            to single precision, and sums over many values (e.g. the PSF convolution and chi-squared of a fit) are
+            accumulated in double precision.
         """
+        if precision not in precisions:
+            raise exc.SettingsException(
+                f"The precision of a Tracer must be one of {precisions}, not {precision}"
+            )
+
         self.planes = planes
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
+        self.precision = precision
+
+        self.plane_indexes_with_mass_profile = [
+            plane_index
+            for (plane_index, plane) in enumerate(planes)
+            if plane.has_mass_profile
+        ]
+
+        self._distances_and_factors_of_planes = None
+        self._traced_grids_cache = {}
+
+    def __getstate__(self):
+        """
+        The traced grids cache holds weak references to grids, which cannot be pickled, therefore it is removed when
+        the tracer is pickled (e.g. by `save` or when it is passed to a parallel process).
+        """
+        state = self.__dict__.copy()
+        state.pop("_traced_grids_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("precision", "float64")
+        state.setdefault("_distances_and_factors_of_planes", None)
+        self.__dict__.update(state)
+        self._traced_grids_cache = {}
+
+    def _traced_grids_from_cache(self, grid, plane_index_limit):
+        """
+        Returns the cached traced grids of a grid up to the plane with index `plane_index_limit`, or `None` if the
+        grid has not been traced by this tracer to this plane (see `cache_traced_grids`).
+
+        The grids returned are the cached objects themselves, which must be copied before they are returned to the
+        caller of the tracer.
+        """
+        cache_entry = self._traced_grids_cache.get(id(grid))
+
+        if cache_entry is None:
+            return None
+
+        grid_ref, traced_grids_of_plane_index_limits = cache_entry
+
+        if grid_ref() is not grid:
+            self._traced_grids_cache.pop(id(grid), None)
+            return None
+
+        for (
+            cached_plane_index_limit,
+            traced_grids,
+        ) in list(traced_grids_of_plane_index_limits.items()):
+            if cached_plane_index_limit >= plane_index_limit:
+                return traced_grids[: plane_index_limit + 1]
+
+    def _traced_grids_to_cache(self, grid, plane_index_limit, traced_grids):
+        """
+        Store the traced grids of a grid up to the plane with index `plane_index_limit` in the cache, removing the
+        entries of grids which have been deleted (see `cache_traced_grids`).
+
+        Plain NumPy arrays are not cached, as these are temporary arrays created by the tracer (e.g. the chunks of a
+        grid traced in chunks).
+
+        The cache may be used by many threads at once (e.g. the stochastic resamples of a fit, see
+        `Analysis.stochastic_map`), thus it is only changed via single dictionary operations, which are atomic.
+        """
+        if type(grid) is np.ndarray:
+            return
+
+        try:
+            grid_ref = weakref.ref(grid)
+        except TypeError:
+            return
+
+        for grid_id in [
+            grid_id
+            for (grid_id, (cached_grid_ref, _)) in list(
+                self._traced_grids_cache.items()
+            )
+            if cached_grid_ref() is None
+        ]:
+            self._traced_grids_cache.pop(grid_id, None)
+
+        self._traced_grids_cache.setdefault(id(grid), (grid_ref, {}))[1][
+            plane_index_limit
+        ] = traced_grids
+
+    def traced_grids_cache_clear(self):
+        """
+        Clear the traced grids cache of the tracer, which must be called if a grid that has already been traced is
+        changed in-place and traced again by the same tracer.
+        """
+        self._traced_grids_cache.clear()
+
+    def preload_traced_grids_of_planes(self, grid, traced_grids_of_planes):
+        """
+        Load the traced grids of every plane of a grid into the traced grids cache of the tracer, such that the grid
+        is not ray-traced by the tracer (see `Preloads`).
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The image-plane grid whose traced grids are loaded.
+        traced_grids_of_planes : [aa.Grid2D]
+            The traced grids of the grid in every plane of the tracer.
+        """
+        self._traced_grids_to_cache(
+            grid=grid,
+            plane_index_limit=self.total_planes - 1,
+            traced_grids=traced_grids_of_planes,
+        )
+
+    def distances_and_factors_of_planes_from(self):
+        """
+        Returns the angular diameter distances of the planes and between the planes, and the scaling factors and
+        recursion factors between planes used for multi-plane ray-tracing (see `traced_grids_of_planes_from_grid`).
+
+        These are computed the first time they are used and stored by the tracer, as opposed to when the tracer is
+        created, so that tracers which never use them (e.g. a tracer with a single plane) do not use the cosmology.
+        """
+        if self._distances_and_factors_of_planes is None:
+
+            (
+                distances_of_planes,
+                distances_between_planes,
+            ) = angular_diameter_distances_of_planes_from(
+                plane_redshifts=self.plane_redshifts, cosmology=self.cosmology
+            )
+
+            self._distances_and_factors_of_planes = (
+                distances_of_planes,
+                distances_between_planes,
+                scaling_factors_between_planes_from(
+                    angular_diameter_distances_of_planes=distances_of_planes,
+                    angular_diameter_distances_between_planes=distances_between_planes,
+                ),
+                recursion_factors_of_planes_from(
+                    angular_diameter_distances_of_planes=distances_of_planes,
+                    angular_diameter_distances_between_planes=distances_between_planes,
+                ),
+            )
+
+        return self._distances_and_factors_of_planes
+
+    @property
+    def angular_diameter_distances_of_planes(self):
+        return self.distances_and_factors_of_planes_from()[0]
+
+    @property
+    def angular_diameter_distances_between_planes(self):
+        return self.distances_and_factors_of_planes_from()[1]
+
+    @property
+    def scaling_factors_between_planes(self):
+        return self.distances_and_factors_of_planes_from()[2]
+
+    @property
+    def recursion_factors_of_planes(self):
+        return self.distances_and_factors_of_planes_from()[3]
 
     @property
     def total_planes(self):
@@ -322,25 +513,167 @@ class AbstractTracer(lensing.LensingObject, ABC):
             pickle.dump(self, f)
 
 
+def cache_traced_grids(func):
+    """
+    Cache the traced grids of a tracer, such that every unique grid is ray-traced once per tracer.
+
+    A `FitImaging` traces the same masked grid and blurring grid many times (e.g. for the blurred image, the mappers of
+    an inversion, the model images of every plane and galaxy, etc.), but the planes of a tracer never change, so the
+    traced grids of a grid are always the same. The cache is scoped to the tracer and keyed by the identity of the
+    input grid and the plane-index limit it is traced to. A request for the grids up to a plane is served from the
+    traced grids of any higher plane-index limit of the same grid.
+
+    The cache stores a weak reference to every grid, which is checked when the cache is used, such that a new grid
+    created at the memory address of a deleted grid is never served the traced grids of the deleted grid, and the
+    entries of deleted grids are removed whenever a new grid is traced. Grids which are changed in-place after they
+    have been traced require the cache to be cleared via `traced_grids_cache_clear`.
+
+    Every call returns copies of the cached traced grids, because the traced grids are changed in-place by some of
+    the calculations which use them (e.g. a mapper with `use_border=True` relocates the traced source-plane grid to
+    the border of the source-plane). Returning the cached grids themselves would corrupt every later use of the tracer
+    (e.g. the image of the source-plane, or the next fit using the same preloaded traced grids).
+
+    Parameters
+    ----------
+    func : (tracer, grid, plane_index_limit) -> [Grid2D]
+        The function which traces a grid to every plane of a tracer.
+    """
+
+    @wraps(func)
+    def wrapper(tracer, grid, plane_index_limit=None):
+
+        if plane_index_limit is None:
+            plane_index_limit = tracer.total_planes - 1
+
+        traced_grids = tracer._traced_grids_from_cache(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+
+        if traced_grids is None:
+
+            traced_grids = func(tracer, grid, plane_index_limit=plane_index_limit)
+
+            tracer._traced_grids_to_cache(
+                grid=grid,
+                plane_index_limit=plane_index_limit,
+                traced_grids=traced_grids,
+            )
+
+        return [traced_grid.copy() for traced_grid in traced_grids]
+
+    return wrapper
+
+
 class AbstractTracerLensing(AbstractTracer, ABC):
+    @cache_traced_grids
     @grids.grid_like_to_structure_list
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """
+        Trace an input grid of (y,x) image-plane coordinates to every plane of the tracer, using the recursive
+        formulation of the multi-plane lens equation.
+
+        The traced grid of plane j is computed from the traced grids of the previous two planes and the deflection
+        angles of the previous plane only:
+
+        x_j = (1 - r_j) * x_(j-2) + r_j * x_(j-1) - beta_(j-1,j) * alpha_(j-1)
+
+        where beta are the scaling factors between planes and r_j the recursion factors of the tracer (see
+        `recursion_factors_of_planes_from`). The cost therefore scales linearly with the number of planes, as opposed
+        to `traced_grids_of_planes_via_summation_from_grid`, which sums the scaled deflections of all previous planes
+        for every plane.
+
+        Deflection angles are only computed for the planes in `plane_indexes_with_mass_profile`, which is set up when
+        the tracer is created, and never for the final plane that is traced (whose deflections are not used). The
+        deflections of a plane without mass are zero, so they are not subtracted and planes in front of the first
+        plane with mass are the image-plane grid.
+
+        The traced grids are cached by the tracer (see `cache_traced_grids`), thus a grid is only traced once and
+        every call returns copies of the cached grids.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D or aa.Grid2DIrregular
+            The image-plane grid which is traced to every plane.
+        plane_index_limit : int or None
+            If input, tracing stops at the plane with this index and only the grids up to this plane are returned.
+        """
+        if plane_index_limit is None:
+            plane_index_limit = self.total_planes - 1
+
+        if self.plane_indexes_with_mass_profile:
+            first_plane_index_with_mass_profile = self.plane_indexes_with_mass_profile[
+                0
+            ]
+        else:
+            first_plane_index_with_mass_profile = self.total_planes
 
+        traced_grids = []
+        deflections = None
+
+        for (plane_index, plane) in enumerate(self.planes):
+
+            if plane_index < first_plane_index_with_mass_profile + 2:
+
+                traced_grid = grid.astype(self.precision)
+
+            else:
+
+                recursion_factor = self.recursion_factors_of_planes[plane_index]
+
+                traced_grid = traced_grids[plane_index - 1].copy()
+                traced_grid *= recursion_factor
+                traced_grid += (1.0 - recursion_factor) * traced_grids[plane_index - 2]
+
+            if deflections is not None:
+
+                traced_grid -= (
+                    self.scaling_factors_between_planes[plane_index - 1, plane_index]
+                    * deflections
+                )
+
+            traced_grids.append(traced_grid)
+
+            if plane_index == plane_index_limit:
+                return traced_grids
+
+            if plane_index in self.plane_indexes_with_mass_profile:
+                deflections = plane.deflections_from_grid(grid=traced_grid)
+            else:
+                deflections = None
+
+        return traced_grids
+
+    @grids.grid_like_to_structure_list
+    def traced_grids_of_planes_via_summation_from_grid(
+        self, grid, plane_index_limit=None
+    ):
+        """
+        Trace an input grid of (y,x) image-plane coordinates to every plane of the tracer, where the traced grid of
+        every plane is computed by subtracting the scaled deflection angles of all previous planes from the
+        image-plane grid.
+
+        This gives the same traced grids as `traced_grids_of_planes_from_grid` but its cost scales quadratically with
+        the number of planes.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D or aa.Grid2DIrregular
+            The image-plane grid which is traced to every plane.
+        plane_index_limit : int or None
+            If input, tracing stops at the plane with this index and only the grids up to this plane are returned.
+        """
         traced_grids = []
         traced_deflections = []
 
         for (plane_index, plane) in enumerate(self.planes):
 
-            scaled_grid = grid.copy()
+            scaled_grid = grid.astype(self.precision)
 
             if plane_index > 0:
                 for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
-                    )
+                    scaling_factor = self.scaling_factors_between_planes[
+                        previous_plane_index, plane_index
+                    ]
 
                     scaled_deflections = (
                         scaling_factor * traced_deflections[previous_plane_index]
@@ -360,6 +693,89 @@ class AbstractTracerLensing(AbstractTracer, ABC):
 
         return traced_grids
 
+    def traced_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, plane_index_limit=None
+    ):
+        """
+        Trace a masked grid and its blurring grid to every plane of the tracer in a single pass, returning the traced
+        grids of the masked grid and blurring grid as two lists.
+
+        The two grids are concatenated into one contiguous array which is traced once, such that the deflection
+        angles of every plane are computed in one call for both grids, as opposed to separate calls for each grid.
+        For small masks the overhead of each call dominates the cost of ray-tracing, which this halves. The traced
+        grids of the two grids are views of the traced concatenated array, and are stored in the traced grids cache
+        of each grid (see `cache_traced_grids`).
+
+        This is only possible if both grids are a `Grid2D` stored in 1D. Other grids (e.g. a `Grid2DIterate`) and
+        grids which have already been traced by the tracer are traced via `traced_grids_of_planes_from_grid`.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The masked image-plane grid which is traced to every plane.
+        blurring_grid : aa.Grid2D
+            The image-plane blurring grid which is traced to every plane.
+        plane_index_limit : int or None
+            If input, tracing stops at the plane with this index and only the grids up to this plane are returned.
+        """
+        if plane_index_limit is None:
+            plane_index_limit = self.total_planes - 1
+
+        traced_grids_of_planes = self._traced_grids_from_cache(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+        traced_blurring_grids_of_planes = self._traced_grids_from_cache(
+            grid=blurring_grid, plane_index_limit=plane_index_limit
+        )
+
+        if (
+            traced_grids_of_planes is not None
+            or traced_blurring_grids_of_planes is not None
+            or not grids_can_be_traced_together(grid=grid, blurring_grid=blurring_grid)
+        ):
+            return (
+                self.traced_grids_of_planes_from_grid(
+                    grid=grid, plane_index_limit=plane_index_limit
+                ),
+                self.traced_grids_of_planes_from_grid(
+                    grid=blurring_grid, plane_index_limit=plane_index_limit
+                ),
+            )
+
+        total_grid_pixels = grid.shape[0]
+
+        traced_combined_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=np.concatenate((grid, blurring_grid), axis=0),
+            plane_index_limit=plane_index_limit,
+        )
+
+        traced_grids_of_planes = [
+            grid.structure_from_result(result=traced_grid[:total_grid_pixels])
+            for traced_grid in traced_combined_grids_of_planes
+        ]
+        traced_blurring_grids_of_planes = [
+            blurring_grid.structure_from_result(
+                result=traced_grid[total_grid_pixels:]
+            )
+            for traced_grid in traced_combined_grids_of_planes
+        ]
+
+        self._traced_grids_to_cache(
+            grid=grid,
+            plane_index_limit=plane_index_limit,
+            traced_grids=traced_grids_of_planes,
+        )
+        self._traced_grids_to_cache(
+            grid=blurring_grid,
+            plane_index_limit=plane_index_limit,
+            traced_grids=traced_blurring_grids_of_planes,
+        )
+
+        return (
+            [traced_grid.copy() for traced_grid in traced_grids_of_planes],
+            [traced_grid.copy() for traced_grid in traced_blurring_grids_of_planes],
+        )
+
     @grids.grid_like_to_structure
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
 
@@ -379,9 +795,9 @@ class AbstractTracerLensing(AbstractTracer, ABC):
         )
 
         images_of_planes = [
-            self.planes[plane_index].image_from_grid(
-                grid=traced_grids_of_planes[plane_index]
-            )
+            self.planes[plane_index]
+            .image_from_grid(grid=traced_grids_of_planes[plane_index])
+            .astype(self.precision, copy=False)
             for plane_index in range(len(traced_grids_of_planes))
         ]
 
@@ -389,17 +805,120 @@ class AbstractTracerLensing(AbstractTracer, ABC):
             for plane_index in range(
                 self.upper_plane_index_with_light_profile, self.total_planes - 1
             ):
-                images_of_planes.append(np.zeros(shape=images_of_planes[0].shape))
+                images_of_planes.append(
+                    np.zeros(shape=images_of_planes[0].shape, dtype=self.precision)
+                )
 
         return images_of_planes
 
+    def traced_grids_of_planes_from_grid_in_chunks(
+        self, grid, plane_index_limit=None, chunk_size=None
+    ):
+        """
+        Trace an input grid of (y,x) image-plane coordinates to every plane of the tracer, processing the grid in
+        chunks of coordinates which are each traced separately and written to preallocated traced grids.
+
+        The deflection angles and temporary arrays of the mass profiles are therefore only computed for one chunk at
+        a time, such that the memory used in addition to the traced grids is bounded by the chunk size and number of
+        planes, not the size of the grid. The traced grids are identical to `traced_grids_of_planes_from_grid`.
+
+        Only a `Grid2D` stored in 1D is traced in chunks, other grids (e.g. a `Grid2DIterate`) and grids smaller than
+        the chunk size are traced via `traced_grids_of_planes_from_grid`.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The image-plane grid which is traced to every plane.
+        plane_index_limit : int or None
+            If input, tracing stops at the plane with this index and only the grids up to this plane are returned.
+        chunk_size : int or None
+            The number of (y,x) coordinates in every chunk, where the value in the ray_tracing section of the general
+            config is used if this is not input.
+        """
+        if chunk_size is None:
+            chunk_size = grid_chunk_size_from_config()
+
+        if (
+            not isinstance(grid, grids.Grid2D)
+            or not grid.store_slim
+            or grid.shape[0] <= chunk_size
+        ):
+            return self.traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+
+        if plane_index_limit is None:
+            plane_index_limit = self.total_planes - 1
+
+        traced_grids_of_planes = [
+            np.zeros(shape=grid.shape, dtype=self.precision)
+            for plane_index in range(plane_index_limit + 1)
+        ]
+
+        for chunk_index in range(0, grid.shape[0], chunk_size):
+
+            grid_chunk = np.asarray(grid)[chunk_index : chunk_index + chunk_size]
+
+            traced_grid_chunks_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=grid_chunk, plane_index_limit=plane_index_limit
+            )
+
+            for (traced_grid, traced_grid_chunk) in zip(
+                traced_grids_of_planes, traced_grid_chunks_of_planes
+            ):
+                traced_grid[chunk_index : chunk_index + chunk_size] = traced_grid_chunk
+
+        return grid.structure_list_from_result_list(result_list=traced_grids_of_planes)
+
+    def image_from_grid_in_chunks(self, grid, chunk_size=None):
+        """
+        Returns the image of the tracer on an input grid, processing the grid in chunks of coordinates whose image
+        is computed separately and written to a preallocated image.
+
+        The traced grids of every plane are only computed for one chunk at a time, such that the memory used in
+        addition to the image is bounded by the chunk size and number of planes, not the size of the grid. The image
+        is identical to `image_from_grid`.
+
+        Only a `Grid2D` stored in 1D is processed in chunks, other grids (e.g. a `Grid2DIterate`) and grids smaller
+        than the chunk size use `image_from_grid`.
+
+        Parameters
+        ----------
+        grid : aa.Grid2D
+            The image-plane grid on which the image is computed.
+        chunk_size : int or None
+            The number of (y,x) coordinates in every chunk, where the value in the ray_tracing section of the general
+            config is used if this is not input.
+        """
+        if chunk_size is None:
+            chunk_size = grid_chunk_size_from_config()
+
+        if (
+            not isinstance(grid, grids.Grid2D)
+            or not grid.store_slim
+            or grid.shape[0] <= chunk_size
+        ):
+            return self.image_from_grid(grid=grid)
+
+        image = np.zeros(shape=grid.shape[0], dtype=self.precision)
+
+        for chunk_index in range(0, grid.shape[0], chunk_size):
+
+            grid_chunk = np.asarray(grid)[chunk_index : chunk_index + chunk_size]
+
+            image[chunk_index : chunk_index + chunk_size] = self.image_from_grid(
+                grid=grid_chunk
+            )
+
+        return grid.structure_from_result(result=image)
+
     def padded_image_from_grid_and_psf_shape(self, grid, psf_shape_2d):
 
         padded_grid = grid.padded_grid_from_kernel_shape(
             kernel_shape_native=psf_shape_2d
         )
 
-        return self.image_from_grid(grid=padded_grid)
+        return self.image_from_grid_in_chunks(grid=padded_grid)
 
     @grids.grid_like_to_structure
     def convergence_from_grid(self, grid):
@@ -417,6 +936,54 @@ class AbstractTracerLensing(AbstractTracer, ABC):
     def deflections_of_planes_summed_from_grid(self, grid):
         return sum([plane.deflections_from_grid(grid=grid) for plane in self.planes])
 
+    def positions_of_point_sources_from(self, positions_solver):
+        """
+        Returns a dictionary of the image-plane (y,x) coordinates of the multiple images of every point source in the
+        tracer, using the names of the point sources (see `point_source_dict`) as keys.
+
+        The point sources in the same plane are solved together using the positions solver's `solve_many` method, such
+        that the initial grid of the solver is traced once per plane and not once per point source. Point sources in
+        a plane before the final plane are lensed only by the planes in front of them.
+
+        Parameters
+        ----------
+        positions_solver : PositionsSolver
+            The solver used to find the multiple images of every point source.
+        """
+        point_source_dict = self.point_source_dict
+        point_source_plane_index_dict = self.point_source_plane_index_dict
+
+        positions_dict = {}
+
+        for plane_index in sorted(set(point_source_plane_index_dict.values())):
+
+            names = [
+                name
+                for name, index in point_source_plane_index_dict.items()
+                if index == plane_index
+            ]
+
+            if plane_index == self.total_planes - 1:
+                lensing_obj = self
+            else:
+                lensing_obj = self.__class__(
+                    planes=self.planes[: plane_index + 1],
+                    cosmology=self.cosmology,
+                    precision=self.precision,
+                )
+
+            positions_list = positions_solver.solve_many(
+                lensing_obj=lensing_obj,
+                source_plane_coordinates=[
+                    point_source_dict[name].centre for name in names
+                ],
+            )
+
+            for name, positions in zip(names, positions_list):
+                positions_dict[name] = positions
+
+        return positions_dict
+
     def grid_at_redshift_from_grid_and_redshift(self, grid, redshift):
         """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to any redshift in \
         the strong lens configuration.
@@ -434,7 +1001,7 @@ class AbstractTracerLensing(AbstractTracer, ABC):
         """
 
         if redshift <= self.plane_redshifts[0]:
-            return grid.copy()
+            return grid.astype(self.precision)
 
         plane_index_with_redshift = [
             plane_index
@@ -452,10 +1019,12 @@ class AbstractTracerLensing(AbstractTracer, ABC):
             if redshift < plane_redshift:
                 plane_index_insert = plane_index
 
-        planes = self.planes
+        planes = self.planes[:]
         planes.insert(plane_index_insert, pl.Plane(redshift=redshift, galaxies=[]))
 
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
+        tracer = Tracer(
+            planes=planes, cosmology=self.cosmology, precision=self.precision
+        )
 
         return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
 
@@ -505,6 +1074,13 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         if not self.has_light_profile:
             return np.zeros(shape=grid.shape_slim)
 
+        if grids_can_be_traced_together(grid=grid, blurring_grid=blurring_grid):
+            self.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=grid,
+                blurring_grid=blurring_grid,
+                plane_index_limit=self.upper_plane_index_with_light_profile,
+            )
+
         image = self.image_from_grid(grid=grid)
 
         blurring_image = self.image_from_grid(grid=blurring_grid)
@@ -525,9 +1101,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        (
+            traced_grids_of_planes,
+            traced_blurring_grids_of_planes,
+        ) = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
         return [
             plane.blurred_image_from_grid_and_psf(
@@ -553,6 +1131,13 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         if not self.has_light_profile:
             return np.zeros(shape=grid.shape_slim)
 
+        if grids_can_be_traced_together(grid=grid, blurring_grid=blurring_grid):
+            self.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=grid,
+                blurring_grid=blurring_grid,
+                plane_index_limit=self.upper_plane_index_with_light_profile,
+            )
+
         image = self.image_from_grid(grid=grid)
 
         blurring_image = self.image_from_grid(grid=blurring_grid)
@@ -575,9 +1160,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        (
+            traced_grids_of_planes,
+            traced_blurring_grids_of_planes,
+        ) = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
@@ -595,7 +1182,7 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             kernel_shape_native=psf.shape_native
         )
 
-        padded_image = self.image_from_grid(grid=padded_grid)
+        padded_image = self.image_from_grid_in_chunks(grid=padded_grid)
 
         return padded_grid.mask.unmasked_blurred_array_from_padded_array_psf_and_image_shape(
             padded_array=padded_image, psf=psf, image_shape=grid.mask.shape
@@ -716,7 +1303,8 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 traced_sparse_grids_of_planes.append(None)
             else:
                 traced_sparse_grids = self.traced_grids_of_planes_from_grid(
-                    grid=sparse_image_plane_grids_of_planes[plane_index]
+                    grid=sparse_image_plane_grids_of_planes[plane_index],
+                    plane_index_limit=plane_index,
                 )
                 traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
 
@@ -752,6 +1340,25 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         return mappers_of_planes
 
+    def mapper_from_grid_and_preloads(
+        self, grid, settings_pixelization=pix.SettingsPixelization(), preloads=None
+    ):
+        """
+        Returns the mapper of the last plane with a pixelization, which is the preloaded mapper if there is one (see
+        `Preloads`). A stochastic pixelization gives a different mapper every time it is computed, therefore its
+        mapper is never preloaded.
+        """
+        if (
+            preloads is not None
+            and preloads.mapper is not None
+            and not settings_pixelization.is_stochastic
+        ):
+            return preloads.mapper
+
+        return self.mappers_of_planes_from_grid(
+            grid=grid, settings_pixelization=settings_pixelization
+        )[-1]
+
     def inversion_imaging_from_grid_and_data(
         self,
         grid,
@@ -760,19 +1367,32 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         convolver,
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
+        preloads=None,
     ):
 
-        mappers_of_planes = self.mappers_of_planes_from_grid(
-            grid=grid, settings_pixelization=settings_pixelization
+        mapper = self.mapper_from_grid_and_preloads(
+            grid=grid, settings_pixelization=settings_pixelization, preloads=preloads
         )
 
-        return inv.InversionImagingMatrix.from_data_mapper_and_regularization(
+        if preloads is None or mapper is not preloads.mapper:
+
+            return inv.InversionImagingMatrix.from_data_mapper_and_regularization(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mapper,
+                regularization=self.regularizations_of_planes[-1],
+                settings=settings_inversion,
+            )
+
+        return inversion_imaging_via_preloads_from(
             image=image,
             noise_map=noise_map,
             convolver=convolver,
-            mapper=mappers_of_planes[-1],
+            mapper=mapper,
             regularization=self.regularizations_of_planes[-1],
             settings=settings_inversion,
+            preloads=preloads,
         )
 
     def inversion_interferometer_from_grid_and_data(
@@ -783,16 +1403,17 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         transformer,
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
+        preloads=None,
     ):
-        mappers_of_planes = self.mappers_of_planes_from_grid(
-            grid=grid, settings_pixelization=settings_pixelization
+        mapper = self.mapper_from_grid_and_preloads(
+            grid=grid, settings_pixelization=settings_pixelization, preloads=preloads
         )
 
         return inv.AbstractInversionInterferometer.from_data_mapper_and_regularization(
             visibilities=visibilities,
             noise_map=noise_map,
             transformer=transformer,
-            mapper=mappers_of_planes[-1],
+            mapper=mapper,
             regularization=self.regularizations_of_planes[-1],
             settings=settings_inversion,
         )
@@ -833,10 +1454,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
         galaxy_blurred_image_dict = dict()
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        (
+            traced_grids_of_planes,
+            traced_blurring_grids_of_planes,
+        ) = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         for (plane_index, plane) in enumerate(self.planes):
@@ -882,7 +1504,7 @@ class Tracer(AbstractTracerData):
         return self.planes[1].galaxies[0].light_profiles[0].flux
 
     @classmethod
-    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15, precision="float64"):
 
         plane_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=galaxies)
 
@@ -895,7 +1517,7 @@ class Tracer(AbstractTracerData):
         for plane_index in range(0, len(plane_redshifts)):
             planes.append(pl.Plane(galaxies=galaxies_in_planes[plane_index]))
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(planes=planes, cosmology=cosmology, precision=precision)
 
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
@@ -905,6 +1527,7 @@ class Tracer(AbstractTracerData):
         source_galaxies,
         planes_between_lenses,
         cosmology=cosmo.Planck15,
+        precision="float64",
     ):
 
         """Ray-tracer for a lens system with any number of planes.
@@ -932,6 +1555,8 @@ class Tracer(AbstractTracerData):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        precision : str
+            The floating point precision, "float64" or "float32", of the tracer's grids and images.
         """
 
         lens_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=lens_galaxies)
@@ -960,4 +1585,282 @@ class Tracer(AbstractTracerData):
                 )
             )
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(planes=planes, cosmology=cosmology, precision=precision)
+
+
+_thread_pool_dict = {}
+
+
+def inversion_imaging_via_preloads_from(
+    image,
+    noise_map,
+    convolver,
+    mapper,
+    regularization,
+    settings=inv.SettingsInversion(),
+    preloads=None,
+):
+    """
+    Returns the inversion of an image, using every preloaded product of the inversion (the blurred mapping matrix,
+    curvature matrix F, data vector D and regularization matrix H) instead of computing it (see `Preloads`).
+
+    This performs the same calculation as `InversionImagingMatrix.from_data_mapper_and_regularization`, such that
+    only the products which are not preloaded (e.g. the regularization matrix of a model with a free regularization
+    coefficient) and the solution for the reconstruction are computed.
+
+    Parameters
+    ----------
+    image : aa.Array2D
+        The image which is reconstructed by the inversion.
+    noise_map : aa.Array2D
+        The noise-map of the image.
+    convolver : aa.Convolver
+        The convolver used to blur the mapping matrix with the PSF.
+    mapper : aa.Mapper
+        The mapper between the image's grid and the pixelization.
+    regularization : aa.reg.Regularization
+        The regularization of the pixelization.
+    preloads : Preloads
+        The preloaded products of the inversion.
+    """
+    if preloads is None:
+        preloads = pload.Preloads()
+
+    if preloads.blurred_mapping_matrix is None:
+        blurred_mapping_matrix = convolver.convolve_mapping_matrix(
+            mapping_matrix=mapper.mapping_matrix
+        )
+    else:
+        blurred_mapping_matrix = preloads.blurred_mapping_matrix
+
+    if preloads.data_vector is None:
+        data_vector = inversion_util.data_vector_via_blurred_mapping_matrix_from(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=image,
+            noise_map=noise_map,
+        )
+    else:
+        data_vector = preloads.data_vector
+
+    if preloads.curvature_matrix is None:
+        curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        )
+    else:
+        curvature_matrix = preloads.curvature_matrix
+
+    if preloads.regularization_matrix is None:
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+    else:
+        regularization_matrix = preloads.regularization_matrix
+
+    curvature_reg_matrix = np.add(curvature_matrix, regularization_matrix)
+
+    try:
+        values = np.linalg.solve(curvature_reg_matrix, data_vector)
+    except np.linalg.LinAlgError:
+        raise InversionException()
+
+    if settings.check_solution:
+        if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
+            if np.isclose(a=values[0], b=values, atol=1e-4).all():
+                raise InversionException()
+
+    return inv.InversionImagingMatrix(
+        image=image,
+        noise_map=noise_map,
+        convolver=convolver,
+        mapper=mapper,
+        regularization=regularization,
+        blurred_mapping_matrix=blurred_mapping_matrix,
+        regularization_matrix=regularization_matrix,
+        curvature_reg_matrix=curvature_reg_matrix,
+        reconstruction=values,
+        settings=settings,
+    )
+
+
+def thread_pool_from(threads, name):
+    """
+    Returns a thread pool with the input number of threads, which is created the first time it is requested by
+    every process (thread pools cannot be shared between the processes of a parallel non-linear search).
+
+    Parameters
+    ----------
+    threads : int
+        The number of threads in the pool.
+    name : str
+        The name of the pool, where pools of different names are separate pools.
+    """
+    pool_key = (os.getpid(), name, threads)
+
+    if pool_key not in _thread_pool_dict:
+        _thread_pool_dict[pool_key] = futures.ThreadPoolExecutor(max_workers=threads)
+
+    return _thread_pool_dict[pool_key]
+
+
+def grids_can_be_traced_together(grid, blurring_grid):
+    """
+    Returns whether a masked grid and its blurring grid can be concatenated and traced in a single pass (see
+    `traced_grids_of_planes_from_grid_and_blurring_grid`), which requires both to be a `Grid2D` stored in 1D.
+
+    Parameters
+    ----------
+    grid : aa.Grid2D
+        The masked image-plane grid.
+    blurring_grid : aa.Grid2D
+        The image-plane blurring grid.
+    """
+    return (
+        isinstance(grid, grids.Grid2D)
+        and isinstance(blurring_grid, grids.Grid2D)
+        and grid.store_slim
+        and blurring_grid.store_slim
+    )
+
+
+def angular_diameter_distances_of_planes_from(plane_redshifts, cosmology):
+    """
+    Returns the angular diameter distances (in kpc) that are used to rescale deflection angles between the planes of
+    a multi-plane ray-tracing calculation. These are:
+
+     - The distance of every plane to Earth, returned as an ndarray of shape [total_planes].
+     - The distance between every pair of planes (i, j) where plane i is in front of plane j, returned as an ndarray
+       of shape [total_planes, total_planes] whose other entries are zero.
+
+    These are computed once, the first time a tracer uses them (the plane redshifts and cosmology of a tracer do not
+    change), and are read-only, so that tracing does not call astropy every time it is performed. The distances are
+    taken from the process-wide `cosmology_cache`, so tracers with the same plane redshifts share them.
+
+    If a cosmology is not input or a plane does not have a redshift, the distances cannot be computed and `None` is
+    returned for both.
+
+    Parameters
+    ----------
+    plane_redshifts : [float]
+        The redshifts of the planes of the tracer, in ascending order.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+    if cosmology is None or None in plane_redshifts:
+        return None, None
+
+    total_planes = len(plane_redshifts)
+
+    distances_of_planes = np.zeros(shape=total_planes)
+    distances_between_planes = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index_1, redshift_1 in enumerate(plane_redshifts):
+
+        distances_of_planes[
+            plane_index_1
+        ] = cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=redshift_1, cosmology=cosmology
+        )
+
+        for plane_index_0 in range(plane_index_1):
+
+            distances_between_planes[
+                plane_index_0, plane_index_1
+            ] = cosmology_cache.angular_diameter_distance_between_redshifts_in_kpc_from(
+                redshift_0=plane_redshifts[plane_index_0],
+                redshift_1=redshift_1,
+                cosmology=cosmology,
+            )
+
+    distances_of_planes.setflags(write=False)
+    distances_between_planes.setflags(write=False)
+
+    return distances_of_planes, distances_between_planes
+
+
+def scaling_factors_between_planes_from(
+    angular_diameter_distances_of_planes, angular_diameter_distances_between_planes
+):
+    """
+    Returns the matrix of factors that the deflection angles of plane i are rescaled by when they are used to trace
+    a grid to plane j, where plane i is in front of plane j. Entries where plane i is not in front of plane j are zero.
+
+    The scaling factor between plane i and plane j, for a final (source) plane s, is given by:
+
+    beta_ij = (D_ij * D_s) / (D_j * D_is)
+
+    where D_j and D_s are the angular diameter distances of planes j and s to Earth and D_ij and D_is the angular
+    diameter distances between planes i and j and planes i and s.
+
+    Parameters
+    ----------
+    angular_diameter_distances_of_planes : np.ndarray
+        The angular diameter distance of every plane to Earth.
+    angular_diameter_distances_between_planes : np.ndarray
+        The angular diameter distances between every pair of planes.
+    """
+    if angular_diameter_distances_of_planes is None:
+        return None
+
+    total_planes = angular_diameter_distances_of_planes.shape[0]
+
+    scaling_factors = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index_1 in range(total_planes):
+        for plane_index_0 in range(plane_index_1):
+
+            scaling_factors[plane_index_0, plane_index_1] = (
+                angular_diameter_distances_between_planes[plane_index_0, plane_index_1]
+                * angular_diameter_distances_of_planes[-1]
+            ) / (
+                angular_diameter_distances_of_planes[plane_index_1]
+                * angular_diameter_distances_between_planes[plane_index_0, -1]
+            )
+
+    scaling_factors.setflags(write=False)
+
+    return scaling_factors
+
+
+def recursion_factors_of_planes_from(
+    angular_diameter_distances_of_planes, angular_diameter_distances_between_planes
+):
+    """
+    Returns the factors r_j used by the recursive multi-plane lens equation, which computes the traced grid of plane
+    j from the traced grids of the two planes in front of it:
+
+    x_j = (1 - r_j) * x_(j-2) + r_j * x_(j-1) - beta_(j-1,j) * alpha_(j-1)
+
+    where:
+
+    r_j = (D_(j-1) * D_(j-2,j)) / (D_j * D_(j-2,j-1))
+
+    D_j is the angular diameter distance of plane j to Earth and D_ij the angular diameter distance between planes i
+    and j. The factors of the first two planes are not used by the recursion and are zero.
+
+    Parameters
+    ----------
+    angular_diameter_distances_of_planes : np.ndarray
+        The angular diameter distance of every plane to Earth.
+    angular_diameter_distances_between_planes : np.ndarray
+        The angular diameter distances between every pair of planes.
+    """
+    if angular_diameter_distances_of_planes is None:
+        return None
+
+    total_planes = angular_diameter_distances_of_planes.shape[0]
+
+    recursion_factors = np.zeros(shape=total_planes)
+
+    for plane_index in range(2, total_planes):
+
+        recursion_factors[plane_index] = (
+            angular_diameter_distances_of_planes[plane_index - 1]
+            * angular_diameter_distances_between_planes[plane_index - 2, plane_index]
+        ) / (
+            angular_diameter_distances_of_planes[plane_index]
+            * angular_diameter_distances_between_planes[plane_index - 2, plane_index - 1]
+        )
+
+    recursion_factors.setflags(write=False)
+
+    return recursion_factors
@@ -1,6 +1,7 @@
 import autofit as af
 from autofit.mock.mock import MockSearch, MockSamples
 from autogalaxy.mock.mock import MockLightProfile, MockMassProfile
+from autolens.lens.positions_solver import PositionsSolverResult
 
 
 class MockResult(af.MockResult):
@@ -199,3 +200,11 @@ class MockPositionsSolver:
 
     def solve(self, lensing_obj, source_plane_coordinate):
         return self.model_positions
+
+    def result_from(self, lensing_obj, source_plane_coordinate):
+        return PositionsSolverResult(
+            positions=self.model_positions, lensing_obj=lensing_obj
+        )
+
+    def solve_many(self, lensing_obj, source_plane_coordinates):
+        return [self.model_positions for _ in source_plane_coordinates]
@@ -1,4 +1,7 @@
 import autofit as af
+from autoarray.exc import PixelizationException, InversionException, GridException
+from autolens import decorator_util
+from autolens.fit.preloads import Preloads
 from autolens.lens import ray_tracing
 from autolens.pipeline import visualizer as vis
 from os import path
@@ -6,6 +9,7 @@ import pickle
 from typing import List
 import json
 import numpy as np
+import os
 
 
 class Analysis:
@@ -18,35 +22,208 @@ class Analysis:
             galaxies=instance.galaxies, cosmology=self.cosmology
         )
 
-    def stochastic_log_evidences_for_instance(self, instance) -> List[float]:
+    def stochastic_log_evidences_for_instance(
+        self, instance, sample_indexes=None
+    ) -> List[float]:
         raise NotImplementedError()
 
-    def save_stochastic_outputs(self, paths: af.Paths, samples: af.OptimizerSamples):
+    def preloads_from_instance(self, instance, free_classes) -> Preloads:
+        raise NotImplementedError()
+
+    @property
+    def preloads(self) -> Preloads:
+        """
+        The preloads of the analysis, which are the products of a fit that are the same for every fit of the phase's
+        model (see `Preloads`).
+
+        They are computed from the fit of `preloads_instance` the first time they are used, as opposed to when the
+        analysis is made, such that they are computed from the masked dataset that is fitted (e.g. including changes
+        made to its grids after the analysis is made). If there is no instance (e.g. the mass model is free) or its
+        fit fails, nothing is preloaded.
+        """
+        if self._preloads is None:
+
+            self._preloads = Preloads()
+
+            if self.preloads_instance is not None:
+
+                try:
+                    self._preloads = self.preloads_from_instance(
+                        instance=self.preloads_instance,
+                        free_classes=self.preloads_free_classes,
+                    )
+                except (
+                    PixelizationException,
+                    InversionException,
+                    GridException,
+                    OverflowError,
+                ):
+                    pass
+
+        return self._preloads
+
+    @preloads.setter
+    def preloads(self, preloads):
+        self._preloads = preloads
+
+    def stochastic_map(self, func, values) -> List:
+        """
+        Returns the list of `func` applied to every value, which is used to compute the stochastic resamples of a
+        fit (e.g. the log evidences of a pixelization with different KMeans seeds).
+
+        The resamples are independent of one another, thus if more than one thread is used (see
+        `SettingsLens.stochastic_threads`, where the threads of the numba section of the general config are used if
+        this is `None`) they are computed concurrently by a thread pool. A thread pool is used instead of a process
+        pool so that every resample shares the tracer and dataset of the fit, and because a parallel non-linear search
+        may already use every process. The linear algebra of an inversion releases the GIL, which is where most of the
+        time of a resample is spent.
+
+        The results are returned in the same order as the values, thus they do not depend on the number of threads.
+
+        Parameters
+        ----------
+        func : (value) -> object
+            The function computing one resample.
+        values : [object]
+            The value input into the function for every resample (e.g. the `SettingsPixelization` of every seed).
+        """
+        threads = self.stochastic_threads
+
+        if threads <= 1 or len(values) <= 1:
+            return [func(value) for value in values]
+
+        pool = ray_tracing.thread_pool_from(threads=threads, name="stochastic")
+
+        return list(pool.map(func, values))
+
+    def stochastic_settings_pixelizations_from(self, seeds):
+        """
+        The `SettingsPixelization` of every stochastic resample of a fit, which use the KMeans seed of the resample
+        to compute the sparse grid of a pixelization (e.g. `VoronoiBrightnessImage`) instead of any preloaded sparse
+        grid. The resamples are therefore reproducible, such that the same seed always gives the same fit.
+
+        Parameters
+        ----------
+        seeds : [int]
+            The KMeans seed of every resample.
+        """
+        settings_pixelizations = []
+
+        for seed in seeds:
+
+            settings_pixelization = self.settings.settings_pixelization.modify_preload(
+                preload_sparse_grids_of_planes=None
+            )
+            settings_pixelization.kmeans_seed = seed
+
+            settings_pixelizations.append(settings_pixelization)
 
+        return settings_pixelizations
+
+    @property
+    def stochastic_threads(self) -> int:
+        """
+        The number of threads used to compute the stochastic resamples of a fit (see `stochastic_map`).
+        """
+        if self.settings.settings_lens.stochastic_threads is None:
+            return decorator_util.threads
+        return self.settings.settings_lens.stochastic_threads
+
+    def save_stochastic_outputs(
+        self,
+        paths: af.Paths,
+        samples: af.OptimizerSamples,
+        samples_per_chunk: int = 25,
+    ):
+        """
+        Compute the stochastic log evidences of the maximum log likelihood instance and output them to the file
+        `stochastic_log_evidences.json`, alongside a pickle of them and their histogram.
+
+        The log evidences are computed in chunks of `samples_per_chunk` samples (whose samples are computed in
+        parallel, see `stochastic_map`). After every chunk the log evidences computed so far and the number of
+        samples they are for are output to the file `stochastic_log_evidences_progress.json`. Every sample uses the
+        KMeans seed of its index, thus if the run is interrupted it resumes from the first sample that was not
+        computed and gives the same log evidences as an uninterrupted run.
+
+        The `stochastic_log_evidences.json` file is only output once every sample is computed, when the progress
+        file is removed, thus it is always complete.
+
+        Parameters
+        ----------
+        paths : af.Paths
+            The paths of the phase, whose output path contains the .json files.
+        samples : af.OptimizerSamples
+            The samples of the non-linear search, whose maximum log likelihood instance is resampled.
+        samples_per_chunk : int
+            The number of samples computed between every output of the progress file.
+        """
         stochastic_log_evidences_json_file = path.join(
             paths.output_path, "stochastic_log_evidences.json"
         )
+        stochastic_log_evidences_progress_file = path.join(
+            paths.output_path, "stochastic_log_evidences_progress.json"
+        )
         stochastic_log_evidences_pickle_file = path.join(
             paths.pickle_path, "stochastic_log_evidences.pickle"
         )
 
+        total_samples = self.settings.settings_lens.stochastic_samples
+
         try:
-            with open(stochastic_log_evidences_json_file, "r") as f:
-                stochastic_log_evidences = np.asarray(json.load(f))
+            with open(stochastic_log_evidences_progress_file, "r") as f:
+                progress = json.load(f)
+            stochastic_log_evidences = progress["log_evidences"]
+            samples_completed = progress["samples_completed"]
         except FileNotFoundError:
-            instance = samples.max_log_likelihood_instance
-            stochastic_log_evidences = self.stochastic_log_evidences_for_instance(
-                instance=instance
+            try:
+                with open(stochastic_log_evidences_json_file, "r") as f:
+                    stochastic_log_evidences = json.load(f)
+                samples_completed = total_samples
+            except FileNotFoundError:
+                stochastic_log_evidences = []
+                samples_completed = 0
+
+        instance = samples.max_log_likelihood_instance
+
+        while samples_completed < total_samples:
+
+            sample_indexes = list(
+                range(
+                    samples_completed,
+                    min(samples_completed + samples_per_chunk, total_samples),
+                )
             )
 
-        if stochastic_log_evidences is None:
-            return
+            log_evidences = self.stochastic_log_evidences_for_instance(
+                instance=instance, sample_indexes=sample_indexes
+            )
+
+            if log_evidences is None:
+                return
+
+            stochastic_log_evidences += [
+                float(log_evidence) for log_evidence in log_evidences
+            ]
+            samples_completed += len(sample_indexes)
 
-        with open(stochastic_log_evidences_json_file, "w") as outfile:
-            json.dump(
-                [float(evidence) for evidence in stochastic_log_evidences], outfile
+            json_dump_atomic(
+                obj={
+                    "samples_completed": samples_completed,
+                    "log_evidences": stochastic_log_evidences,
+                },
+                file=stochastic_log_evidences_progress_file,
             )
 
+        stochastic_log_evidences = np.asarray(stochastic_log_evidences)
+
+        json_dump_atomic(
+            obj=[float(evidence) for evidence in stochastic_log_evidences],
+            file=stochastic_log_evidences_json_file,
+        )
+
+        if path.exists(stochastic_log_evidences_progress_file):
+            os.remove(stochastic_log_evidences_progress_file)
+
         with open(stochastic_log_evidences_pickle_file, "wb") as f:
             pickle.dump(stochastic_log_evidences, f)
 
@@ -57,3 +234,14 @@ class Analysis:
             max_log_evidence=np.max(samples.log_likelihoods),
             histogram_bins=self.settings.settings_lens.stochastic_histogram_bins,
         )
+
+
+def json_dump_atomic(obj, file):
+    """
+    Dump an object to a .json file via a temporary file which replaces the file, such that the file is never left
+    partially written if the process is interrupted.
+    """
+    with open(f"{file}.tmp", "w") as outfile:
+        json.dump(obj, outfile)
+
+    os.replace(f"{file}.tmp", file)
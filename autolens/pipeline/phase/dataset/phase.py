@@ -1,7 +1,9 @@
-from autofit.exc import PriorException
+import autofit as af
+from autofit.exc import FitException, PriorException
 import autoarray as aa
 import autogalaxy as ag
 from autolens.fit import fit_point_source
+from autolens.fit import preloads as pload
 from autogalaxy.pipeline.phase import dataset
 from autolens.pipeline.phase.extensions.stochastic_phase import StochasticPhase
 from autolens import exc
@@ -194,6 +196,62 @@ class PhaseDataset(dataset.PhaseDataset):
                     return results.last.max_log_likelihood_pixelization_grids_of_planes
         return None
 
+    @property
+    def free_classes(self):
+        """
+        The classes of the components of the phase's model which have free parameters, e.g. the class of a light
+        profile passed to a `GalaxyModel` as a class and not an instance. The class of a `GalaxyModel` is a `Galaxy`,
+        which has free parameters if its redshift does.
+
+        Every free parameter of the model belongs to the innermost `PriorModel` which contains it.
+        """
+        free_classes = set()
+
+        for path, _ in self.model.path_priors_tuples:
+            for index in range(len(path) - 1, 0, -1):
+
+                component = self.model.object_for_path(path[:index])
+
+                if isinstance(component, af.PriorModel):
+                    free_classes.add(component.cls)
+                    break
+
+        return tuple(free_classes)
+
+    def set_preloads_of_analysis(self, analysis):
+        """
+        Set up the preloads of the phase's analysis, which are the products of a fit that depend only on the
+        components of the model which are fixed (e.g. passed as an instance and not a model) and are therefore the
+        same for every model-fit (see `Preloads`).
+
+        Which products are fixed is determined by the classes of the model's components with free parameters (see
+        `free_classes`), and the preloads are taken from the fit of the instance of the model at the median of its
+        priors, which the analysis performs the first time its preloads are used (see `Analysis.preloads`). If the
+        mass model has free parameters nothing can be preloaded and no instance is set, as is the case if the
+        instance cannot be created (e.g. an assertion of the model fails for it). A model without free parameters is
+        not fitted more than once, thus preloading its fit would not save any calculations and no instance is set.
+
+        Parameters
+        ----------
+        analysis : Analysis
+            The analysis of the phase, which fits the dataset.
+        """
+        free_classes = self.free_classes
+
+        analysis.preloads_free_classes = free_classes
+
+        if self.model.prior_count == 0 or not pload.classes_are_fixed(
+            classes=pload.mass_classes, free_classes=free_classes
+        ):
+            return
+
+        try:
+            analysis.preloads_instance = self.model.instance_from_unit_vector(
+                [0.5] * self.model.prior_count
+            )
+        except (FitException, PriorException):
+            pass
+
     def extend_with_stochastic_phase(
         self,
         stochastic_search=None,
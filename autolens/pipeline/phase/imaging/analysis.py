@@ -5,12 +5,13 @@ from autoarray.exc import PixelizationException, InversionException, GridExcepti
 from autofit.exc import FitException
 from autogalaxy.pipeline.phase.dataset import analysis as ag_analysis
 from autolens.fit import fit
+from autolens.fit import preloads as pload
+from autolens.lens import ray_tracing
 from autolens.pipeline import visualizer as vis
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 from autogalaxy.pipeline.phase.imaging.analysis import Attributes as AgAttributes
 
 import numpy as np
-import copy
 
 
 class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
@@ -23,18 +24,36 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             results=results,
         )
 
+        self.preloads_instance = None
+        self.preloads_free_classes = ()
+        self.preloads = None
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
 
+    def tracer_for_instance(self, instance):
+        """
+        The tracer of an instance, which traces grids in the same floating point precision as the grids of the masked
+        imaging (see `SettingsMaskedImaging`).
+        """
+        return ray_tracing.Tracer.from_galaxies(
+            galaxies=instance.galaxies,
+            cosmology=self.cosmology,
+            precision=getattr(self.masked_imaging, "precision", "float64"),
+        )
+
     def log_likelihood_function(self, instance):
         """
         Determine the fit of a lens galaxy and source galaxy to the masked_imaging in this lens.
 
+        If a list of instances is input, every instance is fitted (see `log_likelihoods_for_instances`) and an
+        ndarray of their figures of merit is returned.
+
         Parameters
         ----------
         instance
-            A model instance with attributes
+            A model instance with attributes, or a list of model instances.
 
         Returns
         -------
@@ -42,6 +61,9 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             A fractional value indicating how well this model fit and the model masked_imaging itself
         """
 
+        if isinstance(instance, list):
+            return self.log_likelihoods_for_instances(instances=instance)
+
         self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
@@ -62,11 +84,11 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         if self.settings.settings_lens.stochastic_likelihood_resamples is None:
 
             try:
-                return self.masked_imaging_fit_for_tracer(
+                return self.masked_imaging_figure_of_merit_for_tracer(
                     tracer=tracer,
                     hyper_image_sky=hyper_image_sky,
                     hyper_background_noise=hyper_background_noise,
-                ).figure_of_merit
+                )
             except (
                 PixelizationException,
                 InversionException,
@@ -77,37 +99,99 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
         else:
 
-            figures_of_merit = []
+            try:
+                return np.mean(
+                    self.stochastic_likelihood_resamples_for_tracer(
+                        tracer=tracer,
+                        hyper_image_sky=hyper_image_sky,
+                        hyper_background_noise=hyper_background_noise,
+                    )
+                )
+            except (
+                PixelizationException,
+                InversionException,
+                GridException,
+                OverflowError,
+            ) as e:
+                raise FitException from e
 
-            for i in range(self.settings.settings_lens.stochastic_likelihood_resamples):
+    def stochastic_likelihood_resamples_for_tracer(
+        self, tracer, hyper_image_sky, hyper_background_noise
+    ):
+        """
+        The figures of merit of a tracer's fit to the masked imaging for every stochastic likelihood resample (see
+        `SettingsLens.stochastic_likelihood_resamples`), which differ only in the KMeans seed of the pixelization.
 
-                settings_pixelization = copy.deepcopy(
-                    self.settings.settings_pixelization
-                )
+        The products of the fit which do not depend on the seed are computed once and shared by every resample: the
+        tracer ray-traces the grid of the inversion once and the blurred image of its light profiles is preloaded.
+        Only the seeded sparse grid, mapper and inversion of every resample are computed, which are dispatched to a
+        thread pool (see `stochastic_map`).
+        """
+        preloads = self.stochastic_preloads_for_tracer(tracer=tracer)
 
-                settings_pixelization.kmeans_seed = i
-                #       settings_pixelization.is_stochastic = True
-
-                try:
-                    figures_of_merit.append(
-                        fit.FitImaging(
-                            masked_imaging=self.masked_dataset,
-                            tracer=tracer,
-                            hyper_image_sky=hyper_image_sky,
-                            hyper_background_noise=hyper_background_noise,
-                            settings_pixelization=settings_pixelization,
-                            settings_inversion=self.settings.settings_inversion,
-                        ).log_evidence
-                    )
-                except (
-                    PixelizationException,
-                    InversionException,
-                    GridException,
-                    OverflowError,
-                ) as e:
-                    raise FitException from e
+        settings_pixelizations = self.stochastic_settings_pixelizations_from(
+            seeds=range(self.settings.settings_lens.stochastic_likelihood_resamples)
+        )
+
+        def figure_of_merit_from(settings_pixelization):
+            return fit.figure_of_merit_from(
+                masked_imaging=self.masked_dataset,
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+                settings_pixelization=settings_pixelization,
+                settings_inversion=self.settings.settings_inversion,
+                preloads=preloads,
+            )
+
+        return self.stochastic_map(
+            func=figure_of_merit_from, values=settings_pixelizations
+        )
+
+    def stochastic_preloads_for_tracer(self, tracer):
+        """
+        The preloads shared by every stochastic resample of a tracer's fit, which are the products of the fit that do
+        not depend on the KMeans seed of the pixelization: the blurred image of the tracer's light profiles and its
+        ray-traced grid of the inversion, which is stored in the tracer's traced grids cache.
+
+        The inversion preloads of the analysis are removed, as the mapper and every product of the inversion depend
+        on the seed.
+        """
+        preloads = self.preloads.without_inversion
+
+        preloads.preload_tracer(tracer=tracer)
+        preloads.traced_grids_of_planes_of_grids = None
+
+        if preloads.blurred_image is None:
+            preloads.blurred_image = tracer.blurred_image_from_grid_and_convolver(
+                grid=self.masked_dataset.grid,
+                convolver=self.masked_dataset.convolver,
+                blurring_grid=self.masked_dataset.blurring_grid,
+            )
+
+        tracer.traced_grids_of_planes_from_grid(
+            grid=self.masked_dataset.grid_inversion
+        )
 
-            return np.mean(figures_of_merit)
+        return preloads
+
+    def log_likelihoods_for_instances(self, instances):
+        """
+        Determine the fits of a list of model instances to the masked_imaging, for example the parameter vectors
+        of every walker of an MCMC search, returning their figures of merit as an ndarray.
+
+        Every instance is fitted via `log_likelihood_function`, thus a `FitException` raised by the fit of any
+        instance (e.g. because its positions do not trace within the threshold) is raised such that the non-linear
+        search resamples the point.
+
+        Parameters
+        ----------
+        instances : [ModelInstance]
+            The model instances which are fitted.
+        """
+        return np.asarray(
+            [self.log_likelihood_function(instance=instance) for instance in instances]
+        )
 
     def masked_imaging_fit_for_tracer(
         self, tracer, hyper_image_sky, hyper_background_noise, use_hyper_scalings=True
@@ -121,10 +205,72 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             use_hyper_scaling=use_hyper_scalings,
             settings_pixelization=self.settings.settings_pixelization,
             settings_inversion=self.settings.settings_inversion,
+            preloads=self.preloads,
+        )
+
+    def masked_imaging_figure_of_merit_for_tracer(
+        self, tracer, hyper_image_sky, hyper_background_noise
+    ):
+        """
+        The figure of merit of a tracer's fit to the masked imaging, computed without creating a `FitImaging` (see
+        `fit.figure_of_merit_from`).
+        """
+        return fit.figure_of_merit_from(
+            masked_imaging=self.masked_dataset,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+            settings_pixelization=self.settings.settings_pixelization,
+            settings_inversion=self.settings.settings_inversion,
+            preloads=self.preloads,
         )
 
-    def stochastic_log_evidences_for_instance(self, instance):
+    def preloads_from_instance(self, instance, free_classes):
+        """
+        Returns the preloads of the analysis, which are the products of a fit that are the same for the fits of
+        every instance of the phase's model and are therefore computed once and used by every fit (see `Preloads`).
 
+        Parameters
+        ----------
+        instance : ModelInstance
+            An instance of the phase's model, whose fit the preloads are taken from.
+        free_classes : (type,)
+            The classes of the components of the phase's model which have free parameters.
+        """
+        instance = self.associate_hyper_images(instance=instance)
+
+        return pload.Preloads.from_imaging_fit(
+            fit=fit.FitImaging(
+                masked_imaging=self.masked_dataset,
+                tracer=self.tracer_for_instance(instance=instance),
+                hyper_image_sky=self.hyper_image_sky_for_instance(instance=instance),
+                hyper_background_noise=self.hyper_background_noise_for_instance(
+                    instance=instance
+                ),
+                settings_pixelization=self.settings.settings_pixelization,
+                settings_inversion=self.settings.settings_inversion,
+            ),
+            free_classes=free_classes,
+        )
+
+    def stochastic_log_evidences_for_instance(self, instance, sample_indexes=None):
+        """
+        The log evidences of the fits of an instance for stochastic samples of its pixelization, which differ only in
+        the KMeans seed of its sparse grid. The seed of every sample is its index, such that the samples computed in
+        chunks (see `save_stochastic_outputs`) give the same log evidences as those computed at once.
+
+        The products of the fit that do not depend on the seed are computed once and shared by every sample (see
+        `stochastic_preloads_for_tracer`) and the samples are dispatched to a thread pool (see `stochastic_map`).
+        Samples whose inversion fails are omitted.
+
+        Parameters
+        ----------
+        instance : af.ModelInstance
+            The instance whose stochastic log evidences are computed.
+        sample_indexes : [int] or None
+            The indexes of the samples that are computed, which are every sample in
+            `SettingsLens.stochastic_samples` if None.
+        """
         instance = self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
@@ -142,35 +288,42 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             instance=instance
         )
 
-        settings_pixelization = (
-            self.settings.settings_pixelization.settings_with_is_stochastic_true()
-        )
+        if sample_indexes is None:
+            sample_indexes = range(self.settings.settings_lens.stochastic_samples)
 
-        log_evidences = []
+        preloads = self.stochastic_preloads_for_tracer(tracer=tracer)
 
-        for i in range(self.settings.settings_lens.stochastic_samples):
+        settings_pixelizations = self.stochastic_settings_pixelizations_from(
+            seeds=sample_indexes
+        )
+
+        def log_evidence_from(settings_pixelization):
 
             try:
-                log_evidence = fit.FitImaging(
+                return fit.figure_of_merit_from(
                     masked_imaging=self.masked_dataset,
                     tracer=tracer,
                     hyper_image_sky=hyper_image_sky,
                     hyper_background_noise=hyper_background_noise,
                     settings_pixelization=settings_pixelization,
                     settings_inversion=self.settings.settings_inversion,
-                ).log_evidence
+                    preloads=preloads,
+                )
             except (
                 PixelizationException,
                 InversionException,
                 GridException,
                 OverflowError,
-            ) as e:
-                log_evidence = None
+            ):
+                return None
 
-            if log_evidence is not None:
-                log_evidences.append(log_evidence)
+        log_evidences = self.stochastic_map(
+            func=log_evidence_from, values=settings_pixelizations
+        )
 
-        return log_evidences
+        return [
+            log_evidence for log_evidence in log_evidences if log_evidence is not None
+        ]
 
     def visualize(self, paths: af.Paths, instance, during_analysis):
 
@@ -89,6 +89,8 @@ class PhaseImaging(dataset.PhaseDataset):
             results=results,
         )
 
+        self.set_preloads_of_analysis(analysis=analysis)
+
         return analysis
 
     def output_phase_info(self):
@@ -8,6 +8,7 @@ from autogalaxy.pipeline.phase.dataset import analysis as ag_analysis
 from autogalaxy.pipeline.phase.interferometer.analysis import Attributes as AgAttributes
 from autogalaxy.plot.mat_wrap import lensing_visuals, lensing_include
 from autolens.fit import fit
+from autolens.fit import preloads as pload
 from autolens.pipeline import visualizer as vis
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 
@@ -37,6 +38,10 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             self.hyper_galaxy_visibilities_path_dict = None
             self.hyper_model_visibilities = None
 
+        self.preloads_instance = None
+        self.preloads_free_classes = ()
+        self.preloads = None
+
     @property
     def masked_interferometer(self):
         return self.masked_dataset
@@ -129,10 +134,80 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             use_hyper_scaling=use_hyper_scalings,
             settings_pixelization=self.settings.settings_pixelization,
             settings_inversion=self.settings.settings_inversion,
+            preloads=self.preloads,
+        )
+
+    def preloads_from_instance(self, instance, free_classes):
+        """
+        Returns the preloads of the analysis, which are the products of a fit that are the same for the fits of
+        every instance of the phase's model and are therefore computed once and used by every fit (see `Preloads`).
+
+        Parameters
+        ----------
+        instance : ModelInstance
+            An instance of the phase's model, whose fit the preloads are taken from.
+        free_classes : (type,)
+            The classes of the components of the phase's model which have free parameters.
+        """
+        instance = self.associate_hyper_images(instance=instance)
+
+        return pload.Preloads.from_interferometer_fit(
+            fit=fit.FitInterferometer(
+                masked_interferometer=self.masked_dataset,
+                tracer=self.tracer_for_instance(instance=instance),
+                hyper_background_noise=self.hyper_background_noise_for_instance(
+                    instance=instance
+                ),
+                settings_pixelization=self.settings.settings_pixelization,
+                settings_inversion=self.settings.settings_inversion,
+            ),
+            free_classes=free_classes,
+        )
+
+    def stochastic_preloads_for_tracer(self, tracer):
+        """
+        The preloads shared by every stochastic sample of a tracer's fit, which are the products of the fit that do
+        not depend on the KMeans seed of the pixelization: the profile visibilities of the tracer's light profiles
+        and its ray-traced grid of the inversion, which is stored in the tracer's traced grids cache.
+
+        The inversion preloads of the analysis are removed, as the mapper and every product of the inversion depend
+        on the seed.
+        """
+        preloads = self.preloads.without_inversion
+
+        preloads.preload_tracer(tracer=tracer)
+        preloads.traced_grids_of_planes_of_grids = None
+
+        if preloads.profile_visibilities is None:
+            preloads.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
+                grid=self.masked_dataset.grid,
+                transformer=self.masked_dataset.transformer,
+            )
+
+        tracer.traced_grids_of_planes_from_grid(
+            grid=self.masked_dataset.grid_inversion
         )
 
-    def stochastic_log_evidences_for_instance(self, instance):
+        return preloads
 
+    def stochastic_log_evidences_for_instance(self, instance, sample_indexes=None):
+        """
+        The log evidences of the fits of an instance for stochastic samples of its pixelization, which differ only in
+        the KMeans seed of its sparse grid. The seed of every sample is its index, such that the samples computed in
+        chunks (see `save_stochastic_outputs`) give the same log evidences as those computed at once.
+
+        The products of the fit that do not depend on the seed are computed once and shared by every sample (see
+        `stochastic_preloads_for_tracer`) and the samples are dispatched to a thread pool (see `stochastic_map`).
+        Samples whose inversion fails are omitted.
+
+        Parameters
+        ----------
+        instance : af.ModelInstance
+            The instance whose stochastic log evidences are computed.
+        sample_indexes : [int] or None
+            The indexes of the samples that are computed, which are every sample in
+            `SettingsLens.stochastic_samples` if None.
+        """
         instance = self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
@@ -148,34 +223,41 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             instance=instance
         )
 
-        settings_pixelization = (
-            self.settings.settings_pixelization.settings_with_is_stochastic_true()
-        )
+        if sample_indexes is None:
+            sample_indexes = range(self.settings.settings_lens.stochastic_samples)
 
-        log_evidences = []
+        preloads = self.stochastic_preloads_for_tracer(tracer=tracer)
 
-        for i in range(self.settings.settings_lens.stochastic_samples):
+        settings_pixelizations = self.stochastic_settings_pixelizations_from(
+            seeds=sample_indexes
+        )
+
+        def log_evidence_from(settings_pixelization):
 
             try:
-                log_evidence = fit.FitInterferometer(
+                return fit.FitInterferometer(
                     masked_interferometer=self.masked_dataset,
                     tracer=tracer,
                     hyper_background_noise=hyper_background_noise,
                     settings_pixelization=settings_pixelization,
                     settings_inversion=self.settings.settings_inversion,
+                    preloads=preloads,
                 ).log_evidence
             except (
                 PixelizationException,
                 InversionException,
                 GridException,
                 OverflowError,
-            ) as e:
-                log_evidence = None
+            ):
+                return None
 
-            if log_evidence is not None:
-                log_evidences.append(log_evidence)
+        log_evidences = self.stochastic_map(
+            func=log_evidence_from, values=settings_pixelizations
+        )
 
-        return log_evidences
+        return [
+            log_evidence for log_evidence in log_evidences if log_evidence is not None
+        ]
 
     def visualize(self, paths: af.Paths, instance, during_analysis):
 
@@ -88,13 +88,17 @@ class PhaseInterferometer(dataset.PhaseDataset):
 
         self.output_phase_info()
 
-        return self.Analysis(
+        analysis = self.Analysis(
             masked_interferometer=masked_interferometer,
             settings=self.settings,
             cosmology=self.cosmology,
             results=results,
         )
 
+        self.set_preloads_of_analysis(analysis=analysis)
+
+        return analysis
+
     def output_phase_info(self):
 
         file_phase_info = path.join(self.search.paths.output_path, "phase.info")
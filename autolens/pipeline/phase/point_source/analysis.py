@@ -2,6 +2,7 @@ from autofit.exc import FitException
 from autogalaxy.pipeline.phase.abstract import analysis as ag_analysis
 from autolens.fit import fit_point_source
 from autolens.pipeline import visualizer as vis
+from autolens.lens import positions_solver as pos
 from autolens.lens import ray_tracing
 
 import numba
@@ -31,6 +32,9 @@ class Analysis(ag_analysis.Analysis):
         self.imaging = imaging
         self.results = results
 
+        if isinstance(self.solver, pos.WarmStartSolver):
+            self.solver.seed_with(coordinates=positions)
+
     def tracer_for_instance(self, instance):
 
         return ray_tracing.Tracer.from_galaxies(
@@ -54,6 +58,18 @@ class Analysis(ag_analysis.Analysis):
 
         tracer = self.tracer_for_instance(instance=instance)
 
+        log_likelihood = fit_point_source.log_likelihood_via_jit_from(
+            positions=self.positions,
+            noise_map=self.noise_map,
+            tracer=tracer,
+            positions_solver=self.solver,
+            fluxes=self.fluxes,
+            fluxes_noise_map=self.fluxes_noise_map,
+        )
+
+        if log_likelihood is not None:
+            return log_likelihood
+
         try:
             fit_positions = self.fit_positions_for_tracer(tracer=tracer)
         except (AttributeError, numba.errors.TypingError) as e:
@@ -62,7 +78,10 @@ class Analysis(ag_analysis.Analysis):
         log_likelihood_positions = fit_positions.log_likelihood
 
         if self.fluxes is not None:
-            fit_fluxes = self.fit_fluxes_for_tracer(tracer=tracer)
+            fit_fluxes = self.fit_fluxes_for_tracer(
+                tracer=tracer,
+                positions_solver_result=fit_positions.positions_solver_result,
+            )
             log_likelihood_fluxes = fit_fluxes.log_likelihood
         else:
             log_likelihood_fluxes = 0.0
@@ -70,21 +89,36 @@ class Analysis(ag_analysis.Analysis):
         return log_likelihood_positions + log_likelihood_fluxes
 
     def fit_positions_for_tracer(self, tracer):
+        """
+        Fit the positions using the tracer, where a `WarmStartSolver` whose fit fails is reset and the fit is repeated
+        using its full search, such that a failure is only raised if the full search also fails.
+        """
 
-        return fit_point_source.FitPositionsImage(
-            positions=self.positions,
-            noise_map=self.noise_map,
-            positions_solver=self.solver,
-            tracer=tracer,
-        )
+        def fit_positions():
+            return fit_point_source.FitPositionsImage(
+                positions=self.positions,
+                noise_map=self.noise_map,
+                positions_solver=self.solver,
+                tracer=tracer,
+            )
+
+        if not isinstance(self.solver, pos.WarmStartSolver):
+            return fit_positions()
 
-    def fit_fluxes_for_tracer(self, tracer):
+        try:
+            return fit_positions()
+        except (AttributeError, IndexError, numba.errors.TypingError):
+            self.solver.reset()
+            return fit_positions()
+
+    def fit_fluxes_for_tracer(self, tracer, positions_solver_result=None):
 
         return fit_point_source.FitFluxes(
             fluxes=self.fluxes,
-            noise_map=self.noise_map,
+            noise_map=self.fluxes_noise_map,
             positions=self.positions,
             tracer=tracer,
+            positions_solver_result=positions_solver_result,
         )
 
     def visualize(self, paths, instance, during_analysis):
@@ -1,7 +1,8 @@
 from autoconf import conf
 from autoarray.inversion import pixelizations as pix, inversions as inv
-from autogalaxy.dataset import imaging, interferometer
+from autogalaxy.dataset import interferometer
 from autogalaxy.pipeline.phase import settings
+from autolens.dataset import imaging
 from autolens.lens.settings import SettingsLens
 
 
@@ -0,0 +1,116 @@
+# %%
+"""
+__Benchmark Remove Duplicates__
+
+Times the removal of duplicate coordinates performed after every refinement iteration of the `PositionsSolver`, for
+the numbers of candidate coordinates that occur when the initial grid finds many peaks (e.g. near critical curves).
+
+The candidates are made the same way the solver makes them: buffed and upscaled grids are created around peak
+coordinates which are close to one another, such that the grids overlap and contain duplicate coordinates.
+
+The spatial hash used by `grid_remove_duplicates` is compared to the separation matrix of every pair of coordinates
+it replaced, and the coordinates both return are checked to be identical.
+"""
+
+# %%
+from autoarray import decorator_util
+from autolens.lens import positions_solver as pos
+import numpy as np
+import time
+
+# %%
+"""The pair-wise separation matrix algorithm, which scales as O(N^2) in time and memory."""
+
+
+# %%
+@decorator_util.jit()
+def grid_remove_duplicates_via_separations(grid):
+
+    tolerance = 1e-8
+
+    grid_no_duplicates = []
+
+    separations = np.zeros((grid.shape[0], grid.shape[0]))
+
+    for i in range(grid.shape[0]):
+        for j in range(grid.shape[0]):
+            separations[i, j] = np.sqrt(
+                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
+            )
+            separations[i, i] = tolerance * 2
+
+    for i in range(grid.shape[0]):
+
+        is_duplicate = False
+
+        for j in range(grid.shape[0]):
+
+            if separations[i, j] < tolerance:
+
+                is_duplicate = True
+                separations[i, j] = tolerance * 2
+                separations[j, i] = tolerance * 2
+
+        if not is_duplicate:
+            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+
+    return grid_no_duplicates
+
+
+# %%
+"""
+Candidates are buffed and upscaled grids around peaks which lie on a coarse grid, so that neighboring grids overlap,
+using the buffer and upscale factor of `PositionsSolver.refined_coordinates_from_coordinate`.
+"""
+
+
+# %%
+def candidates_from(total_peaks, pixel_scale=0.05, buffer=4, upscale_factor=2):
+
+    peaks = pixel_scale * np.random.randint(-20, 20, size=(total_peaks, 2))
+
+    return np.concatenate(
+        [
+            pos.grid_buffed_around_coordinate_from(
+                coordinate=peak,
+                pixel_scales=(pixel_scale, pixel_scale),
+                buffer=buffer,
+                upscale_factor=upscale_factor,
+            )
+            for peak in peaks
+        ]
+    )
+
+
+# %%
+np.random.seed(1)
+
+repeats = 5
+
+"""Compile both functions before they are timed."""
+
+grid_remove_duplicates_via_separations(grid=candidates_from(total_peaks=1))
+pos.grid_remove_duplicates(grid=candidates_from(total_peaks=1))
+
+for total_peaks in [1, 5, 20, 50]:
+
+    candidates = candidates_from(total_peaks=total_peaks)
+
+    start = time.time()
+    for i in range(repeats):
+        grid_via_separations = grid_remove_duplicates_via_separations(
+            grid=candidates
+        )
+    time_via_separations = (time.time() - start) / repeats
+
+    start = time.time()
+    for i in range(repeats):
+        grid = pos.grid_remove_duplicates(grid=candidates)
+    time_via_spatial_hash = (time.time() - start) / repeats
+
+    assert sorted(grid) == sorted(grid_via_separations)
+
+    print(
+        f"Candidates = {candidates.shape[0]}, Unique = {len(grid)}, "
+        f"Separations = {time_via_separations}s, Spatial Hash = {time_via_spatial_hash}s"
+    )
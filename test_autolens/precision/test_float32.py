@@ -0,0 +1,183 @@
+"""
+Measures the numerical error of ray-tracing and fitting an image in single precision (a `Tracer` and `MaskedImaging`
+with `precision="float32"`) relative to double precision, for lens models representative of those fitted in
+practise (an elliptical power-law with shear, an NFW and a multi-plane lens system).
+
+The maximum error of every quantity is printed (run with `pytest -s`), and each test fails if the error exceeds the
+tolerance below, so that a change which degrades the accuracy of single precision modeling is detected.
+
+The deflection angles of an NFW are computed from the difference of two terms which nearly cancel close to its
+centre, thus its traced grids have a larger single precision error than other mass profiles, which is recorded by
+a larger tolerance for this model.
+"""
+import autolens as al
+import numpy as np
+import pytest
+
+grid_tolerance = 1.0e-5
+grid_tolerance_nfw = 1.0e-2
+image_tolerance = 1.0e-4
+log_likelihood_tolerance = 1.0e-6
+
+
+def galaxies_list():
+
+    return [
+        [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(
+                    elliptical_comps=(0.1, 0.05), intensity=1.0, sersic_index=4.0
+                ),
+                mass=al.mp.EllipticalPowerLaw(
+                    elliptical_comps=(0.2, 0.1), einstein_radius=1.2, slope=2.1
+                ),
+                shear=al.mp.ExternalShear(elliptical_comps=(0.05, 0.02)),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.EllipticalSersic(
+                    centre=(0.1, 0.1),
+                    elliptical_comps=(0.2, 0.0),
+                    intensity=0.3,
+                    effective_radius=0.3,
+                ),
+            ),
+        ],
+        [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalNFW(kappa_s=0.2, scale_radius=10.0),
+                mass_1=al.mp.EllipticalIsothermal(
+                    elliptical_comps=(0.1, 0.0), einstein_radius=0.8
+                ),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.EllipticalExponential(
+                    centre=(0.05, 0.0), intensity=0.5, effective_radius=0.2
+                ),
+            ),
+        ],
+        [
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(intensity=1.0),
+                mass=al.mp.EllipticalIsothermal(
+                    elliptical_comps=(0.1, 0.0), einstein_radius=1.0
+                ),
+            ),
+            al.Galaxy(
+                redshift=0.75, mass=al.mp.SphericalIsothermal(einstein_radius=0.2)
+            ),
+            al.Galaxy(
+                redshift=2.0,
+                light=al.lp.EllipticalSersic(
+                    elliptical_comps=(0.1, 0.2), intensity=0.3, effective_radius=0.2
+                ),
+            ),
+        ],
+    ]
+
+
+def max_relative_error(values_float32, values):
+
+    values = np.asarray(values)
+
+    return np.max(
+        np.abs(np.asarray(values_float32) - values) / np.max(np.abs(values))
+    )
+
+
+def masked_imaging_from(precision):
+
+    shape_native = (100, 100)
+    pixel_scales = 0.05
+
+    imaging = al.Imaging(
+        image=al.Array2D.full(
+            fill_value=0.1, shape_native=shape_native, pixel_scales=pixel_scales
+        ),
+        noise_map=al.Array2D.full(
+            fill_value=0.01, shape_native=shape_native, pixel_scales=pixel_scales
+        ),
+        psf=al.Kernel2D.from_gaussian(
+            shape_native=(11, 11), sigma=0.1, pixel_scales=pixel_scales
+        ),
+    )
+
+    mask = al.Mask2D.circular(
+        shape_native=shape_native, pixel_scales=pixel_scales, radius=2.0
+    )
+
+    return al.MaskedImaging(
+        imaging=imaging,
+        mask=mask,
+        settings=al.SettingsMaskedImaging(sub_size=4, precision=precision),
+    )
+
+
+@pytest.mark.parametrize(
+    "galaxies, tolerance",
+    zip(galaxies_list(), [grid_tolerance, grid_tolerance_nfw, grid_tolerance]),
+)
+def test__float32_traced_grids_and_image__error_relative_to_float64(
+    galaxies, tolerance
+):
+
+    grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05, sub_size=4)
+
+    tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+    tracer_float32 = al.Tracer.from_galaxies(galaxies=galaxies, precision="float32")
+
+    for (plane_index, (traced_grid, traced_grid_float32)) in enumerate(
+        zip(
+            tracer.traced_grids_of_planes_from_grid(grid=grid),
+            tracer_float32.traced_grids_of_planes_from_grid(grid=grid),
+        )
+    ):
+
+        error = max_relative_error(traced_grid_float32, traced_grid)
+
+        print(f"Traced grid of plane {plane_index}: {error}")
+
+        assert traced_grid_float32.dtype == np.float32
+        assert error < tolerance
+
+    image = tracer.image_from_grid(grid=grid)
+    image_float32 = tracer_float32.image_from_grid(grid=grid)
+
+    error = max_relative_error(image_float32, image)
+
+    print(f"Image: {error}")
+
+    assert image_float32.dtype == np.float32
+    assert error < image_tolerance
+
+
+@pytest.mark.parametrize("galaxies", galaxies_list())
+def test__float32_fit__error_relative_to_float64(galaxies):
+
+    fit = al.FitImaging(
+        masked_imaging=masked_imaging_from(precision="float64"),
+        tracer=al.Tracer.from_galaxies(galaxies=galaxies),
+    )
+
+    fit_float32 = al.FitImaging(
+        masked_imaging=masked_imaging_from(precision="float32"),
+        tracer=al.Tracer.from_galaxies(galaxies=galaxies, precision="float32"),
+    )
+
+    error = max_relative_error(fit_float32.blurred_image, fit.blurred_image)
+
+    print(f"Blurred image: {error}")
+
+    assert error < image_tolerance
+
+    error = np.abs(
+        (fit_float32.log_likelihood - fit.log_likelihood) / fit.log_likelihood
+    )
+
+    print(f"Log likelihood: {error}")
+
+    assert error < log_likelihood_tolerance
@@ -1,5 +1,8 @@
 import autolens as al
+from autolens import exc
+from autolens.lens import ray_tracing
 import numpy as np
+import pytest
 
 
 class TestMaskedImaging:
@@ -44,6 +47,36 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.slim == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__precision_float32__grid_and_blurring_grid_are_float32(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            settings=al.SettingsMaskedImaging(psf_shape_2d=(3, 3)),
+        )
+
+        masked_imaging_7x7_float32 = al.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            settings=al.SettingsMaskedImaging(psf_shape_2d=(3, 3), precision="float32"),
+        )
+
+        assert masked_imaging_7x7.grid.dtype == np.float64
+        assert masked_imaging_7x7_float32.precision == "float32"
+        assert masked_imaging_7x7_float32.grid.dtype == np.float32
+        assert masked_imaging_7x7_float32.blurring_grid.dtype == np.float32
+        assert masked_imaging_7x7_float32.image.dtype == np.float64
+        assert isinstance(masked_imaging_7x7_float32.grid, al.Grid2D)
+        assert masked_imaging_7x7_float32.grid.mask is masked_imaging_7x7.grid.mask
+        assert masked_imaging_7x7_float32.grid == pytest.approx(
+            masked_imaging_7x7.grid, 1.0e-6
+        )
+
+        with pytest.raises(exc.SettingsException):
+            al.SettingsMaskedImaging(precision="float16")
+
 
 class TestSimulatorImaging:
     def test__from_tracer_and_grid__same_as_tracer_image(self):
@@ -84,6 +117,43 @@ class TestSimulatorImaging:
         assert (imaging.psf == imaging_via_image.psf).all()
         assert (imaging.noise_map == imaging_via_image.noise_map).all()
 
+    def test__from_tracer_and_grid__grid_above_chunk_size__same_as_without_chunks(
+        self, monkeypatch
+    ):
+        psf = al.Kernel2D.from_gaussian(
+            shape_native=(7, 7), sigma=0.5, pixel_scales=1.0
+        )
+
+        grid = al.Grid2D.uniform(shape_native=(20, 20), pixel_scales=0.05, sub_size=2)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0),
+                    mass=al.mp.EllipticalIsothermal(einstein_radius=1.6),
+                ),
+                al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=0.3)),
+            ]
+        )
+
+        simulator = al.SimulatorImaging(
+            psf=psf,
+            exposure_time=10000.0,
+            background_sky_level=100.0,
+            add_poisson_noise=False,
+        )
+
+        imaging = simulator.from_tracer_and_grid(tracer=tracer, grid=grid)
+
+        monkeypatch.setattr(
+            ray_tracing, "grid_chunk_size_from_config", lambda: 100
+        )
+
+        imaging_via_chunks = simulator.from_tracer_and_grid(tracer=tracer, grid=grid)
+
+        assert (imaging_via_chunks.image == imaging.image).all()
+
     def test__from_deflections_and_galaxies__same_as_calculation_using_tracer(self):
 
         psf = al.Kernel2D.no_blur(pixel_scales=0.05)
@@ -1,4 +1,5 @@
 import autolens as al
+from autolens.fit import fit as fit_lens
 import numpy as np
 import pytest
 from autoarray.inversion import inversions
@@ -1659,6 +1660,84 @@ class TestFitImaging:
             assert fit.subtracted_images_of_planes[1].slim[0] == -0.0
 
 
+class TestFigureOfMerit:
+    def test__same_as_fit_imaging__profiles_only(self, masked_imaging_7x7):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                    mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                al.Galaxy(
+                    redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+                ),
+            ]
+        )
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert fit_lens.figure_of_merit_from(
+            masked_imaging=masked_imaging_7x7, tracer=tracer
+        ) == pytest.approx(fit.figure_of_merit, 1.0e-10)
+
+        chi_squared, noise_normalization = fit_lens.log_likelihood_terms_from(
+            data=np.asarray(fit.image),
+            model_data=np.asarray(fit.model_image),
+            noise_map=np.asarray(fit.noise_map),
+        )
+
+        assert chi_squared == pytest.approx(fit.chi_squared, 1.0e-10)
+        assert noise_normalization == pytest.approx(fit.noise_normalization, 1.0e-10)
+
+    def test__same_as_fit_imaging__profiles_inversion_and_hyper(
+        self, masked_imaging_7x7
+    ):
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=al.Array2D.ones(shape_native=(3, 3), pixel_scales=1.0),
+            hyper_galaxy_image=al.Array2D.ones(shape_native=(3, 3), pixel_scales=1.0),
+            hyper_minimum_value=0.0,
+        )
+
+        galaxy_pix = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_pix])
+
+        for use_hyper_scaling in [True, False]:
+
+            fit = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+                use_hyper_scaling=use_hyper_scaling,
+            )
+
+            figure_of_merit = fit_lens.figure_of_merit_from(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+                use_hyper_scaling=use_hyper_scaling,
+            )
+
+            assert figure_of_merit == pytest.approx(fit.log_evidence, 1.0e-10)
+
+
 class TestFitInterferometer:
     class TestFitProperties:
         def test__total_inversions(self, masked_interferometer_7):
@@ -1,4 +1,5 @@
 import autolens as al
+from autolens.fit import fit_point_source
 import numpy as np
 import pytest
 from autolens.mock import mock
@@ -187,6 +188,34 @@ class TestFitPositionsImage:
         assert fit.noise_normalization == pytest.approx(2.289459, 1.0e-4)
         assert fit.log_likelihood == pytest.approx(-4.144729, 1.0e-4)
 
+    def test__gradient_solver__model_positions_solve_lens_equation(self):
+
+        point_source = al.ps.PointSource(centre=(0.0, 0.11))
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(redshift=1.0, point_0=point_source),
+            ]
+        )
+
+        positions = al.Grid2DIrregular([(0.0, 1.1), (0.0, -0.9)])
+        noise_map = al.ValuesIrregular([0.1, 0.1])
+
+        fit = al.FitPositionsImage(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=tracer,
+            positions_solver=al.GradientSolver(
+                grid=al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+            ),
+        )
+
+        assert fit.model_positions.in_list[0] == pytest.approx((0.0, 1.11), 1.0e-8)
+        assert fit.model_positions.in_list[1] == pytest.approx((0.0, -0.89), 1.0e-8)
+        assert fit.residual_map.in_list == pytest.approx([0.01, 0.01], 1.0e-6)
+
 
 class TestFitFluxes:
     def test__one_set_of_fluxes__residuals_likelihood_correct(self):
@@ -229,3 +258,194 @@ class TestFitFluxes:
 
         assert fit.model_fluxes.in_list[1] == pytest.approx(2.5, 1.0e-4)
         assert fit.log_likelihood == pytest.approx(-3.11702, 1.0e-4)
+
+    def test__positions_solver_result__its_magnifications_are_used(self):
+
+        tracer = mock.MockTracer(
+            magnification=al.ValuesIrregular([2.0, 2.0]), attribute=2.0
+        )
+
+        fluxes = al.ValuesIrregular([1.0, 2.0])
+        noise_map = al.ValuesIrregular([3.0, 1.0])
+        positions = al.Grid2DIrregular([(0.0, 0.0), (3.0, 4.0)])
+
+        positions_solver_result = al.FitPositionsImage(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=tracer,
+            positions_solver=mock.MockPositionsSolver(model_positions=positions),
+        ).positions_solver_result
+
+        positions_solver_result._magnifications = np.array([1.0, 3.0])
+
+        fit = al.FitFluxes(
+            fluxes=fluxes,
+            noise_map=noise_map,
+            positions=positions,
+            tracer=tracer,
+            positions_solver_result=positions_solver_result,
+        )
+
+        assert fit.magnifications.in_list == [1.0, 3.0]
+        assert fit.model_fluxes.in_list == [2.0, 6.0]
+
+
+class TestLogLikelihoodViaJit:
+    def test__deflections_via_mass_profiles__same_as_mass_profiles(self):
+
+        grid = al.Grid2DIrregular([(0.5, 1.0), (-1.2, 0.3), (0.1, -0.7)])
+
+        sis = al.mp.SphericalIsothermal(centre=(0.1, -0.2), einstein_radius=1.2)
+        sie = al.mp.EllipticalIsothermal(
+            centre=(-0.1, 0.05), elliptical_comps=(0.1, -0.2), einstein_radius=0.8
+        )
+
+        galaxy = al.Galaxy(redshift=0.5, sis=sis, sie=sie)
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy, al.Galaxy(redshift=1.0)])
+
+        mass_profile_types, mass_profile_parameters = fit_point_source.mass_profile_arrays_from(
+            tracer=tracer
+        )
+
+        deflections = fit_point_source.deflections_via_mass_profiles_jit(
+            np.asarray(grid), mass_profile_types, mass_profile_parameters
+        )
+
+        assert deflections == pytest.approx(
+            np.asarray(sis.deflections_from_grid(grid=grid))
+            + np.asarray(sie.deflections_from_grid(grid=grid)),
+            1.0e-8,
+        )
+
+        magnifications = fit_point_source.magnifications_via_mass_profiles_jit(
+            np.asarray(grid), mass_profile_types, mass_profile_parameters, 1.0e-4
+        )
+
+        assert magnifications == pytest.approx(
+            np.asarray(tracer.magnification_via_hessian_from_grid(grid=grid, buffer=1.0e-4)),
+            1.0e-6,
+        )
+
+    def test__log_likelihood__same_as_fit_positions_image_and_fit_fluxes(self):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.EllipticalIsothermal(
+                        centre=(0.001, 0.001),
+                        einstein_radius=1.0,
+                        elliptical_comps=(0.0, 0.111111),
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    point_0=al.ps.PointSourceFlux(centre=(0.02, 0.01), flux=2.0),
+                ),
+            ]
+        )
+
+        positions = al.Grid2DIrregular([(1.0, 0.0), (0.0, 0.9), (-1.0, 0.0)])
+        noise_map = al.ValuesIrregular([0.1, 0.1, 0.1])
+        fluxes = al.ValuesIrregular([3.0, 5.0, 4.0])
+        fluxes_noise_map = al.ValuesIrregular([1.0, 1.0, 2.0])
+
+        positions_solver = al.GradientSolver(
+            grid=al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+        )
+
+        log_likelihood = fit_point_source.log_likelihood_via_jit_from(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=tracer,
+            positions_solver=positions_solver,
+            fluxes=fluxes,
+            fluxes_noise_map=fluxes_noise_map,
+        )
+
+        fit_positions = al.FitPositionsImage(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=tracer,
+            positions_solver=positions_solver,
+        )
+
+        fit_fluxes = al.FitFluxes(
+            fluxes=fluxes,
+            noise_map=fluxes_noise_map,
+            positions=positions,
+            tracer=tracer,
+            positions_solver_result=fit_positions.positions_solver_result,
+        )
+
+        assert log_likelihood == pytest.approx(
+            fit_positions.log_likelihood + fit_fluxes.log_likelihood, 1.0e-6
+        )
+
+        log_likelihood = fit_point_source.log_likelihood_via_jit_from(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=tracer,
+            positions_solver=positions_solver,
+        )
+
+        assert log_likelihood == pytest.approx(fit_positions.log_likelihood, 1.0e-6)
+
+    def test__unsupported_solver_or_mass_profile__returns_none(self):
+
+        point_source_galaxy = al.Galaxy(
+            redshift=1.0, point_0=al.ps.PointSource(centre=(0.0, 0.11))
+        )
+
+        positions = al.Grid2DIrregular([(0.0, 1.1), (0.0, -0.9)])
+        noise_map = al.ValuesIrregular([0.1, 0.1])
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                point_source_galaxy,
+            ]
+        )
+
+        for positions_solver in [
+            mock.MockPositionsSolver(model_positions=positions),
+            al.PositionsSolver(grid=grid, pixel_scale_precision=0.01),
+            al.WarmStartSolver(grid=grid),
+            al.GradientSolver(grid=grid, distance_from_source_centre=0.1),
+        ]:
+
+            assert (
+                fit_point_source.log_likelihood_via_jit_from(
+                    positions=positions,
+                    noise_map=noise_map,
+                    tracer=tracer,
+                    positions_solver=positions_solver,
+                )
+                is None
+            )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    shear=al.mp.ExternalShear(elliptical_comps=(0.0, 0.05)),
+                ),
+                point_source_galaxy,
+            ]
+        )
+
+        assert fit_point_source.mass_profile_arrays_from(tracer=tracer) is None
+        assert (
+            fit_point_source.log_likelihood_via_jit_from(
+                positions=positions,
+                noise_map=noise_map,
+                tracer=tracer,
+                positions_solver=al.GradientSolver(grid=grid),
+            )
+            is None
+        )
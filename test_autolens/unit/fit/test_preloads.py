@@ -0,0 +1,272 @@
+import autolens as al
+from autolens.fit.preloads import Preloads
+import numpy as np
+import pytest
+
+
+def tracer_from(intensity=1.0, einstein_radius=1.0, coefficient=None):
+
+    if coefficient is None:
+        return al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0),
+                    mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+                ),
+                al.Galaxy(
+                    redshift=1.0, light=al.lp.EllipticalSersic(intensity=intensity)
+                ),
+            ]
+        )
+
+    return al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(intensity=intensity),
+                mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(coefficient=coefficient),
+            ),
+        ]
+    )
+
+
+class TestPreloads:
+    def test__from_imaging_fit__fixed_profile_products_are_preloaded(
+        self, masked_imaging_7x7
+    ):
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer_from())
+
+        preloads = Preloads.from_imaging_fit(fit=fit, free_classes=())
+
+        assert preloads.blurred_image is fit.blurred_image
+        assert preloads.traced_grids_of_planes_of_grids[0][0] is masked_imaging_7x7.grid
+        assert preloads.traced_grids_of_planes_of_grids[0][1][1] == pytest.approx(
+            tracer_from().traced_grids_of_planes_from_grid(
+                grid=masked_imaging_7x7.grid
+            )[1],
+            1.0e-10,
+        )
+        assert preloads.mapper is None
+
+        preloads = Preloads.from_imaging_fit(
+            fit=fit, free_classes=(al.lp.EllipticalSersic,)
+        )
+
+        assert preloads.blurred_image is None
+        assert preloads.traced_grids_of_planes_of_grids is not None
+
+        for free_classes in [
+            (al.mp.SphericalIsothermal,),
+            (al.Galaxy,),
+            (al.Redshift,),
+        ]:
+
+            preloads = Preloads.from_imaging_fit(fit=fit, free_classes=free_classes)
+
+            assert preloads.blurred_image is None
+            assert preloads.traced_grids_of_planes_of_grids is None
+
+    def test__from_imaging_fit__fixed_inversion_products_are_preloaded_in_tiers(
+        self, masked_imaging_7x7
+    ):
+
+        fit = al.FitImaging(
+            masked_imaging=masked_imaging_7x7, tracer=tracer_from(coefficient=1.0)
+        )
+
+        preloads = Preloads.from_imaging_fit(fit=fit, free_classes=())
+
+        assert preloads.mapper is fit.inversion.mapper
+        assert (
+            preloads.blurred_mapping_matrix == fit.inversion.blurred_mapping_matrix
+        ).all()
+        assert preloads.curvature_matrix == pytest.approx(
+            fit.inversion.curvature_reg_matrix - fit.inversion.regularization_matrix,
+            1.0e-8,
+        )
+        assert preloads.data_vector is not None
+        assert preloads.regularization_matrix is not None
+
+        preloads = Preloads.from_imaging_fit(
+            fit=fit, free_classes=(al.reg.Constant,)
+        )
+
+        assert preloads.mapper is not None
+        assert preloads.data_vector is not None
+        assert preloads.regularization_matrix is None
+
+        preloads = Preloads.from_imaging_fit(
+            fit=fit, free_classes=(al.lp.EllipticalSersic, al.reg.Constant)
+        )
+
+        assert preloads.mapper is not None
+        assert preloads.curvature_matrix is not None
+        assert preloads.data_vector is None
+        assert preloads.regularization_matrix is None
+
+        preloads = Preloads.from_imaging_fit(
+            fit=fit, free_classes=(al.hyper_data.HyperBackgroundNoise,)
+        )
+
+        assert preloads.mapper is not None
+        assert preloads.curvature_matrix is None
+        assert preloads.data_vector is None
+
+        preloads = Preloads.from_imaging_fit(
+            fit=fit, free_classes=(al.pix.Rectangular,)
+        )
+
+        assert preloads.mapper is None
+        assert preloads.blurred_mapping_matrix is None
+        assert preloads.regularization_matrix is None
+
+        preloads = Preloads.from_imaging_fit(
+            fit=fit, free_classes=(al.mp.SphericalIsothermal,)
+        )
+
+        assert preloads.mapper is None
+        assert preloads.blurred_image is None
+
+        preloads = Preloads.from_imaging_fit(fit=fit, free_classes=()).without_inversion
+
+        assert preloads.mapper is None
+        assert preloads.blurred_image is not None
+
+    def test__from_interferometer_fit__fixed_products_are_preloaded(
+        self, masked_interferometer_7
+    ):
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer_7, tracer=tracer_from()
+        )
+
+        preloads = Preloads.from_interferometer_fit(
+            fit=fit, free_classes=(al.lp.EllipticalSersic,)
+        )
+
+        assert preloads.profile_visibilities is None
+        assert preloads.traced_grids_of_planes_of_grids is not None
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer_7,
+            tracer=tracer_from(coefficient=1.0),
+        )
+
+        preloads = Preloads.from_interferometer_fit(
+            fit=fit, free_classes=(al.reg.Constant,)
+        )
+
+        assert preloads.profile_visibilities is fit.profile_visibilities
+        assert preloads.mapper is fit.inversion.mapper
+        assert preloads.regularization_matrix is None
+
+    def test__preload_tracer__traced_grids_are_loaded_into_cache(
+        self, masked_imaging_7x7
+    ):
+
+        preloads = Preloads.from_imaging_fit(
+            fit=al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer_from(einstein_radius=1.0),
+            ),
+            free_classes=(),
+        )
+
+        tracer = tracer_from(einstein_radius=2.0)
+
+        preloads.preload_tracer(tracer=tracer)
+
+        traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+            grid=masked_imaging_7x7.grid
+        )
+
+        assert traced_grids_of_planes[1] == pytest.approx(
+            preloads.traced_grids_of_planes_of_grids[0][1][1], 1.0e-10
+        )
+        assert traced_grids_of_planes[1] is not (
+            preloads.traced_grids_of_planes_of_grids[0][1][1]
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic())]
+        )
+
+        preloads.preload_tracer(tracer=tracer)
+
+        assert tracer.traced_grids_of_planes_from_grid(
+            grid=masked_imaging_7x7.grid
+        )[0] == pytest.approx(np.asarray(masked_imaging_7x7.grid), 1.0e-10)
+
+    def test__fits_with_preloads__same_as_fits_without_preloads(
+        self, masked_imaging_7x7, masked_interferometer_7
+    ):
+
+        preloads = Preloads.from_imaging_fit(
+            fit=al.FitImaging(
+                masked_imaging=masked_imaging_7x7, tracer=tracer_from(intensity=3.0)
+            ),
+            free_classes=(),
+        )
+
+        fit = al.FitImaging(
+            masked_imaging=masked_imaging_7x7, tracer=tracer_from(intensity=3.0)
+        )
+        fit_preloads = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer_from(intensity=3.0),
+            preloads=preloads,
+        )
+
+        assert fit_preloads.blurred_image is preloads.blurred_image
+        assert fit_preloads.figure_of_merit == pytest.approx(
+            fit.figure_of_merit, 1.0e-10
+        )
+
+        preloads = Preloads.from_imaging_fit(
+            fit=al.FitImaging(
+                masked_imaging=masked_imaging_7x7, tracer=tracer_from(coefficient=1.0)
+            ),
+            free_classes=(al.reg.Constant,),
+        )
+
+        fit = al.FitImaging(
+            masked_imaging=masked_imaging_7x7, tracer=tracer_from(coefficient=3.0)
+        )
+        fit_preloads = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer_from(coefficient=3.0),
+            preloads=preloads,
+        )
+
+        assert fit_preloads.inversion.mapper is preloads.mapper
+        assert fit_preloads.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+
+        preloads = Preloads.from_interferometer_fit(
+            fit=al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7,
+                tracer=tracer_from(intensity=3.0),
+            ),
+            free_classes=(),
+        )
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer_7,
+            tracer=tracer_from(intensity=3.0),
+        )
+        fit_preloads = al.FitInterferometer(
+            masked_interferometer=masked_interferometer_7,
+            tracer=tracer_from(intensity=3.0),
+            preloads=preloads,
+        )
+
+        assert fit_preloads.profile_visibilities is preloads.profile_visibilities
+        assert fit_preloads.figure_of_merit == pytest.approx(
+            fit.figure_of_merit, 1.0e-10
+        )
@@ -0,0 +1,154 @@
+import autolens as al
+from astropy import cosmology as cosmo
+import gc
+import weakref
+from autolens.lens import cosmology_cache
+
+import pytest
+
+
+class TestCosmologyCache:
+    def test__distances_are_same_as_cosmology_util(self):
+
+        cosmology_cache.cache_clear()
+
+        assert cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.Planck15
+        ) == al.util.cosmology.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.Planck15
+        )
+
+        assert cosmology_cache.angular_diameter_distance_between_redshifts_in_kpc_from(
+            redshift_0=0.5, redshift_1=1.0, cosmology=cosmo.Planck15
+        ) == al.util.cosmology.angular_diameter_distance_between_redshifts_in_kpc_from(
+            redshift_0=0.5, redshift_1=1.0, cosmology=cosmo.Planck15
+        )
+
+        assert cosmology_cache.critical_surface_density_between_redshifts_from(
+            redshift_0=0.5, redshift_1=1.0, cosmology=cosmo.Planck15
+        ) == pytest.approx(
+            al.util.cosmology.critical_surface_density_between_redshifts_from(
+                redshift_0=0.5, redshift_1=1.0, cosmology=cosmo.Planck15
+            ),
+            1.0e-8,
+        )
+
+        assert cosmology_cache.kpc_per_arcsec_from(
+            redshift=0.5, cosmology=cosmo.Planck15
+        ) == pytest.approx(
+            al.util.cosmology.kpc_per_arcsec_from(
+                redshift=0.5, cosmology=cosmo.Planck15
+            ),
+            1.0e-8,
+        )
+
+        assert cosmology_cache.scaling_factor_between_redshifts_from(
+            redshift_0=0.1, redshift_1=1.0, redshift_final=3.0, cosmology=cosmo.Planck15
+        ) == al.util.cosmology.scaling_factor_between_redshifts_from(
+            redshift_0=0.1, redshift_1=1.0, redshift_final=3.0, cosmology=cosmo.Planck15
+        )
+
+    def test__hits_and_misses_are_counted(self):
+
+        cosmology_cache.cache_clear()
+
+        cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.Planck15
+        )
+
+        cache_info = cosmology_cache.cache_info()["angular_diameter_distance_to_earth"]
+
+        assert cache_info.hits == 0
+        assert cache_info.misses == 1
+
+        cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.Planck15
+        )
+        cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=1.0, cosmology=cosmo.Planck15
+        )
+
+        cache_info = cosmology_cache.cache_info()["angular_diameter_distance_to_earth"]
+
+        assert cache_info.hits == 1
+        assert cache_info.misses == 2
+
+    def test__cache_is_keyed_by_cosmology(self):
+
+        cosmology_cache.cache_clear()
+
+        distance_planck = cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.Planck15
+        )
+        distance_wmap = cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.WMAP9
+        )
+
+        assert distance_planck != distance_wmap
+
+        cache_info = cosmology_cache.cache_info()["angular_diameter_distance_to_earth"]
+
+        assert cache_info.misses == 2
+
+    def test__cosmology_is_only_kept_by_the_cache_entries_of_it(self):
+
+        cosmology_cache.cache_clear()
+
+        cosmology = cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3)
+
+        cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmology
+        )
+        cosmology_cache.angular_diameter_distance_to_earth_in_kpc_from(
+            redshift=0.5, cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3)
+        )
+
+        cache_info = cosmology_cache.cache_info()["angular_diameter_distance_to_earth"]
+
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
+        cosmology_ref = weakref.ref(cosmology)
+
+        del cosmology
+        gc.collect()
+
+        assert cosmology_ref() is not None
+
+        cosmology_cache.cache_clear()
+        gc.collect()
+
+        assert cosmology_ref() is None
+
+    def test__tracers_with_same_plane_redshifts_share_cache(self):
+
+        cosmology_cache.cache_clear()
+
+        galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+
+        tracer_0 = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        cache_info = cosmology_cache.cache_info()
+
+        assert cache_info["angular_diameter_distance_to_earth"].misses == 0
+
+        tracer_0.scaling_factors_between_planes
+
+        cache_info = cosmology_cache.cache_info()
+
+        assert cache_info["angular_diameter_distance_to_earth"].misses == 2
+        assert cache_info["angular_diameter_distance_between_redshifts"].misses == 1
+
+        tracer_1 = al.Tracer.from_galaxies(galaxies=galaxies)
+        tracer_1.scaling_factors_between_planes
+
+        cache_info = cosmology_cache.cache_info()
+
+        assert cache_info["angular_diameter_distance_to_earth"].misses == 2
+        assert cache_info["angular_diameter_distance_to_earth"].hits == 2
+        assert cache_info["angular_diameter_distance_between_redshifts"].hits == 1
+
+        assert (
+            tracer_0.scaling_factors_between_planes
+            == tracer_1.scaling_factors_between_planes
+        ).all()
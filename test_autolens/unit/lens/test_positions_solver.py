@@ -3,6 +3,7 @@ import autolens as al
 from autolens.lens import positions_solver as pos
 
 import numpy as np
+import pickle
 
 import pytest
 
@@ -152,6 +153,723 @@ class TestPositionSolver:
         assert coordinates.in_list[2] == pytest.approx((0.009375, 0.95312), 1.0e-4)
         assert coordinates.in_list[3] == pytest.approx((-1.028125, -0.003125), 1.0e-4)
 
+    def test__refined_coordinates_from_coordinates__same_as_refining_every_coordinate(
+        self
+    ):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        coordinates = solver.grid_peaks_from(
+            lensing_obj=tracer, grid=solver.grid, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=coordinates,
+            pixel_scale=0.05,
+            lensing_obj=tracer,
+            source_plane_coordinate=(0.0, 0.0),
+        )
+
+        refined_coordinates_of_every_coordinate = []
+
+        for coordinate in coordinates:
+            refined_coordinates_of_every_coordinate += (
+                solver.refined_coordinates_from_coordinate(
+                    coordinate=coordinate,
+                    pixel_scale=0.05,
+                    lensing_obj=tracer,
+                    source_plane_coordinate=(0.0, 0.0),
+                )
+                or []
+            )
+
+        assert len(refined_coordinates) == 4
+        assert refined_coordinates == pytest.approx(
+            refined_coordinates_of_every_coordinate, 1.0e-8
+        )
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=[],
+            pixel_scale=0.05,
+            lensing_obj=tracer,
+            source_plane_coordinate=(0.0, 0.0),
+        )
+
+        assert refined_coordinates == []
+
+
+class TestSolveMany:
+    def test__positions_of_every_source_same_as_solving_every_source(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        source_plane_coordinates = [(0.0, 0.0), (0.05, 0.02), (0.3, 0.3)]
+
+        for solver in [
+            pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01),
+            al.GradientSolver(grid=grid),
+        ]:
+
+            coordinates_list = solver.solve_many(
+                lensing_obj=tracer, source_plane_coordinates=source_plane_coordinates
+            )
+
+            assert len(coordinates_list) == 3
+
+            for (coordinates, source_plane_coordinate) in zip(
+                coordinates_list, source_plane_coordinates
+            ):
+
+                assert (
+                    coordinates.in_list
+                    == solver.solve(
+                        lensing_obj=tracer,
+                        source_plane_coordinate=source_plane_coordinate,
+                    ).in_list
+                )
+
+
+class TestGradientSolver:
+    def test__positions_found_for_simple_mass_profiles__to_machine_precision(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.GradientSolver(grid=grid)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert len(positions) == 2
+        assert positions.in_list[0] == pytest.approx((0.0, -0.89), 1.0e-8)
+        assert positions.in_list[1] == pytest.approx((0.0, 1.11), 1.0e-8)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        coordinates = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        positions_solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        coordinates_via_grid = positions_solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        assert len(coordinates) == 4
+
+        source_plane_coordinates = tracer.traced_grids_of_planes_from_grid(
+            grid=coordinates
+        )[-1]
+
+        assert np.max(np.abs(source_plane_coordinates)) < 1.0e-10
+
+        for coordinate in coordinates.in_list:
+            assert min(
+                np.sqrt(
+                    (coordinate[0] - coordinate_via_grid[0]) ** 2
+                    + (coordinate[1] - coordinate_via_grid[1]) ** 2
+                )
+                for coordinate_via_grid in coordinates_via_grid.in_list
+            ) < 0.01
+
+    def test__newton_steps__solve_linear_system_and_are_limited_to_max_step(self):
+
+        hessian = (
+            np.array([0.5, 0.5]),
+            np.array([0.0, 0.0]),
+            np.array([0.0, 0.0]),
+            np.array([-1.0, -1.0]),
+        )
+
+        steps = pos.newton_steps_from(
+            residuals=np.array([[0.1, 0.2], [1.0, 2.0]]), hessian=hessian, max_step=1.0
+        )
+
+        assert steps[0] == pytest.approx(np.array([0.2, 0.1]), 1.0e-8)
+        assert steps[1] == pytest.approx(np.array([2.0, 1.0]) / np.sqrt(5.0), 1.0e-8)
+
+
+class TestWarmStartSolver:
+    def test__previous_images_are_starting_points__same_as_gradient_solver(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        solver = al.WarmStartSolver(grid=grid)
+        gradient_solver = al.GradientSolver(grid=grid)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        positions = solver.solve(lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0))
+
+        assert solver.total_solves == 1
+        assert solver.total_warm_solves == 0
+        assert len(positions) == 4
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.002, 0.001),
+                einstein_radius=1.01,
+                elliptical_comps=(0.0, 0.11),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        positions = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.01, 0.0)
+        )
+
+        positions_via_gradient = gradient_solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.01, 0.0)
+        )
+
+        assert solver.total_solves == 2
+        assert solver.total_warm_solves == 1
+        assert np.array(sorted(positions.in_list)) == pytest.approx(
+            np.array(sorted(positions_via_gradient.in_list)), abs=1.0e-8
+        )
+
+    def test__full_search_when_multiplicity_changes_or_refreshed(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.WarmStartSolver(grid=grid)
+
+        solver.seed_with(coordinates=[(0.0, 1.1), (0.0, 1.12)])
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert solver.total_warm_solves == 0
+        assert len(positions) == 2
+        assert solver.coordinates_dict[0].shape == (2, 2)
+
+        solver = al.WarmStartSolver(grid=grid, minimum_images=3)
+
+        solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+        solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert solver.total_warm_solves == 0
+
+        solver = al.WarmStartSolver(grid=grid, refresh_interval=1)
+
+        for i in range(3):
+            solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert solver.total_solves == 3
+        assert solver.total_warm_solves == 1
+
+    def test__warm_images_removed_by_distance_filters__same_as_full_search(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.WarmStartSolver(grid=grid, distance_from_mass_profile_centre=0.95)
+        gradient_solver = al.GradientSolver(
+            grid=grid, distance_from_mass_profile_centre=0.95
+        )
+
+        solver.seed_with(coordinates=[(0.0, 1.1), (0.0, -0.9)])
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        positions_via_gradient = gradient_solver.solve(
+            lensing_obj=sis, source_plane_coordinate=(0.0, 0.11)
+        )
+
+        assert solver.total_warm_solves == 0
+        assert positions.in_list == positions_via_gradient.in_list
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert np.array(positions.in_list) == pytest.approx(
+            np.array(positions_via_gradient.in_list), abs=1.0e-8
+        )
+
+        solver.reset()
+
+        assert solver.coordinates_dict == {}
+
+    def test__solve_many__previous_images_of_every_source_remembered(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.WarmStartSolver(grid=grid)
+
+        source_plane_coordinates = [(0.0, 0.11), (0.2, 0.0)]
+
+        positions_list = solver.solve_many(
+            lensing_obj=sis, source_plane_coordinates=source_plane_coordinates
+        )
+
+        positions_list_warm = solver.solve_many(
+            lensing_obj=sis, source_plane_coordinates=source_plane_coordinates
+        )
+
+        assert solver.total_solves == 4
+        assert solver.total_warm_solves == 2
+
+        for positions, positions_warm in zip(positions_list, positions_list_warm):
+            assert np.array(positions.in_list) == pytest.approx(
+                np.array(positions_warm.in_list), abs=1.0e-8
+            )
+
+
+class TestCriticalCurveGrid:
+    def test__critical_pixels_are_band_around_critical_curve__cached_per_lensing_obj(
+        self
+    ):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.GradientSolver(grid=grid, critical_curve_upscale_factor=4)
+
+        is_critical, critical_curve_grid, source_plane_critical_curve_grid = solver.critical_curve_grid_from(
+            lensing_obj=sis
+        )
+
+        radii = np.sqrt(np.sum(np.square(np.asarray(solver.grid)[is_critical]), axis=1))
+
+        assert np.sum(is_critical) > 0
+        assert np.all(np.abs(radii - 1.0) < 0.1)
+        assert critical_curve_grid.shape == (np.sum(is_critical) * 144, 2)
+        assert critical_curve_grid.pixel_scales == (0.0125, 0.0125)
+        assert source_plane_critical_curve_grid.shape == critical_curve_grid.shape
+
+        assert solver.critical_curve_grid_from(lensing_obj=sis)[1] is critical_curve_grid
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        assert (
+            solver.critical_curve_grid_from(lensing_obj=sis)[1]
+            is not critical_curve_grid
+        )
+
+        solver = pickle.loads(pickle.dumps(solver))
+
+        assert solver._critical_curve_grid_cache is None
+
+    def test__critical_pixels_from__determinant_changes_sign_relative_to_neighbor(
+        self
+    ):
+
+        determinants = np.array(
+            [-1.0, -1.0, 1.0, 1.0]
+            + [-1.0, -1.0, 1.0, 1.0]
+            + [-1.0, -1.0, 1.0, 1.0]
+            + [-1.0, -1.0, 1.0, 1.0]
+        )
+
+        neighbors, has_neighbors = pos.grid_square_neighbors_1d_from(shape_slim=16)
+
+        is_critical = pos.grid_critical_pixels_from(
+            determinants=determinants,
+            neighbors=neighbors,
+            has_neighbors=has_neighbors,
+            max_determinant=1.0,
+        )
+
+        assert np.where(is_critical)[0].tolist() == [5, 6, 9, 10]
+
+        is_critical = pos.grid_critical_pixels_from(
+            determinants=np.ones(16),
+            neighbors=neighbors,
+            has_neighbors=has_neighbors,
+            max_determinant=1.0,
+        )
+
+        assert not np.any(is_critical)
+
+        is_critical = pos.grid_critical_pixels_from(
+            determinants=10.0 * determinants,
+            neighbors=neighbors,
+            has_neighbors=has_neighbors,
+            max_determinant=1.0,
+        )
+
+        assert not np.any(is_critical)
+
+        determinants[6] = np.nan
+
+        is_critical = pos.grid_critical_pixels_from(
+            determinants=determinants,
+            neighbors=neighbors,
+            has_neighbors=has_neighbors,
+            max_determinant=1.0,
+        )
+
+        assert np.where(is_critical)[0].tolist() == [5, 9, 10]
+
+    def test__positions_same_as_uniform_initial_grid(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+        solver_adaptive = al.PositionsSolver(
+            grid=grid, pixel_scale_precision=0.01, critical_curve_upscale_factor=4
+        )
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+        positions_adaptive = solver_adaptive.solve(
+            lensing_obj=sis, source_plane_coordinate=(0.0, 0.11)
+        )
+
+        assert positions.in_list == positions_adaptive.in_list
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        solver = al.GradientSolver(grid=grid)
+        solver_adaptive = al.GradientSolver(grid=grid, critical_curve_upscale_factor=4)
+
+        coordinates = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+        coordinates_adaptive = solver_adaptive.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        assert len(coordinates_adaptive) == 4
+        assert np.array(sorted(coordinates_adaptive.in_list)) == pytest.approx(
+            np.array(sorted(coordinates.in_list)), abs=1.0e-8
+        )
+
+
+class TestPositionsSolverResult:
+    def test__gradient_solver__stores_traced_positions_and_magnifications(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.GradientSolver(grid=grid)
+
+        result = solver.result_from(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert result.positions.in_list == solver.solve(
+            lensing_obj=sis, source_plane_coordinate=(0.0, 0.11)
+        ).in_list
+        assert result._source_plane_positions is not None
+        assert result._magnifications is not None
+
+        assert result.source_plane_positions.in_list[0] == pytest.approx(
+            (0.0, 0.11), abs=1.0e-10
+        )
+        assert result.source_plane_positions.in_list[1] == pytest.approx(
+            (0.0, 0.11), abs=1.0e-10
+        )
+
+        magnifications = np.abs(
+            sis.magnification_via_hessian_from_grid(grid=result.positions, buffer=1e-5)
+        )
+
+        assert result.magnifications.in_list == pytest.approx(
+            list(magnifications), 1.0e-8
+        )
+
+        result = result.paired_to(grid_pair=al.Grid2DIrregular([(0.0, 1.1)]))
+
+        assert result.positions.in_list[0] == pytest.approx((0.0, 1.11), 1.0e-8)
+        assert result.magnifications.in_list == pytest.approx(
+            [magnifications[1]], 1.0e-8
+        )
+
+    def test__triangle_solver__stores_traced_positions_and_magnifications(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.TriangleSolver(grid=grid)
+
+        result = solver.result_from(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert result.positions.in_list == solver.solve(
+            lensing_obj=sis, source_plane_coordinate=(0.0, 0.11)
+        ).in_list
+        assert result._source_plane_positions is not None
+        assert result._magnifications is not None
+
+        assert result.source_plane_positions.in_list[0] == pytest.approx(
+            (0.0, 0.11), abs=1.0e-10
+        )
+        assert result.source_plane_positions.in_list[1] == pytest.approx(
+            (0.0, 0.11), abs=1.0e-10
+        )
+        assert result.magnifications.in_list == pytest.approx(
+            list(
+                np.abs(
+                    sis.magnification_via_hessian_from_grid(
+                        grid=result.positions, buffer=1e-5
+                    )
+                )
+            ),
+            1.0e-8,
+        )
+
+    def test__positions_solver__stores_traced_positions_of_last_refinement(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        result = solver.result_from(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert result.positions.in_list == solver.solve(
+            lensing_obj=sis, source_plane_coordinate=(0.0, 0.11)
+        ).in_list
+        assert result._source_plane_positions is not None
+        assert result._magnifications is not None
+
+        source_plane_positions = np.asarray(result.positions) - np.asarray(
+            sis.deflections_from_grid(grid=result.positions)
+        )
+
+        assert np.asarray(result.source_plane_positions) == pytest.approx(
+            source_plane_positions, 1.0e-8
+        )
+
+    def test__quantities_not_input__computed_from_lensing_obj(self):
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        positions = al.Grid2DIrregular([(0.0, 1.11), (0.0, -0.89)])
+
+        result = pos.PositionsSolverResult(positions=positions, lensing_obj=sis)
+
+        assert result.source_plane_positions.in_list[0] == pytest.approx(
+            (0.0, 0.11), 1.0e-4
+        )
+        assert result.source_plane_positions.in_list[1] == pytest.approx(
+            (0.0, 0.11), 1.0e-4
+        )
+        assert result.magnifications.in_list == pytest.approx(
+            list(np.abs(sis.magnification_via_hessian_from_grid(grid=positions))),
+            1.0e-4,
+        )
+
+        result = result.paired_to(grid_pair=al.Grid2DIrregular([(0.0, -1.0)]))
+
+        assert result.positions.in_list == [(0.0, -0.89)]
+        assert result.source_plane_positions.in_list[0] == pytest.approx(
+            (0.0, 0.11), 1.0e-4
+        )
+
+    def test__indexes_of_coordinates_from__last_appearance_of_duplicates(self):
+
+        grid = np.array([[0.0, 1.0], [1.0, 0.0], [0.0, 1.0], [2.0, 2.0]])
+
+        indexes = pos.indexes_of_coordinates_from(
+            coordinates=pos.grid_remove_duplicates(grid=grid), grid=grid
+        )
+
+        assert indexes.tolist() == [1, 2, 3]
+
+
+class TestTriangleSolver:
+    def test__positions_found_for_simple_mass_profiles__same_as_gradient_solver(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.TriangleSolver(grid=grid)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert len(positions) == 2
+        assert positions.in_list[0] == pytest.approx((0.0, -0.89), abs=1.0e-8)
+        assert positions.in_list[1] == pytest.approx((0.0, 1.11), abs=1.0e-8)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        source_plane_coordinates = [(0.0, 0.0), (0.05, 0.02), (0.3, 0.3)]
+
+        coordinates_list = solver.solve_many(
+            lensing_obj=tracer, source_plane_coordinates=source_plane_coordinates
+        )
+
+        gradient_solver = al.GradientSolver(grid=grid)
+
+        assert len(coordinates_list) == 3
+
+        for (coordinates, source_plane_coordinate) in zip(
+            coordinates_list, source_plane_coordinates
+        ):
+
+            coordinates_via_gradient = gradient_solver.solve(
+                lensing_obj=tracer, source_plane_coordinate=source_plane_coordinate
+            )
+
+            assert len(coordinates) == len(coordinates_via_gradient)
+            assert np.array(sorted(coordinates.in_list)) == pytest.approx(
+                np.array(sorted(coordinates_via_gradient.in_list)), abs=1.0e-6
+            )
+
+        assert len(coordinates_list[0]) == 4
+        assert len(coordinates_list[2]) == 2
+
+    def test__source_plane_grid_input_and_distance_from_source_centre(self):
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.TriangleSolver(grid=grid)
+
+        source_plane_grid = solver.source_plane_grid_from(lensing_obj=sis)
+
+        positions = solver.solve(
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+            source_plane_grid=source_plane_grid,
+        )
+
+        assert positions.in_list == solver.solve(
+            lensing_obj=sis, source_plane_coordinate=(0.0, 0.11)
+        ).in_list
+
+        solver = al.TriangleSolver(grid=grid, distance_from_source_centre=0.1)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert len(positions) == 2
+
+        solver = al.TriangleSolver(grid=grid, distance_from_source_centre=0.0)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert len(positions) == 0
+
+    def test__triangles_from_mask__two_triangles_per_square_of_unmasked_pixels(self):
+
+        mask_2d = np.array(
+            [[False, False, False], [False, False, False], [True, False, False]]
+        )
+
+        triangles = pos.triangles_from_mask(mask_2d=mask_2d)
+
+        assert triangles.dtype == np.int64
+        assert (
+            triangles
+            == np.array(
+                [
+                    [0, 1, 3],
+                    [1, 4, 3],
+                    [1, 2, 4],
+                    [2, 5, 4],
+                    [4, 5, 6],
+                    [5, 7, 6],
+                ]
+            )
+        ).all()
+
+    def test__source_plane_triangles__coordinates_found_via_bins_and_interpolated(
+        self
+    ):
+
+        image_plane_vertices = np.array(
+            [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]]
+        )
+
+        source_plane_triangles = pos.SourcePlaneTriangles(
+            image_plane_vertices=image_plane_vertices,
+            source_plane_vertices=2.0 * image_plane_vertices,
+            triangles=np.array([[0, 1, 2], [1, 3, 2]]),
+        )
+
+        assert source_plane_triangles.total_triangles == 2
+        assert source_plane_triangles.bin_starts[-1] >= 2
+
+        coordinates = source_plane_triangles.image_plane_coordinates_from(
+            source_plane_coordinate=(0.5, 0.4)
+        )
+
+        assert coordinates == pytest.approx(np.array([[0.25, 0.2]]), 1.0e-8)
+
+        coordinates = source_plane_triangles.image_plane_coordinates_from(
+            source_plane_coordinate=(1.5, 1.6)
+        )
+
+        assert coordinates == pytest.approx(np.array([[0.75, 0.8]]), 1.0e-8)
+
+        coordinates = source_plane_triangles.image_plane_coordinates_from(
+            source_plane_coordinate=(3.0, 3.0)
+        )
+
+        assert coordinates.shape == (0, 2)
+
 
 class TestGridRemoveDuplicates:
     def test__remove_duplicates_from_grid_within_tolerance(self):
@@ -188,6 +906,34 @@ class TestGridRemoveDuplicates:
 
         assert grid == [(1.0, 1.0), (2.0, 2.0), (4.0, 4.0), (5.0, 5.0), (3.0, 3.0)]
 
+    def test__coordinates_sharing_rows_and_near_duplicates__same_as_pairwise_comparison(
+        self
+    ):
+
+        grid = [
+            (1.0, 1.0),
+            (1.0, 2.0),
+            (1.0, 1.0 + 5.0e-9),
+            (1.0 + 5.0e-9, 2.0),
+            (1.0 + 2.0e-8, 1.0),
+            (0.0, 0.0),
+            (1.0, 2.0),
+        ]
+
+        grid = pos.grid_remove_duplicates(grid=np.asarray(grid))
+
+        assert grid == [(1.0, 1.0 + 5.0e-9), (1.0 + 2.0e-8, 1.0), (0.0, 0.0), (1.0, 2.0)]
+
+        grid = np.round(np.random.uniform(-1.0, 1.0, size=(200, 2)), 1)
+
+        grid_no_duplicates = pos.grid_remove_duplicates(grid=grid)
+
+        assert grid_no_duplicates == [
+            tuple(coordinate)
+            for (index, coordinate) in enumerate(grid)
+            if not any((grid[index + 1 :] == coordinate).all(axis=1))
+        ]
+
 
 class TestGridBuffedAroundCoordinate:
     def test__single_point_grid_buffed_correctly__upscale_factor_1(self):
@@ -524,6 +1270,30 @@ class TestGridBuffedAroundCoordinate:
             1.0e-1,
         )
 
+    def test__grids_buffed_around_coordinates__stack_of_grid_of_every_coordinate(
+        self
+    ):
+
+        coordinates = np.array([[0.0, 0.0], [1.0, 2.0], [-0.5, 0.25]])
+
+        grid_buffed_1d = pos.grids_buffed_around_coordinates_from(
+            coordinates=coordinates, pixel_scales=(0.5, 0.5), buffer=2, upscale_factor=2
+        )
+
+        assert grid_buffed_1d.shape == (3 * 100, 2)
+
+        for (coordinate_index, coordinate) in enumerate(coordinates):
+
+            assert (
+                grid_buffed_1d[coordinate_index * 100 : (coordinate_index + 1) * 100]
+                == pos.grid_buffed_around_coordinate_from(
+                    coordinate=(coordinate[0], coordinate[1]),
+                    pixel_scales=(0.5, 0.5),
+                    buffer=2,
+                    upscale_factor=2,
+                )
+            ).all()
+
 
 class TestGridNeighbors1d:
     def test__creates_numpy_array_with_correct_neighbors(self):
@@ -603,6 +1373,32 @@ class TestGridNeighbors1d:
         ).all()
 
 
+    def test__neighbors_are_integers_and_cached_by_shape(self):
+
+        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(shape_slim=9)
+
+        assert neighbors_1d.dtype == np.int64
+        assert (neighbors_1d[4] == np.array([0, 1, 2, 3, 5, 6, 7, 8])).all()
+        assert (neighbors_1d[0] == -1).all()
+
+        pos.grid_square_neighbors_1d_cached_from.cache_clear()
+
+        neighbors_1d_cached, has_neighbors_cached = pos.grid_square_neighbors_1d_cached_from(
+            shape_slim=9
+        )
+
+        assert (neighbors_1d_cached == neighbors_1d).all()
+        assert (has_neighbors_cached == has_neighbors).all()
+        assert not neighbors_1d_cached.flags.writeable
+        assert not has_neighbors_cached.flags.writeable
+
+        assert pos.grid_square_neighbors_1d_cached_from(shape_slim=9)[0] is (
+            neighbors_1d_cached
+        )
+        assert pos.grid_square_neighbors_1d_cached_from.cache_info().hits == 1
+        assert pos.grid_square_neighbors_1d_cached_from.cache_info().misses == 1
+
+
 class TestPairCoordinateToGrid:
     def test__coordinate_paired_to_closest_pixel_on_grid(self):
 
@@ -720,6 +1516,42 @@ class TestGridPeaks:
             np.asarray(peaks_coordinates) == np.array([[0.0, -1.0], [0.0, 1.0]])
         ).all()
 
+    def test__peaks_of_blocks__same_as_peaks_of_every_block(self):
+
+        distance_1d = np.random.uniform(size=9 * 25)
+
+        grid_slim = pos.grids_buffed_around_coordinates_from(
+            coordinates=np.random.uniform(size=(9, 2)),
+            pixel_scales=(1.0, 1.0),
+            buffer=2,
+        )
+
+        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(shape_slim=25)
+
+        peaks_coordinates = pos.grid_peaks_of_blocks_from(
+            distance_1d=distance_1d,
+            grid_slim=grid_slim,
+            neighbors=neighbors_1d.astype("int"),
+            has_neighbors=has_neighbors,
+            total_coordinates_per_block=25,
+        )
+
+        peaks_coordinates_of_every_block = []
+
+        for block_start in range(0, 9 * 25, 25):
+            peaks_coordinates_of_every_block += [
+                tuple(peak)
+                for peak in pos.grid_peaks_from(
+                    distance_1d=distance_1d[block_start : block_start + 25],
+                    grid_slim=grid_slim[block_start : block_start + 25],
+                    neighbors=neighbors_1d.astype("int"),
+                    has_neighbors=has_neighbors,
+                )
+            ]
+
+        assert len(peaks_coordinates) > 0
+        assert peaks_coordinates == peaks_coordinates_of_every_block
+
 
 class TestWithinDistance:
     def test__grid_keeps_only_points_within_distance(self):
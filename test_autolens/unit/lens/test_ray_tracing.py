@@ -3,10 +3,13 @@ import numpy as np
 import pytest
 import os
 from os import path
+import pickle
 import shutil
 from astropy import cosmology as cosmo
 from skimage import measure
 from autoarray.mock import mock as mock_inv
+from autolens import exc
+from autolens.lens import ray_tracing
 from autolens.mock import mock
 
 test_path = path.join(
@@ -604,6 +607,100 @@ class TestAbstractTracer:
             tracer = al.Tracer.load(file_path=test_path, filename="test_tracer")
 
             assert tracer.galaxies[0].light.intensity == 1.1
+            assert tracer.precision == "float64"
+
+
+    class TestScalingFactors:
+        def test__4_planes__scaling_factors_match_cosmology_util(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(redshift=0.1),
+                    al.Galaxy(redshift=1.0),
+                    al.Galaxy(redshift=2.0),
+                    al.Galaxy(redshift=3.0),
+                ],
+                cosmology=cosmo.Planck15,
+            )
+
+            assert tracer.angular_diameter_distances_of_planes[
+                1
+            ] == al.util.cosmology.angular_diameter_distance_to_earth_in_kpc_from(
+                redshift=1.0, cosmology=cosmo.Planck15
+            )
+            assert tracer.angular_diameter_distances_between_planes[
+                0, 2
+            ] == al.util.cosmology.angular_diameter_distance_between_redshifts_in_kpc_from(
+                redshift_0=0.1, redshift_1=2.0, cosmology=cosmo.Planck15
+            )
+
+            for plane_index_1 in range(4):
+                for plane_index_0 in range(plane_index_1):
+
+                    scaling_factor = al.util.cosmology.scaling_factor_between_redshifts_from(
+                        redshift_0=tracer.plane_redshifts[plane_index_0],
+                        redshift_1=tracer.plane_redshifts[plane_index_1],
+                        redshift_final=3.0,
+                        cosmology=cosmo.Planck15,
+                    )
+
+                    assert (
+                        tracer.scaling_factors_between_planes[
+                            plane_index_0, plane_index_1
+                        ]
+                        == scaling_factor
+                    )
+
+            assert tracer.scaling_factors_between_planes[0, 1] == pytest.approx(
+                0.9348, 1.0e-4
+            )
+            assert tracer.scaling_factors_between_planes[1, 0] == 0.0
+            assert tracer.scaling_factors_between_planes[2, 3] == 1.0
+
+        def test__scaling_factors_are_read_only(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+            )
+
+            with pytest.raises(ValueError):
+                tracer.scaling_factors_between_planes[0, 1] = 2.0
+
+            with pytest.raises(ValueError):
+                tracer.angular_diameter_distances_of_planes[0] = 2.0
+
+        def test__no_cosmology__scaling_factors_are_none(self):
+
+            tracer = al.Tracer(
+                planes=[al.Plane(redshift=0.5), al.Plane(redshift=1.0)],
+                cosmology=None,
+            )
+
+            assert tracer.angular_diameter_distances_of_planes is None
+            assert tracer.angular_diameter_distances_between_planes is None
+            assert tracer.scaling_factors_between_planes is None
+
+        def test__single_plane__scaling_factors_are_not_computed_from_cosmology(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5, light=al.lp.EllipticalSersic(intensity=0.1)
+                    )
+                ],
+                cosmology=cosmo.FLRW,
+            )
+
+            assert tracer._distances_and_factors_of_planes is None
+
+            image = tracer.image_from_grid(grid=sub_grid_7x7)
+
+            assert tracer._distances_and_factors_of_planes is None
+            assert (
+                image == tracer.galaxies[0].image_from_grid(grid=sub_grid_7x7)
+            ).all()
 
 
 class TestAbstractTracerLensing:
@@ -977,6 +1074,520 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__recursive_tracing_matches_tracing_via_summation(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            traced_grids_of_planes_via_summation = tracer.traced_grids_of_planes_via_summation_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert (
+                traced_grids_of_planes[1] == traced_grids_of_planes_via_summation[1]
+            ).all()
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.1 + 0.2 * index,
+                    mass=al.mp.EllipticalIsothermal(
+                        centre=(0.1 * index, -0.05 * index),
+                        elliptical_comps=(0.05, 0.02 * index),
+                        einstein_radius=0.1 + 0.05 * index,
+                    ),
+                )
+                for index in range(11)
+            ]
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies + [al.Galaxy(redshift=3.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            traced_grids_of_planes_via_summation = tracer.traced_grids_of_planes_via_summation_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert len(traced_grids_of_planes) == 12
+
+            for traced_grid, traced_grid_via_summation in zip(
+                traced_grids_of_planes, traced_grids_of_planes_via_summation
+            ):
+                assert type(traced_grid) == type(traced_grid_via_summation)
+                assert traced_grid == pytest.approx(traced_grid_via_summation, 1.0e-12)
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=5
+            )
+
+            assert len(traced_grids_of_planes) == 6
+            assert traced_grids_of_planes[5] == pytest.approx(
+                traced_grids_of_planes_via_summation[5], 1.0e-12
+            )
+
+        def test__recursive_tracing_matches_tracing_via_summation__sliced_tracer(
+            self, grid_irregular_7x7
+        ):
+
+            tracer = al.Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
+                lens_galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    )
+                ],
+                line_of_sight_galaxies=[
+                    al.Galaxy(
+                        redshift=redshift,
+                        mass=al.mp.SphericalIsothermal(
+                            centre=(0.1, 0.1), einstein_radius=0.05
+                        ),
+                    )
+                    for redshift in [0.1, 0.2, 0.3, 0.4, 0.6, 0.7, 0.8, 0.9]
+                ],
+                source_galaxies=[al.Galaxy(redshift=1.0)],
+                planes_between_lenses=[4, 4],
+                cosmology=cosmo.Planck15,
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=grid_irregular_7x7
+            )
+            traced_grids_of_planes_via_summation = tracer.traced_grids_of_planes_via_summation_from_grid(
+                grid=grid_irregular_7x7
+            )
+
+            for traced_grid, traced_grid_via_summation in zip(
+                traced_grids_of_planes, traced_grids_of_planes_via_summation
+            ):
+                assert isinstance(traced_grid, al.Grid2DIrregular)
+                assert np.asarray(traced_grid) == pytest.approx(
+                    np.asarray(traced_grid_via_summation), 1.0e-12
+                )
+
+        def test__deflections_only_computed_for_planes_with_mass_before_final_plane(
+            self, sub_grid_7x7, monkeypatch
+        ):
+
+            deflections_from_grid = al.Plane.deflections_from_grid
+
+            plane_redshifts_with_deflections = []
+
+            def deflections_from_grid_counted(plane, grid):
+                plane_redshifts_with_deflections.append(plane.redshift)
+                return deflections_from_grid(plane, grid=grid)
+
+            monkeypatch.setattr(
+                al.Plane, "deflections_from_grid", deflections_from_grid_counted
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(redshift=0.1, light=al.lp.SphericalSersic()),
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=0.75, light=al.lp.SphericalSersic()),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                ]
+            )
+
+            assert tracer.plane_indexes_with_mass_profile == [1, 3]
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert plane_redshifts_with_deflections == [0.5]
+
+            traced_grids_of_planes_via_summation = tracer.traced_grids_of_planes_via_summation_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert (traced_grids_of_planes[0] == sub_grid_7x7).all()
+            assert (traced_grids_of_planes[1] == sub_grid_7x7).all()
+
+            for traced_grid, traced_grid_via_summation in zip(
+                traced_grids_of_planes, traced_grids_of_planes_via_summation
+            ):
+                assert traced_grid == pytest.approx(traced_grid_via_summation, 1.0e-12)
+
+            plane_redshifts_with_deflections.clear()
+
+            tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=1
+            )
+
+            assert plane_redshifts_with_deflections == []
+
+    class TestTracedGridsCache:
+        def test__grid_is_traced_once_per_tracer(self, sub_grid_7x7, monkeypatch):
+
+            deflections_from_grid = al.Plane.deflections_from_grid
+
+            plane_redshifts_with_deflections = []
+
+            def deflections_from_grid_counted(plane, grid):
+                plane_redshifts_with_deflections.append(plane.redshift)
+                return deflections_from_grid(plane, grid=grid)
+
+            monkeypatch.setattr(
+                al.Plane, "deflections_from_grid", deflections_from_grid_counted
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=2.0, light=al.lp.SphericalSersic()),
+                ]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0]
+
+            traced_grids_of_planes_cached = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0]
+
+            for traced_grid, traced_grid_cached in zip(
+                traced_grids_of_planes, traced_grids_of_planes_cached
+            ):
+                assert (traced_grid == traced_grid_cached).all()
+
+            traced_grids_of_planes_cached = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=1
+            )
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0]
+            assert len(traced_grids_of_planes_cached) == 2
+            assert (traced_grids_of_planes_cached[1] == traced_grids_of_planes[1]).all()
+
+            tracer.image_from_grid(grid=sub_grid_7x7)
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0]
+
+            tracer = al.Tracer.from_galaxies(galaxies=tracer.galaxies)
+
+            tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0, 0.5, 1.0]
+
+        def test__higher_plane_index_limit_is_traced_after_lower_limit(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=2.0),
+                ]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=1
+            )
+
+            assert len(traced_grids_of_planes) == 2
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert len(traced_grids_of_planes) == 3
+
+            tracer.traced_grids_cache_clear()
+
+            traced_grids_of_planes_uncached = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert (traced_grids_of_planes[2] == traced_grids_of_planes_uncached[2]).all()
+
+        def test__different_grids_and_changed_grids_are_traced_separately(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            grid_0 = al.Grid2DIrregular(grid=[(1.0, 1.0)])
+            grid_1 = al.Grid2DIrregular(grid=[(2.0, 2.0)])
+
+            traced_grid_0 = tracer.traced_grids_of_planes_from_grid(grid=grid_0)[1]
+            traced_grid_1 = tracer.traced_grids_of_planes_from_grid(grid=grid_1)[1]
+
+            assert traced_grid_0.in_list[0] == pytest.approx(
+                (0.29289, 0.29289), 1.0e-4
+            )
+            assert traced_grid_1.in_list[0] == pytest.approx(
+                (1.29289, 1.29289), 1.0e-4
+            )
+
+            grid_0[0, 0] = 2.0
+            grid_0[0, 1] = 2.0
+
+            tracer.traced_grids_cache_clear()
+
+            traced_grid_0 = tracer.traced_grids_of_planes_from_grid(grid=grid_0)[1]
+
+            assert traced_grid_0.in_list[0] == pytest.approx(
+                (1.29289, 1.29289), 1.0e-4
+            )
+
+        def test__cache_of_deleted_grids_is_removed(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            for i in range(10):
+                tracer.traced_grids_of_planes_from_grid(
+                    grid=al.Grid2DIrregular(grid=[(float(i), 1.0)])
+                )
+
+            assert len(tracer._traced_grids_cache) == 1
+
+            grid = al.Grid2DIrregular(grid=[(1.0, 1.0)])
+
+            tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+            tracer = pickle.loads(pickle.dumps(tracer))
+
+            assert tracer._traced_grids_cache == {}
+
+            traced_grid = tracer.traced_grids_of_planes_from_grid(grid=grid)[1]
+
+            assert traced_grid.in_list[0] == pytest.approx((0.29289, 0.29289), 1.0e-4)
+
+        def test__border_relocation_of_mapper_does_not_change_cached_traced_grids(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    light=al.lp.SphericalSersic(intensity=1.0),
+                    pixelization=al.pix.VoronoiMagnification(shape=(3, 3)),
+                    regularization=al.reg.Constant(),
+                ),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            tracer.image_from_grid(grid=sub_grid_7x7)
+
+            tracer.mappers_of_planes_from_grid(
+                grid=sub_grid_7x7,
+                settings_pixelization=al.SettingsPixelization(use_border=True),
+            )
+
+            tracer_fresh = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            assert (
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[1]
+                == tracer_fresh.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[1]
+            ).all()
+            assert tracer.image_from_grid(grid=sub_grid_7x7) == pytest.approx(
+                tracer_fresh.image_from_grid(grid=sub_grid_7x7), 1.0e-8
+            )
+
+    class TestTracedGridsFromGridAndBlurringGrid:
+        def test__same_as_tracing_grids_separately_with_one_deflection_call_per_plane(
+            self, sub_grid_7x7, blurring_grid_7x7, monkeypatch
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.EllipticalIsothermal(
+                        elliptical_comps=(0.1, 0.05), einstein_radius=1.0
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=1.0, mass=al.mp.SphericalIsothermal(einstein_radius=0.5)
+                ),
+                al.Galaxy(redshift=2.0, light=al.lp.SphericalSersic()),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            traced_blurring_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=blurring_grid_7x7
+            )
+
+            deflections_from_grid = al.Plane.deflections_from_grid
+
+            plane_redshifts_with_deflections = []
+
+            def deflections_from_grid_counted(plane, grid):
+                plane_redshifts_with_deflections.append(plane.redshift)
+                return deflections_from_grid(plane, grid=grid)
+
+            monkeypatch.setattr(
+                al.Plane, "deflections_from_grid", deflections_from_grid_counted
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            (
+                traced_grids_of_planes_fused,
+                traced_blurring_grids_of_planes_fused,
+            ) = tracer.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0]
+
+            for plane_index in range(3):
+
+                assert isinstance(
+                    traced_grids_of_planes_fused[plane_index], al.Grid2D
+                )
+                assert traced_grids_of_planes_fused[plane_index].sub_size == 2
+                assert traced_grids_of_planes_fused[plane_index] == pytest.approx(
+                    traced_grids_of_planes[plane_index], 1.0e-12
+                )
+                assert traced_blurring_grids_of_planes_fused[
+                    plane_index
+                ].sub_size == 1
+                assert traced_blurring_grids_of_planes_fused[
+                    plane_index
+                ] == pytest.approx(traced_blurring_grids_of_planes[plane_index], 1.0e-12)
+
+            tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            tracer.traced_grids_of_planes_from_grid(grid=blurring_grid_7x7)
+
+            assert plane_redshifts_with_deflections == [0.5, 1.0]
+
+        def test__blurred_image_is_same_as_tracing_grids_separately(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(intensity=1.0),
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0, light=al.lp.EllipticalSersic(intensity=2.0)
+                    ),
+                ]
+            )
+
+            image = tracer.image_from_grid(grid=sub_grid_7x7)
+            blurring_image = tracer.image_from_grid(grid=blurring_grid_7x7)
+
+            blurred_image = convolver_7x7.convolved_image_from_image_and_blurring_image(
+                image=image, blurring_image=blurring_image
+            )
+
+            tracer.traced_grids_cache_clear()
+
+            assert tracer.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            ) == pytest.approx(blurred_image, 1.0e-12)
+
+        def test__grid_iterate_is_traced_separately(self, blurring_grid_7x7):
+
+            mask = al.Mask2D.manual(
+                mask=[
+                    [True, True, True, True, True],
+                    [True, False, False, False, True],
+                    [True, False, False, False, True],
+                    [True, False, False, False, True],
+                    [True, True, True, True, True],
+                ],
+                pixel_scales=(1.0, 1.0),
+            )
+
+            grid = al.Grid2DIterate.from_mask(mask=mask)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            (
+                traced_grids_of_planes,
+                traced_blurring_grids_of_planes,
+            ) = tracer.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid_7x7
+            )
+
+            assert (
+                traced_grids_of_planes[1]
+                == tracer.traced_grids_of_planes_from_grid(grid=grid)[1]
+            ).all()
+            assert (
+                traced_blurring_grids_of_planes[1]
+                == tracer.traced_grids_of_planes_from_grid(grid=blurring_grid_7x7)[1]
+            ).all()
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -1409,6 +2020,144 @@ class TestAbstractTracerLensing:
             assert (image_dict[g2].native == g2_image.native).all()
             assert (image_dict[g3].native == g3_image.native).all()
 
+    class TestChunks:
+        def test__traced_grids_and_image_in_chunks_same_as_without_chunks(
+            self, sub_grid_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(intensity=1.0),
+                        mass=al.mp.EllipticalIsothermal(
+                            elliptical_comps=(0.1, 0.0), einstein_radius=1.0
+                        ),
+                    ),
+                    al.Galaxy(
+                        redshift=0.75,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.2),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0, light=al.lp.EllipticalSersic(intensity=2.0)
+                    ),
+                ]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_via_chunks = tracer.traced_grids_of_planes_from_grid_in_chunks(
+                grid=sub_grid_7x7, chunk_size=5
+            )
+
+            for (traced_grid, traced_grid_via_chunks) in zip(
+                traced_grids_of_planes, traced_grids_of_planes_via_chunks
+            ):
+                assert isinstance(traced_grid_via_chunks, al.Grid2D)
+                assert (traced_grid_via_chunks == traced_grid).all()
+
+            traced_grids_of_planes_via_chunks = tracer.traced_grids_of_planes_from_grid_in_chunks(
+                grid=sub_grid_7x7, plane_index_limit=1, chunk_size=5
+            )
+
+            assert len(traced_grids_of_planes_via_chunks) == 2
+
+            image = tracer.image_from_grid(grid=sub_grid_7x7)
+
+            image_via_chunks = tracer.image_from_grid_in_chunks(
+                grid=sub_grid_7x7, chunk_size=5
+            )
+
+            assert isinstance(image_via_chunks, al.Array2D)
+            assert image_via_chunks.sub_size == 2
+            assert (image_via_chunks == image).all()
+            assert (image_via_chunks.slim_binned == image.slim_binned).all()
+
+        def test__chunks_are_not_cached(self, sub_grid_7x7):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic()),
+                ]
+            )
+
+            tracer.image_from_grid_in_chunks(grid=sub_grid_7x7, chunk_size=5)
+
+            assert tracer._traced_grids_cache == {}
+
+    class TestPrecision:
+        def test__float32__traced_grids_and_images_are_float32_and_close_to_float64(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0),
+                    mass=al.mp.EllipticalIsothermal(
+                        elliptical_comps=(0.1, 0.0), einstein_radius=1.0
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=0.75, mass=al.mp.SphericalIsothermal(einstein_radius=0.2)
+                ),
+                al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=2.0)),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+            tracer_float32 = al.Tracer.from_galaxies(
+                galaxies=galaxies, precision="float32"
+            )
+
+            assert tracer.precision == "float64"
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+            traced_grids_of_planes_float32 = tracer_float32.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            for (traced_grid, traced_grid_float32) in zip(
+                traced_grids_of_planes, traced_grids_of_planes_float32
+            ):
+                assert isinstance(traced_grid_float32, al.Grid2D)
+                assert traced_grid.dtype == np.float64
+                assert traced_grid_float32.dtype == np.float32
+                assert traced_grid_float32 == pytest.approx(traced_grid, 1.0e-5)
+
+            image = tracer.image_from_grid(grid=sub_grid_7x7)
+            image_float32 = tracer_float32.image_from_grid(grid=sub_grid_7x7)
+
+            assert image_float32.dtype == np.float32
+            assert image_float32 == pytest.approx(image, 1.0e-5)
+
+            image_via_chunks = tracer_float32.image_from_grid_in_chunks(
+                grid=sub_grid_7x7, chunk_size=5
+            )
+
+            assert image_via_chunks.dtype == np.float32
+            assert (image_via_chunks == image_float32).all()
+
+            deflections = tracer_float32.deflections_between_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert deflections.dtype == np.float32
+
+        def test__invalid_precision__raises_exception(self):
+
+            with pytest.raises(exc.SettingsException):
+                al.Tracer.from_galaxies(
+                    galaxies=[al.Galaxy(redshift=0.5)], precision="float16"
+                )
+
     class TestConvergence:
         def test__galaxy_mass_sis__no_source_plane_convergence(self, sub_grid_7x7):
 
@@ -1773,6 +2522,63 @@ class TestAbstractTracerLensing:
                 tracer_deflections.native_binned[:, :, 1] == np.zeros(shape=(7, 7))
             ).all()
 
+    class TestPositionsOfPointSources:
+        def test__point_sources_in_each_plane_solved_with_planes_in_front_of_them(
+            self
+        ):
+
+            solver = al.GradientSolver(
+                grid=al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+            )
+
+            lens = al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    lens,
+                    al.Galaxy(
+                        redshift=1.0,
+                        point_0=al.ps.PointSource(centre=(0.0, 0.11)),
+                        point_1=al.ps.PointSource(centre=(0.3, 0.3)),
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.1),
+                    ),
+                    al.Galaxy(
+                        redshift=2.0, point_2=al.ps.PointSource(centre=(0.1, 0.0))
+                    ),
+                ]
+            )
+
+            positions_dict = tracer.positions_of_point_sources_from(
+                positions_solver=solver
+            )
+
+            assert list(positions_dict.keys()) == ["point_0", "point_1", "point_2"]
+
+            tracer_plane_1 = al.Tracer.from_galaxies(
+                galaxies=[lens, al.Galaxy(redshift=1.0)]
+            )
+
+            assert positions_dict["point_0"].in_list[0] == pytest.approx(
+                (0.0, -0.89), abs=1.0e-8
+            )
+            assert positions_dict["point_0"].in_list[1] == pytest.approx(
+                (0.0, 1.11), abs=1.0e-8
+            )
+            assert (
+                positions_dict["point_1"].in_list
+                == solver.solve(
+                    lensing_obj=tracer_plane_1, source_plane_coordinate=(0.3, 0.3)
+                ).in_list
+            )
+            assert (
+                positions_dict["point_2"].in_list
+                == solver.solve(
+                    lensing_obj=tracer, source_plane_coordinate=(0.1, 0.0)
+                ).in_list
+            )
+
     class TestGridAtRedshift:
         def test__lens_z05_source_z01_redshifts__match_planes_redshifts__gives_same_grids(
             self, sub_grid_7x7
@@ -2995,6 +3801,16 @@ class TestTracer:
         )
 
 
+class TestThreadPoolFrom:
+    def test__pool_is_created_once_for_every_name_and_number_of_threads(self):
+
+        pool = ray_tracing.thread_pool_from(threads=2, name="test")
+
+        assert ray_tracing.thread_pool_from(threads=2, name="test") is pool
+        assert ray_tracing.thread_pool_from(threads=3, name="test") is not pool
+        assert ray_tracing.thread_pool_from(threads=2, name="other") is not pool
+
+
 class TestTracerFixedSlices:
     def test__6_galaxies__tracer_planes_are_correct(self, sub_grid_7x7):
         lens_g0 = al.Galaxy(redshift=0.5)
@@ -3100,6 +3916,27 @@ class TestTracerFixedSlices:
         assert traced_grids[3][0] == pytest.approx(np.array([-2.5355, -2.5355]), 1e-4)
         assert traced_grids[3][1] == pytest.approx(np.array([2.0, 0.0]), 1e-4)
 
+    def test__scaling_factors_between_planes_use_sliced_plane_redshifts(self):
+
+        tracer = al.Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
+            lens_galaxies=[al.Galaxy(redshift=0.5)],
+            line_of_sight_galaxies=[al.Galaxy(redshift=0.1)],
+            source_galaxies=[al.Galaxy(redshift=2.0)],
+            planes_between_lenses=[1, 1],
+            cosmology=cosmo.Planck15,
+        )
+
+        assert tracer.scaling_factors_between_planes.shape == (4, 4)
+        assert tracer.scaling_factors_between_planes[0, 1] == pytest.approx(
+            0.57874474423, 1.0e-4
+        )
+        assert tracer.scaling_factors_between_planes[0, 2] == pytest.approx(
+            0.91814281, 1.0e-4
+        )
+        assert tracer.scaling_factors_between_planes[1, 2] == pytest.approx(
+            0.8056827034, 1.0e-4
+        )
+
 
 class TestExtractAttribute:
     def test__extract_attribute(self):
@@ -1,4 +1,6 @@
 from os import path
+import json
+import types
 
 import autofit as af
 import autolens as al
@@ -44,6 +46,70 @@ class TestLogLikelihoodFunction:
         with pytest.raises(exc.RayTracingException):
             analysis.log_likelihood_function(instance=instance)
 
+    def test__list_of_instances__returns_figure_of_merit_of_every_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic,
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_masked_imaging=al.SettingsMaskedImaging(sub_size=2)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.2, 0.5, 0.8]
+        ]
+
+        figures_of_merit = analysis.log_likelihood_function(instance=instances)
+
+        assert figures_of_merit.shape == (3,)
+
+        for (instance_index, instance) in enumerate(instances):
+            assert figures_of_merit[instance_index] == pytest.approx(
+                analysis.log_likelihood_function(instance=instance), 1.0e-8
+            )
+
+    def test__list_of_instances__instance_that_raises_exception__raises_exception(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        imaging_7x7.positions = al.Grid2DIrregular([(1.0, 100.0), (200.0, 2.0)])
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(positions_threshold=0.01)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        with pytest.raises(exc.RayTracingException):
+            analysis.log_likelihood_function(instance=[instance])
+
 
 class TestFit:
     def test__fit_using_imaging(self, imaging_7x7, mask_7x7, samples_with_result):
@@ -92,7 +158,41 @@ class TestFit:
 
         fit = al.FitImaging(masked_imaging=masked_imaging, tracer=tracer)
 
-        assert fit.log_likelihood == fit_figure_of_merit
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-10)
+
+    def test__figure_of_merit__precision_float32__tracer_is_float32_and_matches_float64(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.Galaxy(
+            redshift=0.5, light=al.lp.EllipticalSersic(intensity=0.1)
+        )
+
+        fit_figure_of_merits = []
+
+        for precision in ["float64", "float32"]:
+
+            phase_imaging_7x7 = al.PhaseImaging(
+                galaxies=dict(lens=lens_galaxy),
+                settings=al.SettingsPhaseImaging(
+                    settings_masked_imaging=al.SettingsMaskedImaging(
+                        sub_size=1, precision=precision
+                    )
+                ),
+                search=mock.MockSearch(),
+            )
+
+            analysis = phase_imaging_7x7.make_analysis(
+                dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+            )
+            instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+            assert analysis.tracer_for_instance(instance=instance).precision == precision
+
+            fit_figure_of_merits.append(
+                analysis.log_likelihood_function(instance=instance)
+            )
+
+        assert fit_figure_of_merits[1] == pytest.approx(fit_figure_of_merits[0], 1.0e-6)
 
     def test__figure_of_merit__includes_hyper_image_and_noise__matches_fit(
         self, imaging_7x7, mask_7x7
@@ -135,7 +235,7 @@ class TestFit:
             hyper_background_noise=hyper_background_noise,
         )
 
-        assert fit.log_likelihood == fit_figure_of_merit
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-10)
 
     def test__uses_hyper_fit_correctly(self, masked_imaging_7x7):
 
@@ -195,7 +295,7 @@ class TestFit:
         fit = FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
 
         assert (fit.tracer.galaxies[0].hyper_galaxy_image == lens_hyper_image).all()
-        assert fit_likelihood == fit.log_likelihood
+        assert fit_likelihood == pytest.approx(fit.log_likelihood, 1.0e-10)
 
     def test__figure_of_merit__with_stochastic_likelihood_resamples_matches_galaxy_profiles(
         self, masked_imaging_7x7
@@ -268,6 +368,66 @@ class TestFit:
         #     np.mean([-22.947017744853934, -29.10665765185219]), 1.0e-8
         # )
 
+    def test__stochastic_likelihood_resamples__threaded__same_as_fit_of_every_seed(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.lens = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.2)
+        )
+        galaxies.source = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.VoronoiMagnification(shape=(3, 3)),
+            regularization=al.reg.Constant(),
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        figures_of_merit = []
+
+        for stochastic_threads in [1, 2]:
+
+            analysis = al.PhaseImaging.Analysis(
+                masked_imaging=masked_imaging_7x7,
+                settings=al.SettingsPhaseImaging(
+                    settings_lens=al.SettingsLens(
+                        stochastic_likelihood_resamples=3,
+                        stochastic_threads=stochastic_threads,
+                    )
+                ),
+                results=mock.MockResults(),
+                cosmology=cosmo.Planck15,
+            )
+
+            tracer = analysis.tracer_for_instance(instance=instance)
+
+            figures_of_merit.append(
+                analysis.stochastic_likelihood_resamples_for_tracer(
+                    tracer=tracer, hyper_image_sky=None, hyper_background_noise=None
+                )
+            )
+
+        log_evidences = []
+
+        for kmeans_seed in range(3):
+
+            settings_pixelization = al.SettingsPixelization(
+                use_border=True, kmeans_seed=kmeans_seed
+            )
+
+            log_evidences.append(
+                al.FitImaging(
+                    masked_imaging=masked_imaging_7x7,
+                    tracer=analysis.tracer_for_instance(instance=instance),
+                    settings_pixelization=settings_pixelization,
+                ).log_evidence
+            )
+
+        assert figures_of_merit[0] == pytest.approx(log_evidences, 1.0e-8)
+        assert figures_of_merit[1] == pytest.approx(log_evidences, 1.0e-8)
+
     def test__stochastic_histogram_for_instance(self, masked_imaging_7x7):
 
         galaxies = af.ModelInstance()
@@ -317,3 +477,142 @@ class TestFit:
 
         assert len(log_evidences) == 2
         assert log_evidences[0] != log_evidences[1]
+
+    def test__stochastic_log_evidences__threaded_and_in_chunks__same_as_serial(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.lens = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.2)
+        )
+        galaxies.source = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.VoronoiBrightnessImage(pixels=5),
+            regularization=al.reg.Constant(),
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        hyper_galaxy_image_path_dict = {
+            ("galaxies", "lens"): al.Array2D.ones(
+                shape_native=(3, 3), pixel_scales=0.1
+            ),
+            ("galaxies", "source"): al.Array2D.full(
+                fill_value=2.0, shape_native=(3, 3), pixel_scales=0.1
+            ),
+        }
+
+        results = mock.MockResults(
+            use_as_hyper_dataset=True,
+            hyper_galaxy_image_path_dict=hyper_galaxy_image_path_dict,
+            hyper_model_image=al.Array2D.full(
+                fill_value=0.5, shape_native=(3, 3), pixel_scales=0.1
+            ),
+        )
+
+        log_evidences = []
+
+        for stochastic_threads in [1, 2]:
+
+            analysis = al.PhaseImaging.Analysis(
+                masked_imaging=masked_imaging_7x7,
+                settings=al.SettingsPhaseImaging(
+                    settings_lens=al.SettingsLens(
+                        stochastic_samples=3, stochastic_threads=stochastic_threads
+                    )
+                ),
+                results=results,
+                cosmology=cosmo.Planck15,
+            )
+
+            log_evidences.append(
+                analysis.stochastic_log_evidences_for_instance(instance=instance)
+            )
+
+        log_evidences_of_chunks = analysis.stochastic_log_evidences_for_instance(
+            instance=instance, sample_indexes=[0, 1]
+        ) + analysis.stochastic_log_evidences_for_instance(
+            instance=instance, sample_indexes=[2]
+        )
+
+        assert len(log_evidences[0]) == 3
+        assert log_evidences[1] == pytest.approx(log_evidences[0], 1.0e-8)
+        assert log_evidences_of_chunks == pytest.approx(log_evidences[0], 1.0e-8)
+
+    def test__save_stochastic_outputs__resumes_from_progress_file(
+        self, masked_imaging_7x7, tmp_path
+    ):
+
+        analysis = al.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(stochastic_samples=5)
+            ),
+            results=mock.MockResults(),
+            cosmology=cosmo.Planck15,
+        )
+
+        sample_indexes_list = []
+
+        def stochastic_log_evidences_for_instance(instance, sample_indexes=None):
+            sample_indexes_list.append(list(sample_indexes))
+            return [-float(sample_index) for sample_index in sample_indexes]
+
+        analysis.stochastic_log_evidences_for_instance = (
+            stochastic_log_evidences_for_instance
+        )
+
+        samples = mock.MockSamples(max_log_likelihood_instance=af.ModelInstance())
+
+        paths_list = []
+
+        for name in ["uninterrupted", "resumed"]:
+
+            paths = types.SimpleNamespace(
+                output_path=str(tmp_path / name),
+                pickle_path=str(tmp_path / name / "pickles"),
+                image_path=str(tmp_path / name / "image"),
+            )
+
+            (tmp_path / name / "pickles").mkdir(parents=True)
+
+            paths_list.append(paths)
+
+        analysis.save_stochastic_outputs(
+            paths=paths_list[0], samples=samples, samples_per_chunk=2
+        )
+
+        assert sample_indexes_list == [[0, 1], [2, 3], [4]]
+
+        progress_file = path.join(
+            paths_list[1].output_path, "stochastic_log_evidences_progress.json"
+        )
+
+        with open(progress_file, "w") as f:
+            json.dump({"samples_completed": 2, "log_evidences": [0.0, -1.0]}, f)
+
+        sample_indexes_list.clear()
+
+        analysis.save_stochastic_outputs(
+            paths=paths_list[1], samples=samples, samples_per_chunk=2
+        )
+
+        assert sample_indexes_list == [[2, 3], [4]]
+
+        log_evidences_list = []
+
+        for paths in paths_list:
+
+            assert not path.exists(
+                path.join(paths.output_path, "stochastic_log_evidences_progress.json")
+            )
+
+            with open(
+                path.join(paths.output_path, "stochastic_log_evidences.json"), "r"
+            ) as f:
+                log_evidences_list.append(json.load(f))
+
+        assert log_evidences_list[0] == [0.0, -1.0, -2.0, -3.0, -4.0]
+        assert log_evidences_list[1] == log_evidences_list[0]
@@ -204,6 +204,199 @@ class TestMakeAnalysis:
             == imaging_7x7.noise_map.native * np.invert(mask_7x7)
         ).all()
 
+    def test__preloads__fixed_galaxies_products_are_preloaded(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1),
+            mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=lens_galaxy,
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.preloads.blurred_image is None
+        assert analysis.preloads.traced_grids_of_planes_of_grids is not None
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.3] * phase_imaging_7x7.model.prior_count
+        )
+
+        fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+        fit = al.FitImaging(
+            masked_imaging=analysis.masked_imaging,
+            tracer=analysis.tracer_for_instance(instance=instance),
+        )
+
+        assert fit.figure_of_merit == pytest.approx(fit_figure_of_merit, 1.0e-10)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=lens_galaxy,
+                source=al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic()),
+            ),
+            hyper_background_noise=al.hyper_data.HyperBackgroundNoise,
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.preloads.blurred_image is not None
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=lens_galaxy,
+                source=al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic()),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.preloads_instance is None
+        assert analysis.preloads.blurred_image is None
+
+    def test__preloads__model_assertion_fails_for_median_instance__nothing_preloaded(
+        self, imaging_7x7, mask_7x7
+    ):
+        source = al.GalaxyModel(
+            redshift=1.0, bulge=al.lp.EllipticalSersic, disk=al.lp.EllipticalSersic
+        )
+        source.add_assertion(
+            source.bulge.effective_radius < source.disk.effective_radius
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                source=source,
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.preloads_instance is None
+        assert analysis.preloads.blurred_image is None
+        assert analysis.preloads.traced_grids_of_planes_of_grids is None
+
+    def test__preloads__free_mass_model__instance_not_fitted(
+        self, imaging_7x7, mask_7x7, monkeypatch
+    ):
+        def preloads_from_instance(self, instance, free_classes):
+            raise AssertionError
+
+        monkeypatch.setattr(
+            al.PhaseImaging.Analysis, "preloads_from_instance", preloads_from_instance
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=0.1),
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic()),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.preloads.traced_grids_of_planes_of_grids is None
+
+    def test__preloads__computed_from_the_masked_imaging_when_first_used(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis._preloads is None
+
+        analysis.masked_imaging.grid[4] = np.array([1.0, 1.0])
+
+        traced_grid = analysis.preloads.traced_grids_of_planes_of_grids[0][1][1]
+
+        tracer = analysis.tracer_for_instance(instance=analysis.preloads_instance)
+
+        assert traced_grid[4] == pytest.approx(
+            tracer.traced_grids_of_planes_from_grid(grid=analysis.masked_imaging.grid)[
+                1
+            ][4],
+            1.0e-8,
+        )
+
+    def test__free_classes__classes_of_components_with_free_parameters(self):
+
+        lens = al.GalaxyModel(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1),
+            mass=al.mp.EllipticalIsothermal,
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=lens,
+                source=al.GalaxyModel(
+                    redshift=af.UniformPrior(lower_limit=1.0, upper_limit=2.0),
+                    pixelization=al.pix.VoronoiMagnification,
+                    regularization=al.reg.Constant(coefficient=1.0),
+                ),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        assert set(phase_imaging_7x7.free_classes) == {
+            al.mp.EllipticalIsothermal,
+            al.Galaxy,
+            al.pix.VoronoiMagnification,
+        }
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.free_classes == (al.lp.EllipticalSersic,)
+
     def test___phase_info_is_made(self, phase_imaging_7x7, imaging_7x7, mask_7x7):
         phase_imaging_7x7.make_analysis(
             dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
@@ -183,3 +183,55 @@ class TestFit:
         assert fit_positions.residual_map.in_list == [1.0, 1.0]
         assert fit_positions.chi_squared == 2.0
         assert fit_positions.log_likelihood == fit_figure_of_merit
+
+    def test__warm_start_solver__seeded_with_positions_and_matches_full_search(
+        self
+    ):
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0, point_0=al.ps.PointSource(centre=(0.0, 0.11))
+        )
+
+        positions = al.Grid2DIrregular([(0.0, 1.1), (0.0, -0.9)])
+        noise_map = al.ValuesIrregular([0.1, 0.1])
+
+        grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+        solver = al.WarmStartSolver(grid=grid)
+
+        phase_positions_x2 = al.PhasePointSource(
+            galaxies=dict(lens=lens_galaxy, source=source_galaxy),
+            settings=al.SettingsPhasePositions(),
+            search=mock.MockSearch(),
+            positions_solver=solver,
+        )
+
+        analysis = phase_positions_x2.make_analysis(
+            positions=positions,
+            positions_noise_map=noise_map,
+            results=mock.MockResults(),
+        )
+
+        assert analysis.solver.coordinates_dict[0].tolist() == [
+            [0.0, 1.1],
+            [0.0, -0.9],
+        ]
+
+        instance = phase_positions_x2.model.instance_from_unit_vector([])
+        fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+        assert analysis.solver.total_warm_solves == 1
+
+        fit_positions = al.FitPositionsImage(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=analysis.tracer_for_instance(instance=instance),
+            positions_solver=al.GradientSolver(grid=grid),
+        )
+
+        assert fit_positions.log_likelihood == pytest.approx(
+            fit_figure_of_merit, 1.0e-8
+        )
@@ -109,3 +109,30 @@ def test__tag__mixture_of_values():
         "pix[use_border]__"
         "inv[lop]"
     )
+
+
+def test__tag__precision_float32__included_in_imaging_tag():
+
+    settings = al.SettingsPhaseImaging()
+
+    assert isinstance(settings.settings_masked_imaging, al.SettingsMaskedImaging)
+    assert settings.settings_masked_imaging.precision == "float64"
+
+    settings = al.SettingsPhaseImaging(
+        settings_masked_imaging=al.SettingsMaskedImaging(
+            sub_size=2, precision="float32"
+        )
+    )
+
+    assert (
+        settings.phase_tag_no_inversion == "settings__"
+        "imaging[grid_sub_2__prec_float32]__"
+        "lens[pos_off]"
+    )
+    assert (
+        settings.phase_tag_with_inversion == "settings__"
+        "imaging[grid_sub_2_inv_sub_2__prec_float32]__"
+        "lens[pos_off]__"
+        "pix[use_border]__"
+        "inv[mat]"
+    )